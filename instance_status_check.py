@@ -1,7 +1,7 @@
 import os
-import boto3
 import requests
 from datetime import datetime
+from src.ec2.manager import iter_platform_instances
 
 bot_token = os.getenv('TELEGRAM_TOKEN')
 chat_id = os.getenv('TELEGRAM_CHAT_ID')
@@ -12,18 +12,8 @@ if not bot_token or not chat_id:
 
 url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
-# 1. Connect to AWS, and get the relevant instances info into "respone" dictionary
-ec2 = boto3.client('ec2', region_name='us-east-1')
-response = ec2.describe_instances(
-    Filters=[
-    {'Name': 'instance-state-name', 'Values': ['running']},
-    {'Name': 'tag:CreatedBy', 'Values': ['Nadav-Platform-CLI']}
-    ]
-)
-
-server_count = 0
-for reservation in response['Reservations']:
-    server_count += len(reservation['Instances'])
+# 1. Connect to AWS, and count the running platform instances (across all result pages)
+server_count = sum(1 for _ in iter_platform_instances(states=['running']))
 
 # 2. Create the message
 if server_count > 0:
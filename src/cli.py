@@ -1,7 +1,9 @@
 import click
-from src.ec2.manager import list_instances, EC2Creator, cleanup_ec2_resources, change_instance_state
-from src.s3.manager import create_bucket, upload_files, list_buckets, cleanup_s3_resources
-from src.route53.manager import create_hosted_zones, list_my_dns, manage_dns_record, cleanup_dns_resources
+from src.ec2.manager import list_instances, EC2Creator, cleanup_ec2_resources, change_instance_state, show_pool_status, terminate_platform_instances
+from src.s3.manager import create_bucket, upload_files, list_buckets, cleanup_s3_resources, schedule_bucket_teardown, finalize_bucket_teardown
+from src.s3.transfer import sync_directory, download_objects
+from src.route53.manager import create_hosted_zones, list_my_dns, manage_dns_record, cleanup_dns_resources, apply_record_file, get_dns_records
+from src.route53.plan import show_plan, sync_zone
 from src.platform_manager import list_all_resources, cleanup_all_resources
 
 
@@ -25,37 +27,100 @@ def ec2():
     """Manage EC2 resources"""
     pass
 
+REGIONS_HELP = "Comma-separated regions to scan, or 'all' (default: us-east-1)"
+
 @ec2.command(name="list")
-def ec2_list():
+@click.option("--regions", help=REGIONS_HELP)
+def ec2_list(regions):
     """List platform instances"""
-    list_instances()
+    list_instances(regions)
 
 @ec2.command(name="create")
 @click.option("--name", required=True, help="Instance name tag")
 @click.option("--ami", default="ubuntu", help="AMI alias (ubuntu/amazon-linux)")
 @click.option("--key", required=True, help="Key Pair name (will be created if missing)")
 @click.option("--type", "instance_type", default="t3.micro", help="Instance type (t3.micro/t3.small)")
-def ec2_create(name, ami, instance_type, key):
-    """Create a new EC2 instance"""
-    creator = EC2Creator()
-    creator.create_instance(ami_input=ami, instance_type_input=instance_type, instance_name_input=name, key_input=key)
+@click.option("--count", default=1, type=click.IntRange(min=1), help="Number of identical instances to launch (Name tags get an index)")
+@click.option("--hibernate", is_flag=True, help="Launch with hibernation enabled (encrypted root volume)")
+@click.option("--region", help="Region to launch in (default: us-east-1)")
+@click.option("--regions", help="Extra regions whose instances count toward the limit, or 'all'")
+def ec2_create(name, ami, instance_type, key, count, hibernate, region, regions):
+    """Create new EC2 instances"""
+    creator = EC2Creator(region=region, quota_regions=regions)
+    result = creator.create_instance(ami_input=ami, instance_type_input=instance_type, instance_name_input=name, key_input=key, count=count,
+                                     hibernate=hibernate)
+    if result:
+        click.echo(result)
+
+@ec2.command(name="ami-cache")
+@click.option("--refresh", is_flag=True, help="Re-resolve every AMI alias from SSM now")
+@click.option("--clear", is_flag=True, help="Invalidate the cached AMI IDs")
+@click.option("--region", help="Region whose AMI cache to use (default: us-east-1)")
+def ec2_ami_cache(refresh, clear, region):
+    """Show, refresh or clear the local AMI resolution cache"""
+    creator = EC2Creator(region=region)
+    if clear:
+        creator.clear_ami_cache()
+        click.echo("🧹 AMI cache cleared.")
+        return
+    amis = creator.refresh_ami_cache() if refresh else creator.get_cached_amis()
+    if not amis:
+        click.echo("The AMI cache is empty or expired. It will be filled on the next create (or use --refresh).")
+        return
+    for alias, ami_id in amis.items():
+        click.echo(f"  {alias}: {ami_id}")
 
 @ec2.command(name="stop")
-@click.argument("instance_id")
-def ec2_stop(instance_id):
-    """Stop an EC2 instance"""
-    change_instance_state(instance_id, "stop")
+@click.argument("instance_ids", nargs=-1)
+@click.option("--tag", help="Select instances by tag (Key=Value)")
+@click.option("--name", help="Select instances by Name tag")
+@click.option("--timeout", type=float, help="Max seconds to wait (default: $AWSCTL_WAIT_TIMEOUT or 600)")
+@click.option("--hibernate", is_flag=True, help="Hibernate instances launched with --hibernate instead of a plain stop")
+def ec2_stop(instance_ids, tag, name, timeout, hibernate):
+    """Stop one or more EC2 instances"""
+    change_instance_state(list(instance_ids), "stop", tag=tag, name=name, timeout=timeout, hibernate=hibernate)
 
 @ec2.command(name="start")
-@click.argument("instance_id")
-def ec2_start(instance_id):
-    """Start an EC2 instance"""
-    change_instance_state(instance_id, "start")
+@click.argument("instance_ids", nargs=-1)
+@click.option("--tag", help="Select instances by tag (Key=Value)")
+@click.option("--name", help="Select instances by Name tag")
+@click.option("--timeout", type=float, help="Max seconds to wait (default: $AWSCTL_WAIT_TIMEOUT or 600)")
+def ec2_start(instance_ids, tag, name, timeout):
+    """Start one or more EC2 instances"""
+    change_instance_state(list(instance_ids), "start", tag=tag, name=name, timeout=timeout)
 
 @ec2.command(name="cleanup")
-def ec2_cleanup():
+@click.option("--keep-pool", is_flag=True, help="Leave the warm pool instances in place")
+@click.option("--regions", help=REGIONS_HELP)
+def ec2_cleanup(keep_pool, regions):
     """Terminate all platform instances"""
-    cleanup_ec2_resources()
+    cleanup_ec2_resources(keep_pool=keep_pool, regions=regions)
+
+@ec2.group(name="pool")
+def ec2_pool():
+    """Manage the warm pool of stopped instances used by create"""
+    pass
+
+@ec2_pool.command(name="fill")
+@click.option("--size", required=True, type=click.IntRange(min=1), help="Number of stopped instances to keep ready")
+@click.option("--ami", default="ubuntu", help="AMI alias (ubuntu/amazon-linux)")
+@click.option("--key", required=True, help="Key Pair name (will be created if missing)")
+@click.option("--type", "instance_type", default="t3.micro", help="Instance type (t3.micro/t3.small)")
+def ec2_pool_fill(size, ami, key, instance_type):
+    """Pre-launch instances and park them stopped"""
+    EC2Creator().fill_pool(size, ami, instance_type, key)
+
+@ec2_pool.command(name="status")
+@click.option("--regions", help=REGIONS_HELP)
+def ec2_pool_status(regions):
+    """Show the warm pool members"""
+    show_pool_status(regions)
+
+@ec2_pool.command(name="drain")
+@click.option("--regions", help=REGIONS_HELP)
+def ec2_pool_drain(regions):
+    """Terminate every warm pool instance"""
+    terminate_platform_instances(pool_only=True, regions=regions)
 
 # --- S3 Group ---
 @main_cli.group()
@@ -80,15 +145,46 @@ def s3_upload(bucket, file_path, key):
     """Upload file to S3"""
     # upload_files signature: file_name, bucket_name, object_name=None
     upload_files(file_name=file_path, bucket_name=bucket, object_name=key)
+
+@s3.command(name="sync")
+@click.argument("local_dir", type=click.Path(exists=True, file_okay=False))
+@click.option("--bucket", required=True, help="Target bucket name")
+@click.option("--prefix", default="", help="Key prefix to upload under")
+@click.option("--delete", "delete_orphans", is_flag=True, help="Delete remote files that no longer exist locally")
+@click.option("--full", is_flag=True, help="Ignore the upload manifest and re-upload every file")
+def s3_sync(local_dir, bucket, prefix, delete_orphans, full):
+    """Upload new and changed files of a directory tree to S3"""
+    sync_directory(local_dir=local_dir, bucket_name=bucket, prefix=prefix, delete_orphans=delete_orphans, full=full)
+
+@s3.command(name="download")
+@click.option("--bucket", required=True, help="Source bucket name")
+@click.option("--key", help="Object key to download")
+@click.option("--prefix", help="Download every object under this prefix")
+@click.option("--dest", default=".", help="Local file or directory to write to")
+def s3_download(bucket, key, prefix, dest):
+    """Download objects from S3"""
+    if (key is None) == (prefix is None):
+        raise click.UsageError("Provide exactly one of --key or --prefix.")
+    download_objects(bucket_name=bucket, dest=dest, key=key, prefix=prefix)
+
 @s3.command(name="list")
 def s3_list():
     """ List S3 buckets """
     list_buckets()
 
 @s3.command(name="cleanup")
-def s3_cleanup():
+@click.option("--async", "async_mode", is_flag=True, help="Let S3 lifecycle rules empty the buckets in the background")
+@click.option("--finalize", is_flag=True, help="Delete the buckets that S3 has finished emptying")
+def s3_cleanup(async_mode, finalize):
     """Delete all platform buckets"""
-    cleanup_s3_resources()
+    if async_mode and finalize:
+        raise click.UsageError("--async and --finalize cannot be used together.")
+    if async_mode:
+        schedule_bucket_teardown()
+    elif finalize:
+        finalize_bucket_teardown()
+    else:
+        cleanup_s3_resources()
 
 # --- DNS Group ---
 @main_cli.group()
@@ -101,6 +197,16 @@ def dns_list():
     """List platform DNS zones and records"""
     list_my_dns()
 
+@dns.command(name="get")
+@click.argument("zone_id")
+@click.option("--name", required=True, help="Record name (relative to the zone or fully qualified)")
+@click.option("--type", "record_type", help="Record type (default: every type at the name)")
+@click.option("--prefix", "subtree", is_flag=True, help="Also return every record below the name (e.g. *.api.example.com)")
+@click.option("--json", "as_json", is_flag=True, help="Print the record sets as JSON")
+def dns_get(zone_id, name, record_type, subtree, as_json):
+    """Look up a single record set (or a name's subtree)"""
+    get_dns_records(zone_id, name, record_type, subtree=subtree, as_json=as_json)
+
 @dns.command(name="create-zone")
 @click.argument("domain")
 def dns_create_zone(domain):
@@ -113,9 +219,40 @@ def dns_create_zone(domain):
 @click.option("--name", required=True, help="Record Name")
 @click.option("--type", "record_type", required=True, help="Record Type (A, CNAME, TXT...)")
 @click.option("--value", required=True, help="Record Value")
-def dns_record(zone_id, action, name, record_type, value):
+@click.option("--ttl", default=300, type=click.IntRange(min=0), help="Record TTL in seconds")
+@click.option("--wait", is_flag=True, help="Wait until the change is INSYNC")
+def dns_record(zone_id, action, name, record_type, value, ttl, wait):
     """Manage DNS records"""
-    manage_dns_record(zone_id, action, name, record_type, value)
+    manage_dns_record(zone_id, action, name, record_type, value, wait=wait, ttl=ttl)
+
+@dns.command(name="apply")
+@click.argument("zone_id")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "file_format", type=click.Choice(['yaml', 'csv', 'bind']), help="File format (default: from the extension)")
+@click.option("--wait", is_flag=True, help="Wait until every change batch is INSYNC")
+def dns_apply(zone_id, file, file_format, wait):
+    """Apply many record changes from a YAML, CSV or BIND zone file"""
+    apply_record_file(zone_id, file, file_format, wait=wait)
+
+@dns.command(name="plan")
+@click.argument("zone_id")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "file_format", type=click.Choice(['yaml', 'csv', 'bind']), help="File format (default: from the extension)")
+@click.option("--prune", is_flag=True, help="Also plan deleting records that are not in the file")
+def dns_plan(zone_id, file, file_format, prune):
+    """Show what sync would change to match a desired-state file"""
+    show_plan(zone_id, file, prune, file_format)
+
+@dns.command(name="sync")
+@click.argument("zone_id")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "file_format", type=click.Choice(['yaml', 'csv', 'bind']), help="File format (default: from the extension)")
+@click.option("--prune", is_flag=True, help="Delete records that are not in the file (apex NS/SOA are kept)")
+@click.option("--yes", "assume_yes", is_flag=True, help="Apply the plan without asking")
+@click.option("--wait", is_flag=True, help="Wait until every change batch is INSYNC")
+def dns_sync(zone_id, file, file_format, prune, assume_yes, wait):
+    """Make a zone match a desired-state file, writing only the differences"""
+    sync_zone(zone_id, file, prune, file_format, assume_yes=assume_yes, wait=wait)
 
 @dns.command(name="cleanup")
 def dns_cleanup():
@@ -128,9 +265,10 @@ def cli_list_all():
     list_all_resources()
 
 @main_cli.command(name="cleanup-all")
-def cli_cleanup_all():
+@click.option("--fresh", is_flag=True, help="Ignore a previous failed run and run every step again")
+def cli_cleanup_all(fresh):
     """Delete ALL platform resources (EC2, S3, Route53)"""
-    cleanup_all_resources()
+    cleanup_all_resources(fresh=fresh)
 
 if __name__ == "__main__":
     main_cli()
\ No newline at end of file
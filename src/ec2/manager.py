@@ -1,141 +1,431 @@
 import boto3
+import hashlib
+import uuid
 import sys
 import os
-from src.utils.helpers import console, progress_spinner, get_aws_user
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from rich.table import Table
+from src.utils.helpers import console, progress_spinner, get_aws_user, load_state_file, save_state_file
+from src.utils.waiter import wait_until
 from click import ClickException
 from botocore.exceptions import ClientError
 
+# The platform's home region; other regions are only touched when asked for with --regions
+DEFAULT_REGION = 'us-east-1'
+REGION_SCAN_WORKERS = 16
+
+_ec2_clients = {}
+_ec2_clients_lock = threading.Lock()
+
+def get_ec2_client(region=None):
+    """
+    Returns a shared EC2 client for the region (the home region by default), creating it on first use.
+    """
+    region = region or DEFAULT_REGION
+    with _ec2_clients_lock:
+        if region not in _ec2_clients:
+            _ec2_clients[region] = boto3.client('ec2', region_name=region)
+        return _ec2_clients[region]
+
 # Accessing the EC2 service in us-east-1 region
-ec2 = boto3.client('ec2', region_name='us-east-1')
+ec2 = get_ec2_client()
+
+# Instance states that count as "existing" for listing, quota and cleanup
+ACTIVE_STATES = ['running', 'pending', 'stopping', 'stopped']
+
+# start/stop_instances and describe_instance_status calls are split into chunks of this size
+INSTANCE_BATCH_SIZE = 100
+
+# Resolved AMI IDs are cached locally; the SSM aliases change at most weekly
+AMI_CACHE_FILE = "ami_cache.json"
+AMI_CACHE_TTL = int(os.environ.get('AWSCTL_AMI_CACHE_TTL', 24 * 60 * 60))
+
+# Local index of platform launch templates, keyed by AMI/type/key/SG
+LAUNCH_TEMPLATE_INDEX_FILE = "launch_templates.json"
+LAUNCH_TEMPLATE_TTL = 7 * 24 * 60 * 60
+# run_instances errors meaning a cached template points at something that no longer exists
+STALE_TEMPLATE_ERRORS = {
+    'InvalidLaunchTemplateId.NotFound', 'InvalidLaunchTemplateId.VersionNotFound',
+    'InvalidKeyPair.NotFound', 'InvalidGroup.NotFound', 'InvalidAMIID.NotFound'
+}
+
+# Warm pool: pre-launched, stopped instances that `ec2 create` can claim and start
+POOL_TAG = 'PlatformPool'
+POOL_SPEC_TAG = 'PoolSpec'
+POOL_INSTANCE_NAME = "Nadav-CLI-warm-pool"
 
-def get_instances():
+# Hibernation: stop reasons that mean the RAM was saved, and the local resume-latency history
+HIBERNATE_STATE_REASON = 'Client.UserInitiatedHibernate'
+RESUME_HISTORY_FILE = "resume_latency.json"
+RESUME_HISTORY_SIZE = 20
+
+# States an instance can't come back from while waiting for the target state
+DEAD_END_STATES = {
+    'running': {'shutting-down', 'terminated'},
+    'stopped': {'shutting-down', 'terminated'},
+    'terminated': set()
+}
+
+# action: (API method, target state, states the instance must be in to be changed)
+STATE_ACTIONS = {
+    'stop': ('stop_instances', 'stopped', ['running', 'pending']),
+    'start': ('start_instances', 'running', ['stopped'])
+}
+
+def iter_platform_instances(client=None, states=ACTIVE_STATES, instance_ids=None, filters=None):
     """
-    Returns a list of EC2 instance dictionaries created by the platform.
+    Yields every platform instance in the given states, following NextToken across pages.
+    This is the single describe_instances path for listing, state changes, quota and cleanup.
+    instance_ids asks EC2 for exactly those instances instead of the whole fleet.
     """
-    response = ec2.describe_instances(
-        Filters=[
+    client = client or ec2
+    kwargs = {
+        'Filters': [
             {
                 'Name': 'tag:CreatedBy',
                 'Values': ['Nadav-Platform-CLI']
             },
             {
                 'Name': 'instance-state-name',
-                'Values': ['running', 'pending', 'stopping', 'stopped', 'shutting-down']
+                'Values': list(states)
             }
-        ]
-    )
-    
-    instances = []
-    for reservation in response.get('Reservations', []):
-        for instance in reservation.get('Instances', []):
-            instances.append(instance)
-    return instances
+        ] + (filters or [])
+    }
+    if instance_ids:
+        kwargs['InstanceIds'] = list(instance_ids)
 
-def get_security_groups():
+    for page in client.get_paginator('describe_instances').paginate(**kwargs):
+        for reservation in page.get('Reservations', []):
+            yield from reservation.get('Instances', [])
+
+def find_platform_instance(instance_id, client=None, states=ACTIVE_STATES):
     """
-    Returns a list of Security Group dictionaries created by the platform.
+    Looks up a single platform instance by ID. Returns None if it doesn't exist,
+    isn't tagged by the platform, or isn't in one of the given states.
     """
-    response = ec2.describe_security_groups(
-        Filters=[
-            {
-                'Name': 'tag:CreatedBy',
-                'Values': ['Nadav-Platform-CLI']
-            }
-        ]
+    try:
+        return next(iter_platform_instances(client, states, instance_ids=[instance_id]), None)
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('InvalidInstanceID.NotFound', 'InvalidInstanceID.Malformed'):
+            return None
+        raise
+
+def resolve_regions(regions=None):
+    """
+    Turns a --regions value into a list of region names: None means the home region,
+    'all' means every region enabled for the account, otherwise a comma-separated list.
+    """
+    if not regions:
+        return [DEFAULT_REGION]
+    if isinstance(regions, str):
+        if regions.strip().lower() == 'all':
+            response = get_ec2_client().describe_regions()
+            return sorted(region['RegionName'] for region in response['Regions'])
+        regions = regions.split(',')
+    return list(dict.fromkeys(region.strip() for region in regions if region.strip()))
+
+def scan_regions(scan, regions=None, skip_failed=False):
+    """
+    Runs scan(region) -> list for every region at the same time and merges the results,
+    annotating each item with its 'Region'. The total time is that of the slowest region.
+    A region that fails (e.g. throttled or not enabled for the account) is reported; the scan
+    then raises once every region has finished, since a missing region would make counts and
+    cleanups look complete. Listings pass skip_failed to show the regions that did answer.
+    """
+    regions = resolve_regions(regions)
+    failed = []
+
+    def scan_one(region):
+        try:
+            items = scan(region)
+        except Exception as e:
+            console.print(f"[bold red]❌ Could not scan {region}:[/bold red] {e}")
+            failed.append(region)
+            return []
+        for item in items:
+            item['Region'] = region
+        return items
+
+    with ThreadPoolExecutor(max_workers=min(REGION_SCAN_WORKERS, len(regions))) as pool:
+        items = [item for items in pool.map(scan_one, regions) for item in items]
+    if failed and not skip_failed:
+        raise Exception(f"Could not scan {len(failed)} of {len(regions)} regions: {', '.join(sorted(failed))}")
+    return items
+
+def group_by_region(items):
+    grouped = {}
+    for item in items:
+        grouped.setdefault(item.get('Region', DEFAULT_REGION), []).append(item)
+    return grouped
+
+def get_instances(instance_ids=None, regions=None, skip_failed=False):
+    """
+    Returns a list of EC2 instance dictionaries created by the platform, each with its 'Region'.
+    When instance_ids is given, only those instances are looked up.
+    """
+    filters = None
+    if instance_ids is not None:
+        # A filter (unlike InstanceIds) doesn't fail on IDs that no longer exist
+        filters = [{'Name': 'instance-id', 'Values': list(instance_ids)}]
+
+    return scan_regions(
+        lambda region: list(iter_platform_instances(get_ec2_client(region), ACTIVE_STATES + ['shutting-down'], filters=filters)),
+        regions, skip_failed
     )
-    return response.get('SecurityGroups', [])
 
-def delete_security_groups(group_ids=None):
+def get_security_groups(group_ids=None, regions=None):
     """
-    Deletes the provided security groups. If no IDs are provided, it fetches all platform-created security groups.
+    Returns a list of Security Group dictionaries created by the platform, each with its 'Region'.
+    When group_ids is given, only those groups are looked up.
+    """
+    filters = [
+        {
+            'Name': 'tag:CreatedBy',
+            'Values': ['Nadav-Platform-CLI']
+        }
+    ]
+    if group_ids is not None:
+        filters.append({'Name': 'group-id', 'Values': list(group_ids)})
+
+    def scan(region):
+        security_groups = []
+        for page in get_ec2_client(region).get_paginator('describe_security_groups').paginate(Filters=filters):
+            security_groups.extend(page.get('SecurityGroups', []))
+        return security_groups
+
+    return scan_regions(scan, regions)
+
+def delete_security_groups(group_ids=None, regions=None):
+    """
+    Deletes the provided security groups (IDs in the home region). If no IDs are provided,
+    it fetches all platform-created security groups in the given regions.
+    Returns True if every group was deleted.
     """
     if group_ids is None:
         console.print("[dim]No security group IDs provided. Scanning for all platform security groups...[/dim]")
-        sgs = get_security_groups()
-        group_ids = [sg['GroupId'] for sg in sgs]
+        try:
+            sgs = get_security_groups(regions=regions)
+        except Exception as e:
+            console.print(f"[bold red]❌ Error listing security groups:[/bold red] {e}")
+            return False
+        group_regions = {sg['GroupId']: sg['Region'] for sg in sgs}
+    else:
+        group_regions = {sg_id: DEFAULT_REGION for sg_id in group_ids}
 
-    if not group_ids:
+    if not group_regions:
         console.print("[green]✨ No security groups to delete.[/green]")
-        return
+        return True
 
-    console.print(f"[yellow]🛡️  Found {len(group_ids)} security groups to clean...[/yellow]")
+    console.print(f"[yellow]🛡️  Found {len(group_regions)} security groups to clean...[/yellow]")
     
-    for sg_id in group_ids:
+    all_deleted = True
+    for sg_id, region in group_regions.items():
         try:
-            ec2.delete_security_group(GroupId=sg_id)
+            get_ec2_client(region).delete_security_group(GroupId=sg_id)
             print(f"✅ Deleted Security Group: {sg_id}")
         except ClientError as e:
+            all_deleted = False
             if 'DependencyViolation' in str(e):
                 print(f"⚠️  Could not delete {sg_id}: Dependency Violation (Likely still attached to a terminating instance).")
             else:
                 print(f"❌ Error deleting {sg_id}: {e}")
+    return all_deleted
 
-def list_instances():
+def list_instances(regions=None):
     with progress_spinner("Listing instances..."):
-        instances = get_instances()
+        instances = get_instances(regions=regions, skip_failed=True)
         
         if not instances:
             console.print("[yellow]⚠️  No instances found matching your criteria (Tag: CreatedBy=Nadav-Platform-CLI).[/yellow]")
             return
 
+        show_region = len(resolve_regions(regions)) > 1
         for instance in instances:
-            print(instance['InstanceId'])
+            print(f"{instance['Region']}\t{instance['InstanceId']}" if show_region else instance['InstanceId'])
 
-def change_instance_state(instance_id, action):
-    response = ec2.describe_instances(
-            Filters=[
-                {
-                    'Name': 'tag:CreatedBy',
-                    'Values': ['Nadav-Platform-CLI']
-                },
-                {
-                    'Name': 'instance-state-name',
-                    'Values': ['running', 'pending', 'stopping', 'stopped']
-                }
-            ]
+def chunked(items, size=INSTANCE_BATCH_SIZE):
+    items = list(items)
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def is_pool_instance(instance):
+    return any(tag['Key'] == POOL_TAG for tag in instance.get('Tags', []))
+
+def pool_filters(spec_key=None):
+    filters = [{'Name': f'tag:{POOL_TAG}', 'Values': ['warm']}]
+    if spec_key:
+        filters.append({'Name': f'tag:{POOL_SPEC_TAG}', 'Values': [spec_key]})
+    return filters
+
+def select_platform_instances(instance_ids=None, tag=None, name=None):
+    """
+    Returns the platform instances matching explicit IDs and/or a tag ('Key=Value') or Name selector.
+    """
+    filters = []
+    if instance_ids:
+        # A filter (unlike InstanceIds) doesn't fail the whole call on one unknown ID
+        filters.append({'Name': 'instance-id', 'Values': list(instance_ids)})
+    if tag:
+        key, _, value = tag.partition('=')
+        filters.append({'Name': f'tag:{key}', 'Values': [value]})
+    if name:
+        filters.append({'Name': 'tag:Name', 'Values': [name]})
+    return list(iter_platform_instances(filters=filters))
+
+def wait_for_instance_states(instance_ids, target_state, client=None, timeout=None):
+    """
+    Waits for all instances with one batched describe_instance_status poll per round
+    (100 IDs per call) and prints each instance's transition as it happens.
+    Returns the wait engine's WaitResult.
+    """
+    client = client or ec2
+
+    def poll(pending_ids):
+        states = {}
+        for batch in chunked(pending_ids):
+            try:
+                response = client.describe_instance_status(InstanceIds=batch, IncludeAllInstances=True)
+            except ClientError as e:
+                # Instances that were terminated a while ago are no longer reported at all
+                if e.response['Error']['Code'] != 'InvalidInstanceID.NotFound':
+                    raise
+                continue
+            for status in response.get('InstanceStatuses', []):
+                states[status['InstanceId']] = status['InstanceState']['Name']
+        return states
+
+    def on_change(instance_id, previous, state):
+        transition = f"{previous} → {state or 'gone'}" if previous else (state or 'gone')
+        console.print(f"  [cyan]{instance_id}[/cyan]: {transition}")
+
+    result = wait_until(
+        instance_ids, poll,
+        is_ready=lambda state: state == target_state or (target_state == 'terminated' and state is None),
+        is_failed=lambda state: state in DEAD_END_STATES[target_state],
+        on_change=on_change,
+        timeout=timeout
+    )
+    result.print_metrics("instances")
+    return result
+
+def is_hibernation_configured(instance):
+    return instance.get('HibernationOptions', {}).get('Configured', False)
+
+def was_hibernated(instance):
+    return instance.get('StateReason', {}).get('Code') == HIBERNATE_STATE_REASON
+
+def record_resume_latencies(latencies):
+    """
+    Adds {mode: [seconds, ...]} samples to the local resume history and prints
+    hibernation resumes against cold starts (averaged over the kept history).
+    """
+    history = load_state_file(RESUME_HISTORY_FILE)
+    for mode, samples in latencies.items():
+        history[mode] = (history.get(mode, []) + samples)[-RESUME_HISTORY_SIZE:]
+    save_state_file(RESUME_HISTORY_FILE, history)
+
+    table = Table(title="⏱️  Start Latency", show_header=True, header_style="bold magenta")
+    table.add_column("Start type", style="cyan")
+    table.add_column("This run", justify="right")
+    table.add_column("History avg", justify="right")
+    for mode, label in (('hibernate', "Resume from hibernation"), ('cold', "Cold start")):
+        current = latencies.get(mode, [])
+        past = history.get(mode, [])
+        table.add_row(
+            label,
+            f"{sum(current) / len(current):.1f}s" if current else "-",
+            f"{sum(past) / len(past):.1f}s ({len(past)})" if past else "-"
         )
-    
-    instances = []
-    for reservation in response.get('Reservations', []):
-        for instance in reservation.get('Instances', []):
-            instances.append(instance)
+    console.print(table)
+
+def change_instance_state(instance_ids=None, action=None, tag=None, name=None, timeout=None, hibernate=False):
+    """
+    Starts or stops one or many platform instances, selected by ID and/or by a tag/Name selector.
+    With hibernate, stop saves the RAM of instances that were launched hibernation-configured.
+    """
+    if isinstance(instance_ids, str):
+        instance_ids = [instance_ids]
+
+    if action not in STATE_ACTIONS:
+        print("❌ Error: This action is not recognized. Please consult with your DevOps team.")
+        return False
+    if not instance_ids and not tag and not name:
+        print("❌ Error: Provide instance IDs or a --tag/--name selector.")
+        return False
+
+    method, target_state, allowed_states = STATE_ACTIONS[action]
 
     print("Checking instance tags...")
-    if any(i['InstanceId'] == instance_id for i in instances):
-        print("Instance has the correct tags.")
-        print(f"Attempting to {action} instance: {instance_id}")
-        try:
-            if action == "stop":
-                ec2.stop_instances(InstanceIds=[instance_id])
-                with progress_spinner("Stopping instance..."):
-                    waiter = ec2.get_waiter('instance_stopped')
-                    waiter.wait(InstanceIds=[instance_id])
-                print(f"✅ Instance {instance_id} is now fully stopped!")
-            elif action == "start":
-                ec2.start_instances(InstanceIds=[instance_id])
-                with progress_spinner("Starting instance..."):
-                    waiter = ec2.get_waiter('instance_running')
-                    waiter.wait(InstanceIds=[instance_id])
-                print(f"✅ Instance {instance_id} is now running!")
-            else:
-                print("❌ Error: This action is not recognized. Please consult with your DevOps team.")
-                return
-        except Exception as e:
-            print(f"❌ Error: {str(e)}")
-            return
-    else:
-        print("❌ Error: This instance doesn't have the right tag or is terminated")
-        return
+    instances = select_platform_instances(instance_ids, tag, name)
+    found_ids = {i['InstanceId'] for i in instances}
+    for missing_id in sorted(set(instance_ids or []) - found_ids):
+        print(f"❌ Error: Instance {missing_id} doesn't have the right tag or is terminated")
+
+    targets = [i['InstanceId'] for i in instances if i['State']['Name'] in allowed_states]
+    for instance in instances:
+        if instance['State']['Name'] not in allowed_states:
+            print(f"⏭️  Skipping {instance['InstanceId']}: it is {instance['State']['Name']}")
+
+    if not targets:
+        print("No instances to change.")
+        return not (set(instance_ids or []) - found_ids)
+
+    # Hibernate=True fails the whole call if any instance isn't configured for it,
+    # so those are stopped normally in their own batches
+    hibernating = set()
+    if action == 'stop' and hibernate:
+        hibernating = {i['InstanceId'] for i in instances if i['InstanceId'] in targets and is_hibernation_configured(i)}
+        for instance_id in sorted(set(targets) - hibernating):
+            print(f"⚠️  {instance_id} wasn't launched with hibernation, stopping it normally.")
+    resuming = {i['InstanceId'] for i in instances if action == 'start' and i['InstanceId'] in targets and was_hibernated(i)}
+
+    print(f"Attempting to {action} {len(targets)} instance(s): {', '.join(targets)}")
+    try:
+        started = time.monotonic()
+        for batch in chunked([t for t in targets if t in hibernating]):
+            getattr(ec2, method)(InstanceIds=batch, Hibernate=True)
+        for batch in chunked([t for t in targets if t not in hibernating]):
+            getattr(ec2, method)(InstanceIds=batch)
+        call_elapsed = time.monotonic() - started
+
+        with progress_spinner(f"Waiting for {len(targets)} instance(s) to be {target_state}..."):
+            result = wait_for_instance_states(targets, target_state, timeout=timeout)
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+        return False
+
+    if action == 'start' and result.ready:
+        latencies = {}
+        for instance_id, seconds in result.ready.items():
+            mode = 'hibernate' if instance_id in resuming else 'cold'
+            latencies.setdefault(mode, []).append(call_elapsed + seconds)
+        record_resume_latencies(latencies)
+
+    for instance_id, state in sorted(result.failed.items()):
+        print(f"❌ Instance {instance_id} ended up {state} instead of {target_state}.")
+    if result.pending:
+        reason = "waiting was cancelled" if result.cancelled else "timed out"
+        print(f"⚠️  {len(result.pending)} instance(s) are not {target_state} yet ({reason}): {', '.join(sorted(result.pending))}")
+    if not result.succeeded:
+        return False
+    print(f"✅ {len(result.ready)} instance(s) are now {target_state}!")
+    return True
 
 
 # Creating the EC2 create command
 class EC2Creator:
-    def __init__(self):
+    def __init__(self, region=None, quota_regions=None):
         # Resource definition 
-        self.client = boto3.client('ec2', region_name='us-east-1')
-        self.ssm = boto3.client('ssm', region_name='us-east-1')
+        self.region = region or DEFAULT_REGION
+        self.client = boto3.client('ec2', region_name=self.region)
+        self.ssm = boto3.client('ssm', region_name=self.region)
         self.sts = boto3.client('sts')
 
+        # LIMIT applies across regions: the home region and the launch region are always counted
+        self.quota_regions = list(dict.fromkeys([DEFAULT_REGION, self.region] + resolve_regions(quota_regions)))
+
         # Amis list
         self.ALLOWED_AMIS = {
             "ubuntu" : "/aws/service/canonical/ubuntu/server/24.04/stable/current/amd64/hvm/ebs-gp3/ami-id",
@@ -147,38 +437,65 @@ class EC2Creator:
         self.LIMIT = 2
 
         
-    def ensure_key_pair(self, key_name):
+    def find_key_pair(self, key_name):
         """
-        Checks if a key pair exists. If not, creates it and saves the .pem file.
+        Looks the key pair up without creating it. Returns its name, or None if it doesn't exist.
         """
         try:
             self.client.describe_key_pairs(KeyNames=[key_name])
-            print(f"🔑 Key Pair '{key_name}' found. Using existing key.")
-            return key_name
         except ClientError as e:
-            if 'InvalidKeyPair.NotFound' in str(e):
-                print(f"⚠️  Key Pair '{key_name}' not found. Creating it...")
-                try:
-                    key_pair = self.client.create_key_pair(KeyName=key_name, KeyType='rsa')
-                    private_key = key_pair['KeyMaterial']
-                    
-                    # Save the private key to a file
-                    file_name = f"{key_name}.pem"
-                    with open(file_name, "w") as f:
-                        f.write(private_key)
-                    
-                    # Set permissions (read-only for owner) - Windows specific handling might be needed but simple write is fine for now
-                    # os.chmod(file_name, 0o400) 
-                    
-                    print(f"✅ Key Pair created! Private key saved to: {os.path.abspath(file_name)}")
-                    print("⚠️  IMPORTANT: Keep this file safe. You will not be able to download it again.")
-                    return key_name
-                except Exception as create_error:
-                    print(f"❌ Failed to create key pair: {create_error}")
-                    return None
-            else:
-                print(f"❌ Error checking key pair: {e}")
+            if e.response['Error']['Code'] == 'InvalidKeyPair.NotFound':
                 return None
+            raise
+        print(f"🔑 Key Pair '{key_name}' found. Using existing key.")
+        return key_name
+
+    def find_security_group(self, group_name):
+        """
+        Looks the platform security group up without creating it. Returns its ID or None.
+        """
+        existing_sgs = self.client.describe_security_groups(
+            Filters=[
+                {'Name': 'group-name', 'Values': [group_name]},
+                {'Name': 'tag:CreatedBy', 'Values': ['Nadav-Platform-CLI']}
+            ]
+        )
+        if not existing_sgs['SecurityGroups']:
+            return None
+        sg_id = existing_sgs['SecurityGroups'][0]['GroupId']
+        print(f"🛡️  Security Group '{group_name}' ({sg_id}) already exists. Using it.")
+        return sg_id
+
+    def ensure_key_pair(self, key_name):
+        """
+        Checks if a key pair exists. If not, creates it and saves the .pem file.
+        """
+        try:
+            if self.find_key_pair(key_name):
+                return key_name
+        except ClientError as e:
+            print(f"❌ Error checking key pair: {e}")
+            return None
+
+        print(f"⚠️  Key Pair '{key_name}' not found. Creating it...")
+        try:
+            key_pair = self.client.create_key_pair(KeyName=key_name, KeyType='rsa')
+            private_key = key_pair['KeyMaterial']
+            
+            # Save the private key to a file
+            file_name = f"{key_name}.pem"
+            with open(file_name, "w") as f:
+                f.write(private_key)
+            
+            # Set permissions (read-only for owner) - Windows specific handling might be needed but simple write is fine for now
+            # os.chmod(file_name, 0o400) 
+            
+            print(f"✅ Key Pair created! Private key saved to: {os.path.abspath(file_name)}")
+            print("⚠️  IMPORTANT: Keep this file safe. You will not be able to download it again.")
+            return key_name
+        except Exception as create_error:
+            print(f"❌ Failed to create key pair: {create_error}")
+            return None
 
     def create_security_group(self, group_name, description="Created by Nadav-Platform-CLI"):
         """
@@ -186,16 +503,8 @@ class EC2Creator:
         """
         try:
             # Check if SG already exists to avoid duplication errors
-            # Check if SG already exists to avoid duplication errors
-            existing_sgs = self.client.describe_security_groups(
-                Filters=[
-                    {'Name': 'group-name', 'Values': [group_name]},
-                    {'Name': 'tag:CreatedBy', 'Values': ['Nadav-Platform-CLI']}
-                ]
-            )
-            if existing_sgs['SecurityGroups']:
-                sg_id = existing_sgs['SecurityGroups'][0]['GroupId']
-                print(f"🛡️  Security Group '{group_name}' ({sg_id}) already exists. Using it.")
+            sg_id = self.find_security_group(group_name)
+            if sg_id:
                 return sg_id
 
             print(f"🛡️  Creating Security Group '{group_name}'...")
@@ -237,19 +546,57 @@ class EC2Creator:
                 return None
             print(f"❌ Error creating security group: {e}")
             return None
-    def get_latest_ami_id(self, ami_name):
+    def refresh_ami_cache(self):
+        """
+        Resolves every allowed AMI alias with a single SSM get_parameters call and
+        stores the result in the on-disk cache. Returns {alias: ami_id}.
+        """
+        aliases_by_path = {path: alias for alias, path in self.ALLOWED_AMIS.items()}
+        response = self.ssm.get_parameters(Names=list(aliases_by_path))
+        for path in response.get('InvalidParameters', []):
+            print(f"⚠️  SSM parameter not found for {aliases_by_path[path]}: {path}")
+
+        amis = {aliases_by_path[param['Name']]: param['Value'] for param in response.get('Parameters', [])}
+        save_state_file(self.ami_cache_file, {'resolved_at': time.time(), 'amis': amis})
+        return amis
+
+    @property
+    def ami_cache_file(self):
+        # AMI IDs are regional, so each region has its own cache
+        return AMI_CACHE_FILE if self.region == DEFAULT_REGION else f"ami_cache.{self.region}.json"
+
+    def clear_ami_cache(self):
+        save_state_file(self.ami_cache_file, {})
+
+    def get_cached_amis(self, ttl=None):
+        """
+        Returns the cached {alias: ami_id} if it is younger than the TTL, otherwise None.
+        """
+        ttl = AMI_CACHE_TTL if ttl is None else ttl
+        cache = load_state_file(self.ami_cache_file)
+        if not cache.get('amis') or time.time() - cache.get('resolved_at', 0) > ttl:
+            return None
+        return cache['amis']
+
+    def get_latest_ami_id(self, ami_name, refresh=False):
         # Check if the user's input ami is in the allowed amis list
         if ami_name not in self.ALLOWED_AMIS:
             print(f"❌ Error: {ami_name} is not a supported OS. Choose from: {list(self.ALLOWED_AMIS.keys())}")
             return None
 
-        # Get the path for the ami to look for in the parameter store
-        parameter_path = self.ALLOWED_AMIS[ami_name]
+        # Repeated creates are served from the local cache without an SSM round trip
+        cached_amis = None if refresh else self.get_cached_amis()
+        if cached_amis and ami_name in cached_amis:
+            ami_id = cached_amis[ami_name]
+            print(f"🔍 Resolved {ami_name} to: {ami_id} (cached)")
+            return ami_id
 
         try:
-            # Looking for the ami-id in the SSM Parameter Store
-            response = self.ssm.get_parameter(Name=parameter_path)
-            ami_id = response['Parameter']['Value']
+            # Looking for the ami-ids in the SSM Parameter Store
+            ami_id = self.refresh_ami_cache().get(ami_name)
+            if not ami_id:
+                print(f"❌ Could not fetch AMI {ami_name} from SSM.")
+                return None
             
             print(f"🔍 Successfully resolved {ami_name} to: {ami_id}")
             return ami_id
@@ -266,54 +613,348 @@ class EC2Creator:
         if instance_type not in self.ALLOWED_TYPES:
             raise ClickException(f"❌ This type is not valid - You are allowed to create only {self.ALLOWED_TYPES[0]} or {self.ALLOWED_TYPES[1]}")
 
-    def is_quota_available(self):
+    def count_platform_instances(self):
+        # Counting instances with the specific tag AND that are not terminated, in every quota region
+        return len(scan_regions(
+            lambda region: list(iter_platform_instances(self.client if region == self.region else get_ec2_client(region))),
+            self.quota_regions
+        ))
+
+    def is_quota_available(self, requested=1):
         print("Checking instances created by Nadav-Platform-CLI...")
-        # Filtering for instances with the specific tag AND that are not terminated
-        response = self.client.describe_instances(
-            Filters=[
-                {
-                    'Name': 'tag:CreatedBy',
-                    'Values': ['Nadav-Platform-CLI']
-                },
-                {
-                    'Name': 'instance-state-name',
-                    'Values': ['running', 'pending', 'stopping', 'stopped']
-                }
-            ]
-        )
-        
-        count = 0
-        for reservation in response.get('Reservations', []):
-            count += len(reservation.get('Instances', []))
+        count = self.count_platform_instances()
 
-        print(f"Found {count} instances.")
+        print(f"Found {count} instances in {', '.join(self.quota_regions)}.")
         
-        if count >= self.LIMIT:
+        if count + requested > self.LIMIT:
             return False
         return True
 
-    def create_instance(self, ami_input, instance_type_input, instance_name_input, key_input):
-        # Validating the parameters
-        self._validate_inputs(instance_type_input, ami_input)
-        
-        # Get the aws user name
-        aws_user = get_aws_user()
+    def create_missing_prerequisites(self, preflight, key_input, sg_name):
+        """
+        Creates the key pair and security group that pre-flight found missing, but only if
+        every other step succeeded (quota passed, AMI and user resolved), so a launch that
+        can't go ahead changes nothing. Returns True when everything is in place.
+        """
+        if not all(value for step, value in preflight.items() if step not in ('key_name', 'security_group_id')):
+            return False
+        if 'key_name' in preflight and preflight['key_name'] is None:
+            preflight['key_name'] = self.ensure_key_pair(key_input)
+        if 'security_group_id' in preflight and preflight['security_group_id'] is None:
+            preflight['security_group_id'] = self.create_security_group(sg_name)
+        return all(preflight.values())
+
+    def run_preflight(self, ami_input, key_input, sg_name, count=1, full=True):
+        """
+        Runs the independent, read-only pre-launch checks concurrently: caller identity,
+        AMI resolution, quota, key pair and security group lookups. Returns (results, timings),
+        where timings maps each step to its latency in seconds. A missing key pair or security
+        group reads as None; create_missing_prerequisites makes them after the quota check.
+        With full=False (launching from a known template) only identity and quota are checked.
+        """
+        steps = {
+            'aws_user': get_aws_user,
+            'quota_ok': lambda: self.is_quota_available(count)
+        }
+        if full:
+            steps.update({
+                'ami_id': lambda: self.get_latest_ami_id(ami_input),
+                'key_name': lambda: self.find_key_pair(key_input),
+                'security_group_id': lambda: self.find_security_group(sg_name)
+            })
+
+        def timed(step):
+            started = time.monotonic()
+            try:
+                return steps[step](), time.monotonic() - started
+            except Exception as e:
+                print(f"❌ Pre-flight step '{step}' failed: {e}")
+                return None, time.monotonic() - started
+
+        with ThreadPoolExecutor(max_workers=len(steps)) as pool:
+            futures = {step: pool.submit(timed, step) for step in steps}
+            outcomes = {step: future.result() for step, future in futures.items()}
+
+        results = {step: outcome[0] for step, outcome in outcomes.items()}
+        timings = {step: outcome[1] for step, outcome in outcomes.items()}
+        return results, timings
+
+    def print_timings(self, timings, stage_timings):
+        """
+        Prints the per-step pre-flight latencies and the overall create-to-running stages.
+        """
+        table = Table(title="⏱️  Create Latency Breakdown", show_header=True, header_style="bold magenta")
+        table.add_column("Step", style="cyan")
+        table.add_column("Seconds", justify="right")
+        slowest = max(timings, key=timings.get)
+        for step, elapsed in timings.items():
+            style = "bold yellow" if step == slowest else ""
+            table.add_row(f"  pre-flight: {step}", f"[{style}]{elapsed:.2f}[/{style}]" if style else f"{elapsed:.2f}")
+        for stage, elapsed in stage_timings.items():
+            table.add_row(stage, f"{elapsed:.2f}")
+        console.print(table)
+
+    def _template_spec_key(self, ami_id, instance_type, key_name, sg_name, hibernate=False):
+        spec_key = f"{ami_id}|{instance_type}|{key_name}|{sg_name}"
+        if self.region != DEFAULT_REGION:
+            # Templates, key pairs and security groups are regional
+            spec_key = f"{self.region}|{spec_key}"
+        return f"{spec_key}|hibernate" if hibernate else spec_key
+
+    def find_launch_template(self, ami_id, instance_type, key_name, sg_name, hibernate=False):
+        """
+        Returns the indexed launch template entry for this combination, or None if
+        there is none or it is older than LAUNCH_TEMPLATE_TTL.
+        """
+        if not ami_id:
+            return None
+        entry = load_state_file(LAUNCH_TEMPLATE_INDEX_FILE).get(
+            self._template_spec_key(ami_id, instance_type, key_name, sg_name, hibernate)
+        )
+        if not entry or time.time() - entry['created_at'] > LAUNCH_TEMPLATE_TTL:
+            return None
+        return entry
+
+    def forget_launch_template(self, ami_id, instance_type, key_name, sg_name, hibernate=False):
+        index = load_state_file(LAUNCH_TEMPLATE_INDEX_FILE)
+        index.pop(self._template_spec_key(ami_id, instance_type, key_name, sg_name, hibernate), None)
+        save_state_file(LAUNCH_TEMPLATE_INDEX_FILE, index)
+
+    def get_hibernation_settings(self, ami_id):
+        """
+        Launch template settings for hibernation: the RAM is saved to the root volume,
+        which therefore has to be encrypted (and keeps the AMI's device name and size).
+        """
+        image = self.client.describe_images(ImageIds=[ami_id])['Images'][0]
+        root_device = image['RootDeviceName']
+        root_ebs = next(
+            (mapping.get('Ebs', {}) for mapping in image.get('BlockDeviceMappings', []) if mapping['DeviceName'] == root_device),
+            {}
+        )
+        ebs = {'Encrypted': True, 'DeleteOnTermination': True, 'VolumeType': root_ebs.get('VolumeType', 'gp3')}
+        if 'VolumeSize' in root_ebs:
+            ebs['VolumeSize'] = root_ebs['VolumeSize']
+        return {
+            'HibernationOptions': {'Configured': True},
+            'BlockDeviceMappings': [{'DeviceName': root_device, 'Ebs': ebs}]
+        }
+
+    def ensure_launch_template(self, ami_id, instance_type, key_name, security_group_id, sg_name, aws_user, hibernate=False):
+        """
+        Materializes a platform launch template (or a new version of it) for this
+        AMI/type/key/SG(/hibernate) combination and records it in the local index.
+        """
+        spec_key = self._template_spec_key(ami_id, instance_type, key_name, sg_name, hibernate)
+        template_name = f"Nadav-CLI-{hashlib.sha1(spec_key.encode()).hexdigest()[:12]}"
+        template_data = {
+            'ImageId': ami_id,
+            'InstanceType': instance_type,
+            'KeyName': key_name,
+            'SecurityGroupIds': [security_group_id]
+        }
+        if hibernate:
+            template_data.update(self.get_hibernation_settings(ami_id))
+
+        try:
+            response = self.client.create_launch_template(
+                LaunchTemplateName=template_name,
+                LaunchTemplateData=template_data,
+                TagSpecifications=[
+                    {
+                        'ResourceType': 'launch-template',
+                        'Tags': [
+                            {'Key': 'CreatedBy', 'Value': 'Nadav-Platform-CLI'},
+                            {'Key': 'Owner', 'Value': aws_user}
+                        ]
+                    }
+                ]
+            )
+            template = response['LaunchTemplate']
+            template_id, version = template['LaunchTemplateId'], template['LatestVersionNumber']
+        except ClientError as e:
+            if 'AlreadyExistsException' not in e.response['Error']['Code']:
+                raise
+            # The template exists (e.g. the index was stale): publish a fresh version of it
+            response = self.client.create_launch_template_version(
+                LaunchTemplateName=template_name,
+                LaunchTemplateData=template_data
+            )
+            template_id = response['LaunchTemplateVersion']['LaunchTemplateId']
+            version = response['LaunchTemplateVersion']['VersionNumber']
+
+        entry = {'LaunchTemplateId': template_id, 'Version': str(version), 'created_at': time.time()}
+        index = load_state_file(LAUNCH_TEMPLATE_INDEX_FILE)
+        index[spec_key] = entry
+        save_state_file(LAUNCH_TEMPLATE_INDEX_FILE, index)
+        print(f"📄 Launch template {template_name} (v{version}) saved for future creates.")
+        return entry
+
+    def claim_pool_instance(self, ami_input, instance_type, instance_name, key_name, sg_name, started, hibernate=False):
+        """
+        Claims a stopped warm-pool instance with the same AMI/type/key/SG, starts it and then
+        retags it as a regular instance. Returns the create result, or None if the pool has no
+        match or the claim fails (the caller then launches a new instance). A member that can't
+        be started goes back to the pool. Claiming doesn't change the instance count, so no
+        quota check is needed.
+        """
+        ami_id = (self.get_cached_amis() or {}).get(ami_input)
+        if not ami_id:
+            return None
+        spec_key = self._template_spec_key(ami_id, instance_type, key_name, sg_name, hibernate)
+
+        try:
+            candidates = list(iter_platform_instances(self.client, states=['stopped'], filters=pool_filters(spec_key)))
+        except ClientError as e:
+            print(f"⚠️  Could not read the warm pool ({e.response['Error']['Code']}), launching a new instance.")
+            return None
+
+        for candidate in candidates:
+            instance_id = candidate['InstanceId']
+
+            # Mark the instance with a claim token and read it back, so two concurrent
+            # creates can't both take the same pool member
+            token = uuid.uuid4().hex
+            try:
+                self.client.create_tags(Resources=[instance_id], Tags=[{'Key': POOL_TAG, 'Value': f"claimed-{token}"}])
+                current = find_platform_instance(instance_id, self.client, states=['stopped'])
+            except ClientError as e:
+                print(f"⚠️  Could not claim {instance_id} ({e.response['Error']['Code']}).")
+                continue
+            current_tags = {tag['Key']: tag['Value'] for tag in (current or {}).get('Tags', [])}
+            if current_tags.get(POOL_TAG) != f"claimed-{token}":
+                continue
+
+            print(f"♨️  Claimed warm pool instance {instance_id}. Starting it...")
+            try:
+                self.client.start_instances(InstanceIds=[instance_id])
+            except ClientError as e:
+                # e.g. InsufficientInstanceCapacity: give the member back to the pool
+                print(f"⚠️  Could not start {instance_id} ({e.response['Error']['Code']}), returning it to the pool "
+                      f"and launching a new instance instead.")
+                try:
+                    self.client.create_tags(Resources=[instance_id], Tags=[{'Key': POOL_TAG, 'Value': 'warm'}])
+                except ClientError as tag_error:
+                    print(f"❌ Could not return {instance_id} to the pool: {tag_error}")
+                return None
+
+            try:
+                self.client.delete_tags(Resources=[instance_id], Tags=[{'Key': POOL_TAG}, {'Key': POOL_SPEC_TAG}])
+                self.client.create_tags(Resources=[instance_id], Tags=[
+                    {'Key': 'Name', 'Value': instance_name},
+                    {'Key': 'Owner', 'Value': get_aws_user()}
+                ])
+            except ClientError as e:
+                print(f"⚠️  Instance {instance_id} started, but retagging it failed: {e}")
+
+            with progress_spinner("Waiting for instance to be running..."):
+                result = wait_for_instance_states([instance_id], 'running', client=self.client)
+            print(f"⏱️  Create-to-running from the warm pool: {time.monotonic() - started:.1f}s")
+            if not result.succeeded:
+                print(f"⚠️  Instance {instance_id} was started but is not running yet.")
+            else:
+                print("✅ Instance is up and running!")
+            return(f"Instance Id: {instance_id}")
+
+        return None
+
+    def fill_pool(self, size, ami_input, instance_type, key_input):
+        """
+        Tops the warm pool for this AMI/type/key up to `size` stopped instances.
+        Pool members are platform instances, so they count toward LIMIT.
+        """
+        self._validate_inputs(instance_type, ami_input)
+        sg_name = "Nadav-CLI-SG"
 
-        # Get the ami id
         ami_id = self.get_latest_ami_id(ami_input)
-        # If couldn't manage to get the ami id:
         if not ami_id:
-            return
+            return False
+        spec_key = self._template_spec_key(ami_id, instance_type, key_input, sg_name)
 
-        # Checking the amount of instances:
-        if not self.is_quota_available():
-            print(f"❌ Error: You cannot have more than {self.LIMIT} instances.")
-            return
+        members = list(iter_platform_instances(self.client, filters=pool_filters(spec_key)))
+        missing = size - len(members)
+        if missing <= 0:
+            print(f"♨️  The warm pool already holds {len(members)} matching instance(s).")
+            return True
 
-        # Ensure Key Pair exists
-        key_name = self.ensure_key_pair(key_input)
-        if not key_name:
-            return
+        with progress_spinner("Running pre-flight checks..."):
+            preflight, _ = self.run_preflight(ami_input, key_input, sg_name, missing)
+        # A failed quota step reads as None and was already reported
+        if not preflight['quota_ok']:
+            if preflight['quota_ok'] is False:
+                print(f"❌ Error: Adding {missing} pool instance(s) would exceed the limit of {self.LIMIT} instances.")
+            return False
+        if not self.create_missing_prerequisites(preflight, key_input, sg_name):
+            return False
+
+        template = self.find_launch_template(ami_id, instance_type, key_input, sg_name) or self.ensure_launch_template(
+            ami_id, instance_type, preflight['key_name'], preflight['security_group_id'], sg_name, preflight['aws_user']
+        )
+
+        try:
+            with progress_spinner(f"Launching {missing} warm pool instance(s)..."):
+                response = self.client.run_instances(
+                    LaunchTemplate={'LaunchTemplateId': template['LaunchTemplateId'], 'Version': template['Version']},
+                    TagSpecifications=[
+                        {
+                            'ResourceType': 'instance',
+                            'Tags': [
+                                {'Key': 'Name', 'Value': POOL_INSTANCE_NAME},
+                                {'Key': 'CreatedBy', 'Value': 'Nadav-Platform-CLI'},
+                                {'Key': 'Owner', 'Value': preflight['aws_user']},
+                                {'Key': POOL_TAG, 'Value': 'warm'},
+                                {'Key': POOL_SPEC_TAG, 'Value': spec_key}
+                            ]
+                        }
+                    ],
+                    MinCount=missing,
+                    MaxCount=missing
+                )
+                instance_ids = [instance['InstanceId'] for instance in response['Instances']]
+                if not self.enforce_limit_after_launch(instance_ids):
+                    return False
+
+            # Boot once so the volumes are initialized, then park the instances stopped
+            with progress_spinner("Waiting for pool instances to boot..."):
+                wait_for_instance_states(instance_ids, 'running', client=self.client)
+            self.client.stop_instances(InstanceIds=instance_ids)
+            with progress_spinner("Stopping pool instances..."):
+                result = wait_for_instance_states(instance_ids, 'stopped', client=self.client)
+        except Exception as e:
+            print(f"An error occured: {e}")
+            return False
+
+        print(f"✅ Warm pool now holds {len(members) + len(result.ready)} instance(s) for {ami_input}/{instance_type}.")
+        return result.succeeded
+
+    def tag_fleet(self, instance_ids, instance_name):
+        """
+        Gives every node of a fleet an indexed Name tag (name-1, name-2, ...).
+        """
+        for index, instance_id in enumerate(instance_ids, start=1):
+            self.client.create_tags(
+                Resources=[instance_id],
+                Tags=[{'Key': 'Name', 'Value': f"{instance_name}-{index}"}]
+            )
+
+    def enforce_limit_after_launch(self, instance_ids):
+        """
+        Another run may have launched at the same time; if the platform is now over
+        LIMIT, this run's instances are terminated again. Returns True if within LIMIT.
+        """
+        try:
+            if self.count_platform_instances() <= self.LIMIT:
+                return True
+            print(f"❌ Error: Another launch raced this one past the limit of {self.LIMIT} instances. Rolling back...")
+        except Exception as e:
+            print(f"❌ Error: Could not re-check the limit of {self.LIMIT} instances ({e}). Rolling back...")
+        self.client.terminate_instances(InstanceIds=instance_ids)
+        return False
+
+    def create_instance(self, ami_input, instance_type_input, instance_name_input, key_input, count=1, hibernate=False,
+                        _retried=False):
+        # Validating the parameters
+        self._validate_inputs(instance_type_input, ami_input)
+        started = time.monotonic()
 
         # Ensure Security Group exists
         # Use a consistent naming convention for the SG, or per-instance. 
@@ -322,21 +963,55 @@ class EC2Creator:
         # but to follow "creating an ec2, a new sg group" strictly, we could make it per instance.
         # However, making it per instance might clutter. 
         # Let's create one unique per instance name to satisfy "new sg group" per creation flow implies specific to this deployment.
-        # Let's create one unique per instance name to satisfy "new sg group" per creation flow implies specific to this deployment.
         sg_name = "Nadav-CLI-SG"
-        security_group_id = self.create_security_group(sg_name)
-        if not security_group_id:
+
+        # A single instance is claimed from the warm pool when a matching one is waiting there
+        if count == 1:
+            claimed = self.claim_pool_instance(ami_input, instance_type_input, instance_name_input, key_input, sg_name, started,
+                                               hibernate)
+            if claimed:
+                return claimed
+
+        # With a cached AMI, a matching launch template can be found without any API call;
+        # launching from it skips the key pair and security group lookups
+        cached_ami_id = (self.get_cached_amis() or {}).get(ami_input)
+        template = self.find_launch_template(cached_ami_id, instance_type_input, key_input, sg_name, hibernate)
+        if template:
+            print(f"📄 Using launch template {template['LaunchTemplateId']} (v{template['Version']}), skipping key pair and security group checks.")
+
+        # Pre-flight: the aws user name, ami id, quota, key pair and security group
+        # don't depend on each other, so they are resolved at the same time (once per fleet)
+        with progress_spinner("Running pre-flight checks..."):
+            preflight, timings = self.run_preflight(ami_input, key_input, sg_name, count, full=template is None)
+        preflight_elapsed = time.monotonic() - started
+
+        # Checking the amount of instances (a failed quota step reads as None and was already reported):
+        if not preflight['quota_ok']:
+            if preflight['quota_ok'] is False:
+                print(f"❌ Error: You cannot have more than {self.LIMIT} instances.")
             return
+        # Only now that the quota allows the launch and the AMI is resolved are a missing
+        # key pair and security group created; stop if any of them couldn't be resolved
+        if not self.create_missing_prerequisites(preflight, key_input, sg_name):
+            return
+
+        aws_user = preflight['aws_user']
+        ami_id = preflight.get('ami_id', cached_ami_id)
 
-        # Creation of the instance:
-        # Creation of the instance:
+        # Creation of the instances (MinCount=MaxCount makes the launch all-or-nothing):
         try: 
-            with progress_spinner("Creating instance..."):
+            launch_started = time.monotonic()
+            if template is None:
+                template = self.find_launch_template(ami_id, instance_type_input, preflight['key_name'], sg_name, hibernate)
+            if template is None:
+                template = self.ensure_launch_template(
+                    ami_id, instance_type_input, preflight['key_name'], preflight['security_group_id'], sg_name, aws_user,
+                    hibernate
+                )
+
+            with progress_spinner(f"Creating {count} instance(s)..."):
                 response = self.client.run_instances(
-                    ImageId = ami_id,
-                    InstanceType = instance_type_input,
-                    KeyName = key_name,
-                    SecurityGroupIds = [security_group_id],
+                    LaunchTemplate={'LaunchTemplateId': template['LaunchTemplateId'], 'Version': template['Version']},
                     TagSpecifications=[
                         {
                             'ResourceType': 'instance',
@@ -347,62 +1022,171 @@ class EC2Creator:
                             ]
                         }
                     ],
-                    MinCount=1,
-                    MaxCount=1
+                    MinCount=count,
+                    MaxCount=count
                 )
-                new_instance_id = response['Instances'][0]['InstanceId']
+                new_instance_ids = [instance['InstanceId'] for instance in response['Instances']]
+
+                if not self.enforce_limit_after_launch(new_instance_ids):
+                    return
+                if count > 1:
+                    self.tag_fleet(new_instance_ids, instance_name_input)
+            launch_elapsed = time.monotonic() - launch_started
             
-            with progress_spinner("Waiting for instance to be running..."):
-                waiter = self.client.get_waiter('instance_running')
-                waiter.wait(InstanceIds=[new_instance_id])
+            wait_started = time.monotonic()
+            with progress_spinner(f"Waiting for {count} instance(s) to be running..."):
+                result = wait_for_instance_states(new_instance_ids, 'running', client=self.client)
+            self.print_timings(timings, {
+                'pre-flight (total)': preflight_elapsed,
+                'run_instances': launch_elapsed,
+                'wait for running': time.monotonic() - wait_started,
+                'create-to-running': time.monotonic() - started
+            })
+
+            ids_label = "Instance Id" if count == 1 else "Instance Ids"
+            if not result.succeeded:
+                print(f"⚠️  Launched, but not running yet: {', '.join(sorted(result.pending | set(result.failed)))}")
+                return(f"{ids_label}: {', '.join(new_instance_ids)}")
             
-            print("✅ Instance is up and running!")
-            return(f"Instance Id: {new_instance_id}")
+            print("✅ Instance is up and running!" if count == 1 else f"✅ All {count} instances are up and running!")
+            return(f"{ids_label}: {', '.join(new_instance_ids)}")
         
 
+        except ClientError as e:
+            if not _retried and e.response['Error']['Code'] in STALE_TEMPLATE_ERRORS:
+                # The template points at something that is gone; rebuild it from a full pre-flight
+                print(f"⚠️  Launch template is stale ({e.response['Error']['Code']}). Rebuilding it...")
+                self.forget_launch_template(ami_id, instance_type_input, key_input, sg_name, hibernate)
+                if e.response['Error']['Code'] == 'InvalidAMIID.NotFound':
+                    # The cached AMI was deregistered; resolve the alias from SSM again
+                    self.clear_ami_cache()
+                return self.create_instance(ami_input, instance_type_input, instance_name_input, key_input, count,
+                                            hibernate, _retried=True)
+            print(f"An error occured: {e}")
         except Exception as e:
             print(f"An error occured: {e}")
 
-def cleanup_ec2_resources():
-    ec2 = boto3.client('ec2', region_name='us-east-1')
+def terminate_platform_instances(keep_pool=False, pool_only=False, regions=None):
+    """
+    Terminates all platform instances in the given regions and waits until they are gone.
+    Warm pool members are included unless keep_pool is set; pool_only drains just the pool.
+    Returns True on success (including when there is nothing to terminate).
+    """
     try:
         # Find instances
-        response = ec2.describe_instances(
-            Filters=[
-                {
-                    'Name': 'tag:CreatedBy',
-                    'Values': ['Nadav-Platform-CLI']
-                },
-                {
-                    'Name': 'instance-state-name',
-                    'Values': ['running', 'pending', 'stopping', 'stopped']
-                }
-            ]
-        )
-        
-        instance_ids = []
-        for reservation in response.get('Reservations', []):
-            for instance in reservation.get('Instances', []):
-                instance_ids.append(instance['InstanceId'])
+        instances = scan_regions(lambda region: list(iter_platform_instances(get_ec2_client(region))), regions)
+        if keep_pool:
+            instances = [i for i in instances if not is_pool_instance(i)]
+        if pool_only:
+            instances = [i for i in instances if is_pool_instance(i)]
+        instance_ids = [instance['InstanceId'] for instance in instances]
         
         if not instance_ids:
             console.print("[green]✨ No platform EC2 instances found to clean.[/green]")
-            return
+            return True
 
-        console.print(f"[yellow]🗑️  Found {len(instance_ids)} instances to clean: {', '.join(instance_ids)}[/yellow]")
+        pool_count = sum(1 for i in instances if is_pool_instance(i))
+        pool_note = f" ({pool_count} from the warm pool)" if pool_count else ""
+        console.print(f"[yellow]🗑️  Found {len(instance_ids)} instances to clean{pool_note}: {', '.join(instance_ids)}[/yellow]")
         
-        # Terminate
-        ec2.terminate_instances(InstanceIds=instance_ids)
+        # Terminate, then wait for every region at the same time
+        by_region = {region: [i['InstanceId'] for i in items] for region, items in group_by_region(instances).items()}
+        for region, region_ids in by_region.items():
+            for batch in chunked(region_ids):
+                get_ec2_client(region).terminate_instances(InstanceIds=batch)
         
         with progress_spinner(f"Terminating {len(instance_ids)} instances..."):
-            waiter = ec2.get_waiter('instance_terminated')
-            waiter.wait(InstanceIds=instance_ids)
+            with ThreadPoolExecutor(max_workers=min(REGION_SCAN_WORKERS, len(by_region))) as pool:
+                results = list(pool.map(
+                    lambda region: wait_for_instance_states(by_region[region], 'terminated', client=get_ec2_client(region)),
+                    by_region
+                ))
+        pending = sorted(set().union(*(result.pending for result in results)))
+        if pending or not all(result.succeeded for result in results):
+            console.print(f"[bold red]❌ {len(pending)} instances did not finish terminating: {', '.join(pending)}[/bold red]")
+            return False
             
         console.print(f"[green]✅ Successfully terminated {len(instance_ids)} instances.[/green]")
-        
-        # Cleanup Security Groups
-        print("Cleaning up associated Security Groups...")
-        delete_security_groups()
+        return True
 
     except Exception as e:
         console.print(f"[bold red]❌ Error during EC2 cleanup:[/bold red] {e}")
+        return False
+
+def get_launch_templates(regions=None):
+    """
+    Returns the platform launch templates in the given regions, each with its 'Region'.
+    """
+    def scan(region):
+        paginator = get_ec2_client(region).get_paginator('describe_launch_templates')
+        pages = paginator.paginate(Filters=[{'Name': 'tag:CreatedBy', 'Values': ['Nadav-Platform-CLI']}])
+        return [template for page in pages for template in page.get('LaunchTemplates', [])]
+
+    return scan_regions(scan, regions)
+
+def delete_launch_templates(regions=None):
+    """
+    Deletes every platform launch template in the given regions and clears the local template index.
+    Returns True if all of them were deleted (and every region could be scanned).
+    """
+    all_deleted = True
+    try:
+        templates = get_launch_templates(regions)
+
+        for template in templates:
+            try:
+                get_ec2_client(template['Region']).delete_launch_template(LaunchTemplateId=template['LaunchTemplateId'])
+                print(f"✅ Deleted Launch Template: {template['LaunchTemplateName']}")
+            except ClientError as e:
+                all_deleted = False
+                print(f"❌ Error deleting {template['LaunchTemplateName']}: {e}")
+    except Exception as e:
+        console.print(f"[bold red]❌ Error listing launch templates:[/bold red] {e}")
+        return False
+
+    save_state_file(LAUNCH_TEMPLATE_INDEX_FILE, {})
+    return all_deleted
+
+def get_pool_instances(regions=None, skip_failed=False):
+    """
+    Returns the warm pool members (any non-terminated state).
+    """
+    return scan_regions(lambda region: list(iter_platform_instances(get_ec2_client(region), filters=pool_filters())), regions,
+                        skip_failed)
+
+def show_pool_status(regions=None):
+    members = get_pool_instances(regions, skip_failed=True)
+    if not members:
+        console.print("[yellow]♨️  The warm pool is empty.[/yellow]")
+        return
+
+    table = Table(title="♨️  Warm Pool", show_header=True, header_style="bold magenta")
+    table.add_column("Instance", style="cyan")
+    table.add_column("State")
+    table.add_column("Type")
+    table.add_column("AMI", style="dim")
+    table.add_column("Region", style="dim")
+    for instance in members:
+        table.add_row(instance['InstanceId'], instance['State']['Name'], instance['InstanceType'], instance['ImageId'],
+                      instance['Region'])
+    console.print(table)
+
+def cleanup_ec2_resources(keep_pool=False, regions=None):
+    if not terminate_platform_instances(keep_pool=keep_pool, regions=regions):
+        return False
+
+    if keep_pool:
+        try:
+            pool_members = get_pool_instances(regions)
+        except Exception as e:
+            console.print(f"[bold red]❌ Error listing the warm pool:[/bold red] {e}")
+            return False
+        if pool_members:
+            # The pool still uses the security group and launch templates
+            console.print("[dim]Keeping the security group and launch templates for the warm pool.[/dim]")
+            return True
+
+    # Cleanup Security Groups and the launch templates that reference them
+    print("Cleaning up associated Security Groups...")
+    groups_deleted = delete_security_groups(regions=regions)
+    return delete_launch_templates(regions) and groups_deleted
@@ -0,0 +1,76 @@
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+from src.utils.helpers import console
+from src.ec2.manager import get_instances, get_security_groups
+from src.s3.manager import get_buckets, get_s3_client
+from src.route53.manager import get_hosted_zones, get_route53_client
+
+# Resource types looked up through the Resource Groups Tagging API. Buckets are left out:
+# the API is regional (buckets in other regions would be missed) and keeps reporting
+# deleted buckets for a while, so they always go through the S3 classifier instead.
+PLATFORM_RESOURCE_TYPES = ['ec2:instance', 'ec2:security-group', 'route53:hostedzone']
+
+def get_tagged_resource_ids(region='us-east-1'):
+    """
+    Sweeps the Resource Groups Tagging API once for everything tagged
+    CreatedBy=Nadav-Platform-CLI and groups the resource IDs by kind.
+    Raises ClientError/BotoCoreError if the tagging API can't be used.
+    """
+    tagging = boto3.client('resourcegroupstaggingapi', region_name=region)
+    paginator = tagging.get_paginator('get_resources')
+
+    resource_ids = {'instances': [], 'security_groups': [], 'zones': []}
+    pages = paginator.paginate(
+        TagFilters=[{'Key': 'CreatedBy', 'Values': ['Nadav-Platform-CLI']}],
+        ResourceTypeFilters=PLATFORM_RESOURCE_TYPES
+    )
+    for page in pages:
+        for mapping in page.get('ResourceTagMappingList', []):
+            # arn:partition:service:region:account:resource
+            arn_parts = mapping['ResourceARN'].split(':', 5)
+            service, resource = arn_parts[2], arn_parts[5]
+            if service == 'ec2' and resource.startswith('instance/'):
+                resource_ids['instances'].append(resource.split('/')[-1])
+            elif service == 'ec2' and resource.startswith('security-group/'):
+                resource_ids['security_groups'].append(resource.split('/')[-1])
+            elif service == 'route53' and resource.startswith('hostedzone/'):
+                resource_ids['zones'].append(resource.split('/')[-1])
+
+    return resource_ids
+
+def get_inventory_collectors():
+    """
+    Returns {'instances', 'security_groups', 'buckets', 'zones'} mapped to callables
+    that each fetch the platform resources of one kind, so callers can run them concurrently.
+    For instances, security groups and zones the tagging API tells the collectors exactly which
+    resources to describe, so the number of calls follows the number of platform resources.
+    If it is unavailable, those services are scanned with their own listing path instead.
+    Buckets are always found by the S3 classifier, which covers every region.
+    """
+    # boto3 client creation isn't thread-safe, so the shared clients are built here,
+    # before the collectors run in parallel
+    get_s3_client()
+    r53 = get_route53_client()
+
+    try:
+        resource_ids = get_tagged_resource_ids()
+    except (ClientError, BotoCoreError) as e:
+        console.print(f"[dim]Tagging API unavailable ({e}), scanning each service instead...[/dim]")
+        return {
+            'instances': get_instances,
+            'security_groups': get_security_groups,
+            'buckets': get_buckets,
+            'zones': lambda: get_hosted_zones(r53=r53, skip_unreadable=True)
+        }
+
+    # The tagging API can still report resources for a while after deletion,
+    # so each ID is confirmed against its own service before being shown.
+    instance_ids = resource_ids['instances']
+    group_ids = resource_ids['security_groups']
+    zone_ids = resource_ids['zones']
+    return {
+        'instances': lambda: get_instances(instance_ids) if instance_ids else [],
+        'security_groups': lambda: get_security_groups(group_ids) if group_ids else [],
+        'buckets': get_buckets,
+        'zones': lambda: get_hosted_zones(zone_ids, r53) if zone_ids else []
+    }
@@ -1,12 +1,82 @@
+import time
+from typing import Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from rich.console import Group
+from rich.live import Live
 from rich.table import Table
 from src.utils.helpers import console, progress_spinner
-from src.ec2.manager import get_instances, cleanup_ec2_resources, get_security_groups, delete_security_groups
-from src.s3.manager import get_buckets, cleanup_s3_resources
-from src.route53.manager import get_hosted_zones, cleanup_dns_resources
+from src.utils.scheduler import DagScheduler
+from src.ec2.manager import (
+    delete_security_groups, terminate_platform_instances, delete_launch_templates, is_pool_instance,
+    iter_platform_instances, get_security_groups, get_launch_templates
+)
+from src.s3.manager import cleanup_s3_resources, iter_platform_buckets, get_cleanup_client, get_s3_client
+from src.route53.manager import cleanup_dns_resources, discover_platform_zones, get_route53_client
+from src.inventory import get_inventory_collectors
 
-def list_all_resources():
+def _instance_rows(instances):
+    rows = []
+    for inst in instances:
+        name_tag = next((tag['Value'] for tag in inst.get('Tags', []) if tag['Key'] == 'Name'), "N/A")
+        state = inst['State']['Name']
+        state_color = "green" if state == "running" else "red" if state in ["stopped", "terminated"] else "yellow"
+        pool_note = "\nWarm pool" if is_pool_instance(inst) else ""
+        
+        rows.append((
+            "EC2 Instance", 
+            f"{name_tag}\n({inst['InstanceId']})", 
+            f"[{state_color}]{state.upper()}[/{state_color}]", 
+            f"Type: {inst['InstanceType']}\nIP: {inst.get('PublicIpAddress', 'N/A')}{pool_note}"
+        ))
+    return rows
+
+def _security_group_rows(sgs):
+    rows = []
+    for sg in sgs:
+        name_tag = next((tag['Value'] for tag in sg.get('Tags', []) if tag['Key'] == 'Name'), "N/A")
+        
+        rows.append((
+            "Security Group",
+            f"{name_tag}\n({sg['GroupId']})",
+            "[green]ACTIVE[/green]",
+            f"Description: {sg.get('Description', 'N/A')}"
+        ))
+    return rows
+
+def _bucket_rows(buckets):
+    return [
+        (
+            "S3 Bucket", 
+            bucket, 
+            "[green]ACTIVE[/green]", 
+            "Region: us-east-1" # Assuming us-east-1 as it's the default, fetching logic could be improved if needed
+        )
+        for bucket in buckets
+    ]
+
+def _zone_rows(zones):
+    rows = []
+    for zone in zones:
+        record_count = zone['ResourceRecordSetCount']
+        rows.append((
+            "DNS Zone", 
+            f"{zone['Name']}\n({zone['Id']})", 
+            "[green]ACTIVE[/green]", 
+            f"{record_count} Records"
+        ))
+    return rows
+
+# Sections of the overview, in display order: (inventory kind, label, row builder)
+SECTIONS = [
+    ('instances', 'EC2 Instances', _instance_rows),
+    ('security_groups', 'Security Groups', _security_group_rows),
+    ('buckets', 'S3 Buckets', _bucket_rows),
+    ('zones', 'Route53 Zones', _zone_rows),
+]
+
+def _render_overview(results):
     """
-    Lists all resources (EC2, S3, Route53) created by the platform in a table.
+    Builds the resources table (rows of finished sections) and a per-section status table.
     """
     table = Table(title="☁️  Platform Resources Overview", show_header=True, header_style="bold magenta")
     
@@ -15,73 +85,72 @@ def list_all_resources():
     table.add_column("Status / Details", style="yellow")
     table.add_column("Additional Info", style="dim")
 
-    has_resources = False
+    status = Table(show_header=True, header_style="bold blue", box=None)
+    status.add_column("Service", style="cyan")
+    status.add_column("Status")
+    status.add_column("Found", justify="right")
+    status.add_column("Time", justify="right", style="dim")
+
+    for kind, label, _ in SECTIONS:
+        result = results[kind]
+        if result['state'] == 'loading':
+            status.add_row(label, "[yellow]⏳ Loading...[/yellow]", "-", "-")
+            continue
+
+        elapsed = f"{result['elapsed']:.2f}s"
+        if result['state'] == 'error':
+            status.add_row(label, f"[bold red]❌ {result['error']}[/bold red]", "-", elapsed)
+            continue
+
+        for row in result['rows']:
+            table.add_row(*row)
+        status.add_row(label, "[green]✅ Done[/green]", str(len(result['rows'])), elapsed)
 
+    if table.row_count:
+        return Group(table, status)
+    return status
+
+def list_all_resources():
+    """
+    Lists all resources (EC2, S3, Route53) created by the platform in a table.
+    Every service is queried concurrently and its rows appear as soon as it returns.
+    """
     try:
-        with progress_spinner("Gathering all platform resources..."):
-            # 1. EC2 Instances
-            instances = get_instances()
-            for inst in instances:
-                has_resources = True
-                name_tag = next((tag['Value'] for tag in inst.get('Tags', []) if tag['Key'] == 'Name'), "N/A")
-                state = inst['State']['Name']
-                state_color = "green" if state == "running" else "red" if state in ["stopped", "terminated"] else "yellow"
-                
-                table.add_row(
-                    "EC2 Instance", 
-                    f"{name_tag}\n({inst['InstanceId']})", 
-                    f"[{state_color}]{state.upper()}[/{state_color}]", 
-                    f"Type: {inst['InstanceType']}\nIP: {inst.get('PublicIpAddress', 'N/A')}"
-                )
-
-            # 1.5 Security Groups
-            sgs = get_security_groups()
-            for sg in sgs:
-                has_resources = True
-                name_tag = next((tag['Value'] for tag in sg.get('Tags', []) if tag['Key'] == 'Name'), "N/A")
-                
-                table.add_row(
-                    "Security Group",
-                    f"{name_tag}\n({sg['GroupId']})",
-                    "[green]ACTIVE[/green]",
-                    f"Description: {sg.get('Description', 'N/A')}"
-                )
-
-            # 2. S3 Buckets
-            buckets = get_buckets()
-            for bucket in buckets:
-                has_resources = True
-                table.add_row(
-                    "S3 Bucket", 
-                    bucket, 
-                    "[green]ACTIVE[/green]", 
-                    "Region: us-east-1" # Assuming us-east-1 as it's the default, fetching logic could be improved if needed
-                )
-
-            # 3. Route53 Zones
-            zones = get_hosted_zones()
-            for zone in zones:
-                has_resources = True
-                record_count = len(zone['Records'])
-                table.add_row(
-                    "DNS Zone", 
-                    f"{zone['Name']}\n({zone['Id']})", 
-                    "[green]ACTIVE[/green]", 
-                    f"{record_count} Records"
-                )
-
-        if has_resources:
-            console.print(table)
-        else:
+        with progress_spinner("Resolving platform resources..."):
+            collectors = get_inventory_collectors()
+
+        results: dict[str, dict[str, Any]] = {kind: {'state': 'loading'} for kind, _, _ in SECTIONS}
+        row_builders = {kind: build_rows for kind, _, build_rows in SECTIONS}
+
+        def collect(kind):
+            started = time.monotonic()
+            try:
+                rows = row_builders[kind](collectors[kind]())
+                return kind, {'state': 'done', 'rows': rows, 'elapsed': time.monotonic() - started}
+            except Exception as e:
+                return kind, {'state': 'error', 'error': str(e), 'elapsed': time.monotonic() - started}
+
+        with Live(_render_overview(results), console=console, refresh_per_second=8) as live:
+            with ThreadPoolExecutor(max_workers=len(SECTIONS)) as pool:
+                futures = [pool.submit(collect, kind) for kind, _, _ in SECTIONS]
+                for future in as_completed(futures):
+                    kind, result = future.result()
+                    results[kind] = result
+                    live.update(_render_overview(results))
+
+        has_resources = any(result.get('rows') for result in results.values())
+        has_errors = any(result['state'] == 'error' for result in results.values())
+        if not has_resources and not has_errors:
             console.print("\n[bold yellow]✨ No platform resources found.[/bold yellow]")
 
     except Exception as e:
         console.print(f"[bold red]❌ Error listing all resources:[/bold red] {e}")
 
 
-def cleanup_all_resources():
+def cleanup_all_resources(fresh=False):
     """
     Cleans up ALL resources created by the platform.
+    A recent failed run is resumed unless fresh is set.
     """
     console.print("[bold red]⚠️  WARNING: This will DESTROY ALL resources created by this CLI tool![/bold red]")
     confirm = input("Are you SURE you want to proceed? Type 'delete-all' to confirm: ")
@@ -93,19 +162,35 @@ def cleanup_all_resources():
     console.print("\n[bold red]🚀 Starting Global Cleanup...[/bold red]")
     
     try:
-        # 1. Clean EC2
-        console.print("\n[bold cyan]--- Cleaning EC2 Resources ---[/bold cyan]")
-        cleanup_ec2_resources()
-        
-        # 2. Clean S3
-        console.print("\n[bold cyan]--- Cleaning S3 Resources ---[/bold cyan]")
-        cleanup_s3_resources()
-        
-        # 3. Clean Route53
-        console.print("\n[bold cyan]--- Cleaning Route53 Resources ---[/bold cyan]")
-        cleanup_dns_resources()
-        
-        console.print("\n[bold green]✨ Global Cleanup Complete! ✨[/bold green]")
+        # boto3 client creation isn't thread-safe, so the clients the steps and their
+        # verifies share are built here, before they run in parallel
+        s3_cleanup_client = get_cleanup_client()
+        get_s3_client()
+        r53 = get_route53_client()
+
+        # Instances must be gone before their security groups can be deleted;
+        # S3 and Route53 don't depend on anything and run alongside EC2.
+        # Each verify is a cheap "is anything left?" scan, used before skipping a resumed step
+        scheduler = DagScheduler(state_file="cleanup_all_state.json", fresh=fresh)
+        scheduler.add("ec2-instances", terminate_platform_instances,
+                      verify=lambda: next(iter_platform_instances(), None) is None)
+        scheduler.add("ec2-security-groups", delete_security_groups, depends_on=["ec2-instances"],
+                      verify=lambda: not get_security_groups())
+        scheduler.add("ec2-launch-templates", delete_launch_templates,
+                      verify=lambda: not get_launch_templates())
+        scheduler.add("s3-buckets", lambda: cleanup_s3_resources(s3_cleanup_client),
+                      verify=lambda: next(iter_platform_buckets(), None) is None)
+        scheduler.add("route53-zones", lambda: cleanup_dns_resources(r53),
+                      verify=lambda: not discover_platform_zones(r53))
+
+        results = scheduler.run()
+        console.print()
+        scheduler.print_summary(results, title="🧹 Global Cleanup Summary")
+
+        if all(result['status'] in ('done', 'resumed') for result in results.values()):
+            console.print("\n[bold green]✨ Global Cleanup Complete! ✨[/bold green]")
+        else:
+            console.print("\n[bold yellow]⚠️  Cleanup incomplete. Run 'awsctl cleanup-all' again to resume the remaining steps.[/bold yellow]")
         
     except Exception as e:
         console.print(f"[bold red]❌ Error during global cleanup:[/bold red] {e}")
@@ -1,8 +1,280 @@
 import boto3
-from src.utils.helpers import console, get_aws_user, progress_spinner
+import json
+from botocore.config import Config
+from click import ClickException
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.utils.helpers import console, get_aws_user, progress_spinner, RateLimiter
+from src.utils.waiter import wait_until
+from src.route53.record_files import load_changes, normalize_name, DEFAULT_TTL
 
 current_user = get_aws_user()
 
+# Route53 throttles the whole account at 5 requests per second
+ROUTE53_RATE_LIMIT = 5
+# list_tags_for_resources accepts up to 10 zone IDs per call
+TAG_BATCH_SIZE = 10
+DISCOVERY_WORKERS = 4
+ZONE_TEARDOWN_WORKERS = 4
+
+# list_resource_record_sets returns at most 300 record sets per page
+RECORDS_PAGE_SIZE = 300
+# A single name/type lookup rarely has more record sets than this (weighted/latency sets)
+LOOKUP_PAGE_SIZE = 10
+# Per ChangeResourceRecordSets request: ResourceRecord elements and characters across
+# all Value elements. UPSERT changes count twice towards both limits.
+MAX_BATCH_RECORDS = 1000
+MAX_BATCH_VALUE_CHARS = 32000
+# Alias changes have no ResourceRecords, so the number of changes is capped separately
+MAX_BATCH_CHANGES = 1000
+
+route53_limiter = RateLimiter(ROUTE53_RATE_LIMIT)
+
+def get_route53_client():
+    # Adaptive retries back off on Throttling errors instead of failing the scan
+    return boto3.client('route53', config=Config(retries={'max_attempts': 10, 'mode': 'adaptive'}))
+
+def iter_hosted_zones(r53):
+    """
+    Yields every hosted zone in the account, following NextMarker across pages.
+    """
+    kwargs = {}
+    while True:
+        route53_limiter.acquire()
+        response = r53.list_hosted_zones(**kwargs)
+        yield from response.get('HostedZones', [])
+        if not response.get('IsTruncated'):
+            return
+        kwargs['Marker'] = response['NextMarker']
+
+def get_zone_tags(r53, zone_ids):
+    """
+    Returns {zone_id: {tag_key: tag_value}} for up to 10 zones in a single call.
+    """
+    route53_limiter.acquire()
+    response = r53.list_tags_for_resources(ResourceType='hostedzone', ResourceIds=list(zone_ids))
+    return {
+        tag_set['ResourceId']: {t['Key']: t['Value'] for t in tag_set.get('Tags', [])}
+        for tag_set in response.get('ResourceTagSets', [])
+    }
+
+def read_zone_tags(r53, zone_ids):
+    """
+    get_zone_tags for a batch, retrying the zones one at a time if the batch call fails,
+    so one bad zone can't hide the others. A zone deleted since it was listed is skipped.
+    Returns (tags by zone, IDs of zones whose tags could not be read).
+    """
+    try:
+        return get_zone_tags(r53, zone_ids), []
+    except Exception:
+        pass
+
+    tags_by_zone, unreadable = {}, []
+    for zone_id in zone_ids:
+        try:
+            tags_by_zone.update(get_zone_tags(r53, [zone_id]))
+        except r53.exceptions.NoSuchHostedZone:
+            continue
+        except Exception as e:
+            unreadable.append(zone_id)
+            console.print(f"[dim]⚠️  Could not read the tags of zone {zone_id}: {e}[/dim]")
+    return tags_by_zone, unreadable
+
+def wait_for_changes(r53, change_ids, timeout=None):
+    """
+    Waits until every Route53 change batch is INSYNC, polling GetChange under the
+    shared rate limiter. Returns the wait engine's WaitResult.
+    """
+    def poll(pending_ids):
+        states = {}
+        for change_id in pending_ids:
+            route53_limiter.acquire()
+            states[change_id] = r53.get_change(Id=change_id)['ChangeInfo']['Status']
+        return states
+
+    result = wait_until(change_ids, poll, is_ready=lambda status: status == 'INSYNC', timeout=timeout)
+    result.print_metrics("DNS changes")
+    return result
+
+def iter_records(r53, zone_id, start_name=None, start_type=None, start_identifier=None, page_size=RECORDS_PAGE_SIZE):
+    """
+    Yields the zone's record sets in Route53 order, one page at a time, following
+    NextRecordName/NextRecordType/NextRecordIdentifier. Optionally starts at a given record.
+    """
+    kwargs = {'HostedZoneId': zone_id, 'MaxItems': str(page_size)}
+    if start_name:
+        kwargs['StartRecordName'] = start_name
+        if start_type:
+            kwargs['StartRecordType'] = start_type
+            if start_identifier:
+                kwargs['StartRecordIdentifier'] = start_identifier
+
+    while True:
+        route53_limiter.acquire()
+        response = r53.list_resource_record_sets(**kwargs)
+        yield from response.get('ResourceRecordSets', [])
+        if not response.get('IsTruncated'):
+            return
+        kwargs['StartRecordName'] = response['NextRecordName']
+        kwargs.pop('StartRecordType', None)
+        kwargs.pop('StartRecordIdentifier', None)
+        if response.get('NextRecordType'):
+            kwargs['StartRecordType'] = response['NextRecordType']
+        if response.get('NextRecordIdentifier'):
+            kwargs['StartRecordIdentifier'] = response['NextRecordIdentifier']
+
+def change_weight(change):
+    """
+    Returns (ResourceRecord elements, Value characters) a change counts for in a batch.
+    """
+    values = [r['Value'] for r in change['ResourceRecordSet'].get('ResourceRecords', [])]
+    factor = 2 if change['Action'] == 'UPSERT' else 1
+    return factor * len(values), factor * sum(len(value) for value in values)
+
+def pack_changes(changes, max_records=MAX_BATCH_RECORDS, max_chars=MAX_BATCH_VALUE_CHARS,
+                 max_changes=MAX_BATCH_CHANGES):
+    """
+    Groups an iterable of changes into as few change batches as the Route53 limits allow,
+    yielding each batch (a list of changes) as soon as it is full.
+    """
+    batch, records, chars = [], 0, 0
+    for change in changes:
+        change_records, change_chars = change_weight(change)
+        if batch and (len(batch) >= max_changes or records + change_records > max_records
+                      or chars + change_chars > max_chars):
+            yield batch
+            batch, records, chars = [], 0, 0
+        batch.append(change)
+        records += change_records
+        chars += change_chars
+    if batch:
+        yield batch
+
+def submit_changes(r53, zone_id, changes, comment='Managed by Nadav-Platform-CLI', change_ids=None):
+    """
+    Packs the changes into batches and submits them under the shared rate limiter.
+    Returns the change IDs, for wait_for_changes. Pass a list as change_ids to keep
+    the IDs of the batches already committed if a later batch fails.
+    """
+    change_ids = [] if change_ids is None else change_ids
+    for batch in pack_changes(changes):
+        route53_limiter.acquire()
+        response = r53.change_resource_record_sets(
+            HostedZoneId=zone_id,
+            ChangeBatch={'Comment': comment, 'Changes': batch}
+        )
+        change_ids.append(response['ChangeInfo']['Id'])
+    return change_ids
+
+def print_committed_batches(change_ids, changes):
+    """
+    After a failed submit_changes, says which batches Route53 had already committed.
+    """
+    total = sum(1 for _ in pack_changes(changes))
+    if change_ids:
+        console.print(f"[yellow]⚠️  {len(change_ids)} of {total} change batches were applied before the error "
+                      f"({', '.join(change_id.split('/')[-1] for change_id in change_ids)}).[/yellow]")
+    else:
+        console.print(f"[yellow]⚠️  None of the {total} change batches were applied.[/yellow]")
+
+def lookup_record_sets(r53, zone_id, name, record_type=None):
+    """
+    Returns the record sets with exactly this name (and type), starting the listing at
+    that record with StartRecordName/StartRecordType. Further pages are read only while
+    Route53 says the next record still matches.
+    """
+    kwargs = {'HostedZoneId': zone_id, 'StartRecordName': name, 'MaxItems': str(LOOKUP_PAGE_SIZE)}
+    if record_type:
+        kwargs['StartRecordType'] = record_type
+
+    def matches(record_name, record_type_):
+        return record_name.lower() == name.lower() and (record_type is None or record_type_ == record_type)
+
+    found = []
+    while True:
+        route53_limiter.acquire()
+        response = r53.list_resource_record_sets(**kwargs)
+        page = response.get('ResourceRecordSets', [])
+        found.extend(record for record in page if matches(record['Name'], record['Type']))
+        if not response.get('IsTruncated') or not matches(response['NextRecordName'], response['NextRecordType']):
+            return found
+        kwargs.update(StartRecordName=response['NextRecordName'], StartRecordType=response['NextRecordType'])
+        kwargs.pop('StartRecordIdentifier', None)
+        if response.get('NextRecordIdentifier'):
+            kwargs['StartRecordIdentifier'] = response['NextRecordIdentifier']
+
+def iter_subtree_records(r53, zone_id, name):
+    """
+    Yields the records at `name` and below it. Route53 sorts names by their labels in reverse
+    (com.example.api, com.example.api.v1, ...), so a subtree is one contiguous run:
+    the scan starts at `name` and stops at the first name outside it.
+    """
+    suffix = '.' + name.lower()
+    for record in iter_records(r53, zone_id, start_name=name):
+        record_name = record['Name'].lower()
+        if record_name != name.lower() and not record_name.endswith(suffix):
+            return
+        yield record
+
+def format_record_value(record):
+    if 'ResourceRecords' in record:
+        return ", ".join(r['Value'] for r in record['ResourceRecords'])
+    if 'AliasTarget' in record:
+        return f"Alias -> {record['AliasTarget']['DNSName']}"
+    return "No Value"
+
+def is_apex_record(record, zone_name):
+    """
+    The apex NS and SOA records belong to the zone itself and can't be deleted.
+    """
+    return record['Type'] in ('NS', 'SOA') and record['Name'].rstrip('.') == zone_name.rstrip('.')
+
+def is_platform_zone(r53, zone_id):
+    tags = get_zone_tags(r53, [zone_id]).get(zone_id, {})
+    return tags.get('CreatedBy') == 'Nadav-Platform-CLI'
+
+def discover_platform_zones(r53=None, skip_unreadable=False):
+    """
+    Returns the platform zones as dicts (Id, Name, ResourceRecordSetCount).
+    Zones are paginated and their tags resolved in batches of 10 by a
+    rate-limited worker pool, so tagging runs while later pages are still listed.
+    Raises if some zone's tags can't be read, since it may be a platform zone;
+    listings pass skip_unreadable to show the zones that could be read.
+    """
+    r53 = r53 or get_route53_client()
+    zones = []
+    futures = []
+
+    with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as pool:
+        batch = []
+        for zone in iter_hosted_zones(r53):
+            zones.append(zone)
+            batch.append(zone['Id'].split('/')[-1])
+            if len(batch) == TAG_BATCH_SIZE:
+                futures.append(pool.submit(read_zone_tags, r53, batch))
+                batch = []
+        if batch:
+            futures.append(pool.submit(read_zone_tags, r53, batch))
+
+        tags_by_zone, unreadable = {}, []
+        for future in futures:
+            batch_tags, batch_unreadable = future.result()
+            tags_by_zone.update(batch_tags)
+            unreadable.extend(batch_unreadable)
+
+    if unreadable and not skip_unreadable:
+        raise Exception(f"Could not read the tags of {len(unreadable)} zones: {', '.join(unreadable)}")
+
+    platform_zones = []
+    for zone in zones:
+        zone_id = zone['Id'].split('/')[-1]
+        if tags_by_zone.get(zone_id, {}).get('CreatedBy') == 'Nadav-Platform-CLI':
+            platform_zones.append({
+                'Id': zone_id,
+                'Name': zone['Name'],
+                'ResourceRecordSetCount': zone.get('ResourceRecordSetCount', 0)
+            })
+    return platform_zones
+
 def create_hosted_zones(domain_name):
     route53_client = boto3.client('route53')
 
@@ -33,46 +305,72 @@ def create_hosted_zones(domain_name):
         console.print(f"[bold red]❌ Error:[/bold red] {e}")
         return None
 
-def get_hosted_zones():
+def get_zones_by_id(r53, zone_ids):
     """
-    Returns a list of dictionaries with zone details (id, name, records) for platform zones.
+    Returns zone dicts (Id, Name, ResourceRecordSetCount) for known zone IDs,
+    skipping zones that no longer exist.
     """
-    r53 = boto3.client('route53')
-    zones_response = r53.list_hosted_zones()
-    
-    platform_zones = []
-    
-    for zone in zones_response.get('HostedZones', []):
-        zone_id = zone['Id'].split('/')[-1]
-        
-        # Check the tags for current zone
+    def fetch_zone(zone_id):
+        route53_limiter.acquire()
         try:
-            tag_response = r53.list_tags_for_resource(
-                ResourceType='hostedzone',
-                ResourceId=zone_id
-            )
-            tags = {t['Key']: t['Value'] for t in tag_response['ResourceTagSet']['Tags']}
-            
-            if tags.get('CreatedBy') == 'Nadav-Platform-CLI':
-                # Fetch records for this zone to return complete data
-                records_response = r53.list_resource_record_sets(HostedZoneId=zone_id)
-                records = records_response.get('ResourceRecordSets', [])
-                
-                platform_zones.append({
-                    'Id': zone_id,
-                    'Name': zone['Name'],
-                    'Records': records
-                })
-        except Exception:
-            # Skip if any error checking tags (e.g. permission issues)
-            continue
-            
+            zone = r53.get_hosted_zone(Id=zone_id)['HostedZone']
+        except r53.exceptions.NoSuchHostedZone:
+            return None
+        return {
+            'Id': zone_id,
+            'Name': zone['Name'],
+            'ResourceRecordSetCount': zone.get('ResourceRecordSetCount', 0)
+        }
+
+    with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as pool:
+        return [zone for zone in pool.map(fetch_zone, zone_ids) if zone]
+
+def get_platform_zone(r53, zone_id):
+    """
+    Returns the zone dict (Id, Name, ResourceRecordSetCount) of a platform zone, or prints
+    why the zone can't be used (not tagged by the CLI, or gone) and returns None.
+    """
+    if not is_platform_zone(r53, zone_id):
+        console.print(f"[bold red]❌ Access Denied:[/bold red] Zone {zone_id} is not managed by this CLI.")
+        return None
+    zones = get_zones_by_id(r53, [zone_id])
+    if not zones:
+        console.print(f"[bold red]❌ Zone {zone_id} was not found.[/bold red]")
+        return None
+    return zones[0]
+
+class LazyRecords:
+    """
+    A zone's record sets, read page by page only when iterated.
+    Nothing is kept in memory; every iteration reads the zone again.
+    """
+    def __init__(self, r53, zone_id):
+        self.r53 = r53
+        self.zone_id = zone_id
+
+    def __iter__(self):
+        return iter_records(self.r53, self.zone_id)
+
+def get_hosted_zones(zone_ids=None, r53=None, skip_unreadable=False):
+    """
+    Returns a list of dictionaries with zone details (id, name, record count) for platform zones.
+    'Records' is a LazyRecords: summaries use ResourceRecordSetCount and never read the records.
+    When zone_ids is given (e.g. from the tagging API), discovery is skipped.
+    """
+    r53 = r53 or get_route53_client()
+    if zone_ids is None:
+        platform_zones = discover_platform_zones(r53, skip_unreadable)
+    else:
+        platform_zones = get_zones_by_id(r53, zone_ids)
+
+    for zone in platform_zones:
+        zone['Records'] = LazyRecords(r53, zone['Id'])
     return platform_zones
 
 def list_my_dns():
     try:
         with progress_spinner("Listing Hosted Zones..."):
-            zones = get_hosted_zones()
+            zones = get_hosted_zones(skip_unreadable=True)
             
             if not zones:
                 console.print("[bold yellow]⚠️  No platform DNS zones found matching your criteria.[/bold yellow]")
@@ -82,37 +380,57 @@ def list_my_dns():
                 console.print(f"\n[bold cyan]📍 Hosted Zone: {zone['Name']} ({zone['Id']})[/bold cyan]")
                 
                 for record in zone['Records']:
-                    if 'ResourceRecords' in record:
-                        values = [r['Value'] for r in record['ResourceRecords']]
-                        value_str = ", ".join(values)
-                    elif 'AliasTarget' in record:
-                        value_str = f"Alias -> {record['AliasTarget']['DNSName']}"
-                    else:
-                        value_str = "No Value"
-
-                    console.print(f"  [yellow]•[/yellow] [bold]{record['Name']}[/bold] [cyan][{record['Type']}][/cyan] -> {value_str}")
+                    console.print(f"  [yellow]•[/yellow] [bold]{record['Name']}[/bold] [cyan][{record['Type']}][/cyan] -> {format_record_value(record)}")
 
     except Exception as e:
         console.print(f"[bold red]❌ Error:[/bold red] {e}")
 
+def get_dns_records(zone_id, record_name, record_type=None, subtree=False, as_json=False):
+    """
+    Prints one record set (by name and optional type), or with subtree every record at and
+    below the name, reading only that part of the zone.
+    """
+    r53 = get_route53_client()
+    clean_zone_id = zone_id.split('/')[-1]
 
+    try:
+        zone = get_platform_zone(r53, clean_zone_id)
+        if zone is None:
+            return False
 
-def manage_dns_record(zone_id, action, record_name, record_type, value):
-  
-    route53_client = boto3.client('route53')
+        name = normalize_name(record_name, zone['Name'])
+        record_type = record_type.upper() if record_type else None
+        if subtree:
+            records = [r for r in iter_subtree_records(r53, clean_zone_id, name) if record_type in (None, r['Type'])]
+        else:
+            records = lookup_record_sets(r53, clean_zone_id, name, record_type)
+
+        if as_json:
+            print(json.dumps(records, indent=2))
+            return bool(records)
+        if not records:
+            console.print(f"[yellow]⚠️  No {record_type or ''} records found for {name}.[/yellow]")
+            return False
+        for record in records:
+            identifier = f" ({record['SetIdentifier']})" if 'SetIdentifier' in record else ""
+            ttl = f" TTL {record['TTL']}" if 'TTL' in record else ""
+            console.print(f"  [yellow]•[/yellow] [bold]{record['Name']}[/bold]{identifier} [cyan][{record['Type']}][/cyan]{ttl} -> {format_record_value(record)}")
+        return True
+
+    except Exception as e:
+        console.print(f"[bold red]❌ Route53 Error:[/bold red] {e}")
+        return False
+
+
+
+def manage_dns_record(zone_id, action, record_name, record_type, value, wait=False, ttl=DEFAULT_TTL):
+    route53_client = get_route53_client()
     
     clean_zone_id = zone_id.split('/')[-1]
 
     try:
-        # 2Check the 
-        tag_response = route53_client.list_tags_for_resource(
-            ResourceType='hostedzone',
-            ResourceId=clean_zone_id
-        )
-        
-        tags = {t['Key']: t['Value'] for t in tag_response['ResourceTagSet']['Tags']}
         # Check the tag
-        if tags.get('CreatedBy') != 'Nadav-Platform-CLI':
+        if not is_platform_zone(route53_client, clean_zone_id):
             console.print(f"[bold red]❌ Access Denied:[/bold red] Zone {clean_zone_id} is not managed by this CLI.")
             return False
 
@@ -125,7 +443,7 @@ def manage_dns_record(zone_id, action, record_name, record_type, value):
                     'ResourceRecordSet': {
                         'Name': record_name,
                         'Type': record_type, 
-                        'TTL': 300,
+                        'TTL': ttl,
                         'ResourceRecords': [{'Value': value}]
                     }
                 }
@@ -139,63 +457,128 @@ def manage_dns_record(zone_id, action, record_name, record_type, value):
         )
         
         console.print(f"[green]✅ DNS {action} successful for {record_name}![/green]")
+
+        if wait:
+            with progress_spinner("Waiting for the change to propagate (INSYNC)..."):
+                result = wait_for_changes(route53_client, [response['ChangeInfo']['Id']])
+            if not result.succeeded:
+                console.print("[yellow]⚠️  The change is still PENDING.[/yellow]")
+                return False
+            console.print("[green]✅ Change is INSYNC on all Route53 name servers.[/green]")
         return True
 
     except Exception as e:
         console.print(f"[bold red]❌ Route53 Error:[/bold red] {e}")
         return False
 
-def cleanup_dns_resources():
-    r53 = boto3.client('route53')
+def apply_record_file(zone_id, path, file_format=None, wait=False):
+    """
+    Applies every CREATE/UPSERT/DELETE in a YAML, CSV or BIND zone file to one zone:
+    the zone tags are checked once and the changes go out in as few batches as the limits allow.
+    """
+    r53 = get_route53_client()
+    clean_zone_id = zone_id.split('/')[-1]
+
+    try:
+        zone = get_platform_zone(r53, clean_zone_id)
+        if zone is None:
+            return False
+
+        changes = load_changes(path, zone['Name'], file_format)
+        if not changes:
+            console.print("[yellow]⚠️  The file has no records to apply.[/yellow]")
+            return True
+
+        change_ids = []
+        try:
+            with progress_spinner(f"Applying {len(changes)} record changes..."):
+                submit_changes(r53, clean_zone_id, changes, change_ids=change_ids)
+        except Exception:
+            print_committed_batches(change_ids, changes)
+            raise
+        console.print(f"[green]✅ Applied {len(changes)} record changes in {len(change_ids)} change batches.[/green]")
+
+        if wait:
+            with progress_spinner(f"Waiting for {len(change_ids)} change batches to propagate (INSYNC)..."):
+                result = wait_for_changes(r53, change_ids)
+            if not result.succeeded:
+                console.print(f"[yellow]⚠️  {len(result.pending)} change batches are still PENDING.[/yellow]")
+                return False
+            console.print("[green]✅ All changes are INSYNC on all Route53 name servers.[/green]")
+        return True
+
+    except ClickException:
+        raise
+    except r53.exceptions.NoSuchHostedZone:
+        console.print(f"[bold red]❌ Zone {clean_zone_id} was not found.[/bold red]")
+        return False
+    except r53.exceptions.InvalidChangeBatch as e:
+        console.print(f"[bold red]❌ Route53 rejected a change batch:[/bold red] {e}")
+        return False
+    except (OSError, ValueError) as e:
+        console.print(f"[bold red]❌ Could not read {path}:[/bold red] {e}")
+        return False
+    except Exception as e:
+        console.print(f"[bold red]❌ Route53 Error:[/bold red] {e}")
+        return False
+
+def teardown_zone(r53, zone):
+    """
+    Deletes every record of the zone (streamed and packed into batches), then the zone.
+    Returns (deleted record count, change IDs to track).
+    """
+    deleted = 0
+
+    def deletes():
+        nonlocal deleted
+        for record in iter_records(r53, zone['Id']):
+            if not is_apex_record(record, zone['Name']):
+                deleted += 1
+                yield {'Action': 'DELETE', 'ResourceRecordSet': record}
+
+    # Route53 pages by name, so deleting records already read doesn't disturb the next page
+    change_ids = submit_changes(r53, zone['Id'], deletes(), comment='Cleanup by Nadav-Platform-CLI')
+
+    route53_limiter.acquire()
+    response = r53.delete_hosted_zone(Id=zone['Id'])
+    change_ids.append(response['ChangeInfo']['Id'])
+    return deleted, change_ids
+
+def cleanup_dns_resources(r53=None):
+    r53 = r53 or get_route53_client()
+    all_deleted = True
     try:
-        # 1. Get all the Hosted Zones
-        zones_response = r53.list_hosted_zones()
-        found_any = False
-        
-        from src.utils.helpers import progress_spinner
-        
         with progress_spinner("Checking Route53 resources for cleanup..."):
-            for zone in zones_response.get('HostedZones', []):
-                zone_id = zone['Id'].split('/')[-1]
-                
-                # Check tags
-                try:
-                    tag_response = r53.list_tags_for_resource(
-                        ResourceType='hostedzone',
-                        ResourceId=zone_id
-                    )
-                    tags = {t['Key']: t['Value'] for t in tag_response['ResourceTagSet']['Tags']}
-                    
-                    if tags.get('CreatedBy') == 'Nadav-Platform-CLI':
-                        found_any = True
-                        console.print(f"  🗑️  Found platform zone: [cyan]{zone['Name']}[/cyan] ({zone_id})")
-                        
-                        # Delete records first
-                        records = r53.list_resource_record_sets(HostedZoneId=zone_id)
-                        changes = []
-                        for record in records['ResourceRecordSets']:
-                            if record['Type'] not in ['NS', 'SOA']:
-                                changes.append({
-                                    'Action': 'DELETE',
-                                    'ResourceRecordSet': record
-                                })
-                        
-                        if changes:
-                             r53.change_resource_record_sets(
-                                 HostedZoneId=zone_id,
-                                 ChangeBatch={'Changes': changes}
-                             )
-                             console.print(f"     ✅ Deleted {len(changes)} records.")
-
-                        # Delete zone
-                        r53.delete_hosted_zone(Id=zone_id)
-                        console.print(f"     ✅ Deleted Hosted Zone.")
-                        
-                except Exception as e:
-                    console.print(f"  ❌ Error checking/deleting zone {zone_id}: {e}")
-
-        if not found_any:
+            # 1. Get all the platform Hosted Zones
+            zones = discover_platform_zones(r53)
+
+            # 2. Tear several zones down at once; every call shares the account's rate limiter
+            change_ids = []
+            with ThreadPoolExecutor(max_workers=ZONE_TEARDOWN_WORKERS) as pool:
+                futures = {pool.submit(teardown_zone, r53, zone): zone for zone in zones}
+                for future in as_completed(futures):
+                    zone = futures[future]
+                    try:
+                        deleted, zone_change_ids = future.result()
+                        change_ids.extend(zone_change_ids)
+                        console.print(f"  🗑️  Deleted platform zone [cyan]{zone['Name']}[/cyan] ({zone['Id']}) "
+                                      f"and {deleted} records in {len(zone_change_ids) - 1} change batches.")
+                    except Exception as e:
+                        all_deleted = False
+                        console.print(f"  ❌ Error checking/deleting zone {zone['Id']}: {e}")
+
+        if not zones:
             console.print("[green]✨ No platform Route53 zones found to clean.[/green]")
+            return all_deleted
+
+        # 3. One tracked loop until every record batch and zone deletion is INSYNC
+        if change_ids:
+            with progress_spinner(f"Waiting for {len(change_ids)} Route53 changes to be INSYNC..."):
+                result = wait_for_changes(r53, change_ids)
+            if not result.succeeded:
+                console.print(f"[yellow]⚠️  {len(result.pending)} changes are still PENDING.[/yellow]")
+        return all_deleted
 
     except Exception as e:
         console.print(f"[bold red]❌ Error during Route53 cleanup:[/bold red] {e}")
+        return False
@@ -0,0 +1,189 @@
+import click
+from click import ClickException
+from rich.table import Table
+from src.utils.helpers import console, progress_spinner
+from src.route53.manager import (
+    get_route53_client, get_platform_zone, iter_records, is_apex_record,
+    submit_changes, wait_for_changes, print_committed_batches
+)
+from src.route53.record_files import load_changes, record_key
+
+# Record set fields that make two record sets with the same key different
+COMPARED_FIELDS = (
+    'TTL', 'Weight', 'Region', 'Failover', 'GeoLocation', 'MultiValueAnswer',
+    'HealthCheckId', 'TrafficPolicyInstanceId'
+)
+ACTION_STYLES = {'CREATE': ('+', 'green'), 'UPSERT': ('~', 'yellow'), 'DELETE': ('-', 'red')}
+
+def comparable(record_set):
+    """
+    A normalized view of a record set for equality checks (value order and alias DNS name case don't matter).
+    """
+    view = {field: record_set.get(field) for field in COMPARED_FIELDS}
+    view['Values'] = sorted(r['Value'] for r in record_set.get('ResourceRecords', []))
+    alias = record_set.get('AliasTarget')
+    if alias:
+        view['AliasTarget'] = (
+            alias['HostedZoneId'], alias['DNSName'].rstrip('.').lower(), alias.get('EvaluateTargetHealth', False)
+        )
+    return view
+
+def load_desired_records(path, zone_name, file_format=None):
+    """
+    Reads a desired-state file (same formats as dns apply) into {key: record set}.
+    """
+    desired = {}
+    for change in load_changes(path, zone_name, file_format):
+        if change['Action'] == 'DELETE':
+            raise ClickException("❌ A desired-state file lists the records to keep; DELETE entries aren't allowed (use --prune).")
+        desired[record_key(change['ResourceRecordSet'])] = change['ResourceRecordSet']
+    return desired
+
+def diff_records(current, desired, zone_name, prune=False):
+    """
+    Compares {key: record set} maps in one pass over each. Returns (changes, unchanged count).
+    DELETEs come first so that a name can change type across batches. The apex NS/SOA are never touched.
+    """
+    deletes, writes, unchanged = [], [], 0
+    for key, record_set in desired.items():
+        if is_apex_record(record_set, zone_name):
+            continue
+        existing = current.get(key)
+        if existing is None:
+            writes.append({'Action': 'CREATE', 'ResourceRecordSet': record_set})
+        elif comparable(existing) != comparable(record_set):
+            writes.append({'Action': 'UPSERT', 'ResourceRecordSet': record_set, 'Previous': existing})
+        else:
+            unchanged += 1
+
+    if prune:
+        for key, record_set in current.items():
+            if key not in desired and not is_apex_record(record_set, zone_name):
+                deletes.append({'Action': 'DELETE', 'ResourceRecordSet': record_set})
+    return deletes + writes, unchanged
+
+def describe_values(record_set):
+    if not record_set:
+        return ""
+    if 'AliasTarget' in record_set:
+        return f"Alias -> {record_set['AliasTarget']['DNSName']}"
+    values = ", ".join(r['Value'] for r in record_set.get('ResourceRecords', []))
+    return f"{values} (TTL {record_set.get('TTL')})"
+
+def print_plan(changes, unchanged):
+    if changes:
+        table = Table(title="📋 DNS Plan", show_header=True, header_style="bold magenta")
+        table.add_column("", justify="center")
+        table.add_column("Name", style="cyan")
+        table.add_column("Type")
+        table.add_column("Current", style="dim")
+        table.add_column("Desired")
+        for change in changes:
+            symbol, color = ACTION_STYLES[change['Action']]
+            record_set = change['ResourceRecordSet']
+            if change['Action'] == 'DELETE':
+                current, desired = record_set, None
+            else:
+                current, desired = change.get('Previous'), record_set
+            name = record_set['Name'] + (f" [{record_set['SetIdentifier']}]" if 'SetIdentifier' in record_set else "")
+            table.add_row(f"[{color}]{symbol}[/{color}]", name, record_set['Type'], describe_values(current), describe_values(desired))
+        console.print(table)
+
+    counts = {action: sum(1 for c in changes if c['Action'] == action) for action in ACTION_STYLES}
+    console.print(
+        f"[bold]Plan:[/bold] {counts['CREATE']} to create, {counts['UPSERT']} to update, "
+        f"{counts['DELETE']} to delete, {unchanged} unchanged."
+    )
+
+def plan_zone(zone_id, path, prune=False, file_format=None, r53=None):
+    """
+    Computes the changes that bring the zone to the desired state in the file.
+    Returns (r53, zone_id, changes, unchanged), or None if the zone isn't a platform zone.
+    """
+    r53 = r53 or get_route53_client()
+    clean_zone_id = zone_id.split('/')[-1]
+
+    zone = get_platform_zone(r53, clean_zone_id)
+    if zone is None:
+        return None
+    zone_name = zone['Name']
+
+    desired = load_desired_records(path, zone_name, file_format)
+    with progress_spinner(f"Reading the current records of {zone_name}..."):
+        current = {record_key(record): record for record in iter_records(r53, clean_zone_id)}
+
+    changes, unchanged = diff_records(current, desired, zone_name, prune)
+    return r53, clean_zone_id, changes, unchanged
+
+def report_error(error, r53, zone_id, path):
+    """
+    Prints an error from planning or syncing a zone the same way the other dns commands do.
+    """
+    if isinstance(error, r53.exceptions.NoSuchHostedZone):
+        console.print(f"[bold red]❌ Zone {zone_id} was not found.[/bold red]")
+    elif isinstance(error, r53.exceptions.InvalidChangeBatch):
+        console.print(f"[bold red]❌ Route53 rejected a change batch:[/bold red] {error}")
+    elif isinstance(error, (OSError, ValueError)):
+        console.print(f"[bold red]❌ Could not read {path}:[/bold red] {error}")
+    else:
+        console.print(f"[bold red]❌ Route53 Error:[/bold red] {error}")
+
+def show_plan(zone_id, path, prune=False, file_format=None):
+    r53 = get_route53_client()
+    try:
+        planned = plan_zone(zone_id, path, prune, file_format, r53=r53)
+    except ClickException:
+        raise
+    except Exception as e:
+        report_error(e, r53, zone_id.split('/')[-1], path)
+        return False
+    if planned is None:
+        return False
+    _, _, changes, unchanged = planned
+    print_plan(changes, unchanged)
+    return True
+
+def sync_zone(zone_id, path, prune=False, file_format=None, assume_yes=False, wait=False):
+    """
+    Prints the plan, then submits only the delta. An unchanged zone costs one paginated read and no writes.
+    """
+    r53 = get_route53_client()
+    clean_zone_id = zone_id.split('/')[-1]
+    try:
+        planned = plan_zone(zone_id, path, prune, file_format, r53=r53)
+        if planned is None:
+            return False
+        _, _, changes, unchanged = planned
+        print_plan(changes, unchanged)
+
+        if not changes:
+            console.print("[green]✨ The zone already matches the file. Nothing to do.[/green]")
+            return True
+        if not assume_yes and not click.confirm(f"Apply {len(changes)} changes to {clean_zone_id}?"):
+            console.print("[yellow]Sync cancelled.[/yellow]")
+            return False
+
+        submitted = [{'Action': c['Action'], 'ResourceRecordSet': c['ResourceRecordSet']} for c in changes]
+        change_ids = []
+        try:
+            with progress_spinner(f"Applying {len(changes)} record changes..."):
+                submit_changes(r53, clean_zone_id, submitted, change_ids=change_ids)
+        except Exception:
+            print_committed_batches(change_ids, submitted)
+            raise
+        console.print(f"[green]✅ Applied {len(changes)} changes in {len(change_ids)} change batches.[/green]")
+
+        if wait:
+            with progress_spinner(f"Waiting for {len(change_ids)} change batches to propagate (INSYNC)..."):
+                result = wait_for_changes(r53, change_ids)
+            if not result.succeeded:
+                console.print(f"[yellow]⚠️  {len(result.pending)} change batches are still PENDING.[/yellow]")
+                return False
+            console.print("[green]✅ All changes are INSYNC on all Route53 name servers.[/green]")
+        return True
+
+    except ClickException:
+        raise
+    except Exception as e:
+        report_error(e, r53, clean_zone_id, path)
+        return False
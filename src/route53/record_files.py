@@ -0,0 +1,268 @@
+import csv
+import os
+import re
+from click import ClickException
+
+# PyYAML is only needed for YAML record files
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+DEFAULT_TTL = 300
+VALID_ACTIONS = ('CREATE', 'UPSERT', 'DELETE')
+
+# Record types whose (last) rdata field is a domain name, and the position of that field
+NAME_FIELDS = {'CNAME': 0, 'NS': 0, 'PTR': 0, 'MX': 1, 'SRV': 3}
+RECORD_TYPES = {
+    'A', 'AAAA', 'CAA', 'CNAME', 'DS', 'HTTPS', 'MX', 'NAPTR', 'NS', 'PTR',
+    'SOA', 'SPF', 'SRV', 'SSHFP', 'SVCB', 'TLSA', 'TXT'
+}
+TTL_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+def normalize_name(name, zone_name):
+    """
+    Returns the fully qualified, lower-case record name the way Route53 reports it
+    (trailing dot, '*' escaped as \\052). Relative names and '@' are resolved against the zone.
+    """
+    zone_name = zone_name.rstrip('.').lower()
+    name = (name or '@').strip()
+    if name == '@':
+        name = zone_name + '.'
+    elif not name.endswith('.'):
+        bare = name.lower()
+        name = name + '.' if bare == zone_name or bare.endswith('.' + zone_name) else f"{name}.{zone_name}."
+    return name.lower().replace('*', '\\052')
+
+def record_key(record_set):
+    """
+    The identity of a record set inside a zone: (name, type, set identifier).
+    """
+    return (record_set['Name'].lower(), record_set['Type'], record_set.get('SetIdentifier'))
+
+def parse_ttl(value):
+    """
+    Parses a TTL such as 300, '300' or '1h30m'.
+    """
+    if isinstance(value, int):
+        return value
+    text = str(value).strip().lower()
+    if text.isdigit():
+        return int(text)
+    parts = re.findall(r'(\d+)([smhdw])', text)
+    if not parts or ''.join(n + u for n, u in parts) != text:
+        raise ClickException(f"❌ Invalid TTL: {value}")
+    return sum(int(number) * TTL_UNITS[unit] for number, unit in parts)
+
+def load_yaml_entries(path):
+    if yaml is None:
+        raise ClickException("❌ YAML record files need PyYAML. Install it with: pip install pyyaml")
+    with open(path) as f:
+        try:
+            data = yaml.safe_load(f) or []
+        except yaml.YAMLError as e:
+            raise ClickException(f"❌ Invalid YAML in {path}: {e}")
+    default_ttl = None
+    if isinstance(data, dict):
+        default_ttl = data.get('ttl')
+        data = data.get('records') or []
+    if not isinstance(data, list):
+        raise ClickException(f"❌ {path} must hold a list of records (or a mapping with a 'records' list).")
+
+    entries = []
+    for position, item in enumerate(data, start=1):
+        if not isinstance(item, dict):
+            raise ClickException(f"❌ Record #{position} in {path} must be a mapping with name, type and value: {item!r}")
+        values = item.get('values', item.get('value'))
+        entries.append({
+            'action': item.get('action', 'UPSERT'),
+            'name': item.get('name'),
+            'type': item.get('type'),
+            'ttl': item.get('ttl', default_ttl),
+            'values': values if isinstance(values, list) else ([] if values is None else [values]),
+            'set_identifier': item.get('set_identifier'),
+            'weight': item.get('weight'),
+            'alias': item.get('alias')
+        })
+    return entries
+
+def load_csv_entries(path):
+    """
+    Reads a CSV with the columns action,name,type,ttl,value (set_identifier and weight optional).
+    Rows of the same record set (one value per row) are merged later.
+    """
+    entries = []
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            row = {key.strip().lower(): (value or '').strip() for key, value in row.items() if key}
+            entries.append({
+                'action': row.get('action') or 'UPSERT',
+                'name': row.get('name'),
+                'type': row.get('type'),
+                'ttl': row.get('ttl') or None,
+                'values': [row['value']] if row.get('value') else [],
+                'set_identifier': row.get('set_identifier') or None,
+                'weight': row.get('weight') or None,
+                'alias': None
+            })
+    return entries
+
+def _strip_comment(line):
+    in_quotes = False
+    for i, char in enumerate(line):
+        if char == '"' and (i == 0 or line[i - 1] != '\\'):
+            in_quotes = not in_quotes
+        elif char == ';' and not in_quotes:
+            return line[:i]
+    return line
+
+def _strip_parens(line):
+    """
+    Replaces the ( ) that group a multi-line record with spaces, leaving quoted text alone.
+    Returns (line, change in nesting depth).
+    """
+    in_quotes = False
+    chars, depth = [], 0
+    for i, char in enumerate(line):
+        if char == '"' and (i == 0 or line[i - 1] != '\\'):
+            in_quotes = not in_quotes
+        elif char in '()' and not in_quotes:
+            depth += 1 if char == '(' else -1
+            char = ' '
+        chars.append(char)
+    return ''.join(chars), depth
+
+def _iter_bind_lines(path):
+    """
+    Yields logical zone file lines: comments removed and ( ... ) continuations joined.
+    """
+    pending, depth = None, 0
+    with open(path) as f:
+        for raw in f:
+            line, line_depth = _strip_parens(_strip_comment(raw.rstrip('\n')))
+            if pending is None:
+                pending = line
+            else:
+                pending += ' ' + line.strip()
+            depth += line_depth
+            if depth <= 0:
+                if pending.strip():
+                    yield pending
+                pending, depth = None, 0
+
+def load_bind_entries(path, zone_name):
+    """
+    Parses a BIND zone file ($ORIGIN, $TTL, relative names, omitted owners) into UPSERT entries.
+    The SOA and apex NS records belong to Route53 and are skipped.
+    """
+    origin = zone_name.rstrip('.') + '.'
+    default_ttl = DEFAULT_TTL
+    previous_name = '@'
+    entries = []
+
+    for line in _iter_bind_lines(path):
+        tokens = re.findall(r'"(?:[^"\\]|\\.)*"|\S+', line)
+        if tokens[0].upper() == '$ORIGIN':
+            origin = normalize_name(tokens[1], zone_name)
+            continue
+        if tokens[0].upper() == '$TTL':
+            default_ttl = parse_ttl(tokens[1])
+            continue
+        if tokens[0].startswith('$'):
+            raise ClickException(f"❌ Unsupported zone file directive: {tokens[0]}")
+
+        # The owner name is omitted when the line starts with whitespace
+        name = previous_name if line[0].isspace() else tokens.pop(0)
+        previous_name = name
+
+        ttl = default_ttl
+        while tokens and tokens[0].upper() not in RECORD_TYPES:
+            token = tokens.pop(0)
+            if token.upper() not in ('IN', 'CH', 'HS'):
+                ttl = parse_ttl(token)
+        if not tokens:
+            raise ClickException(f"❌ Could not parse zone file line: {line.strip()}")
+
+        record_type, rdata = tokens[0].upper(), tokens[1:]
+        fqdn = normalize_name(name, origin)
+        if record_type == 'SOA' or (record_type == 'NS' and fqdn == normalize_name('@', zone_name)):
+            continue
+        if record_type in NAME_FIELDS and len(rdata) > NAME_FIELDS[record_type]:
+            position = NAME_FIELDS[record_type]
+            rdata[position] = normalize_name(rdata[position], origin) if rdata[position] != '.' else '.'
+
+        entries.append({
+            'action': 'UPSERT', 'name': fqdn, 'type': record_type, 'ttl': ttl,
+            'values': [' '.join(rdata)], 'set_identifier': None, 'weight': None, 'alias': None
+        })
+    return entries
+
+def build_record_set(entry, zone_name):
+    """
+    Builds the Route53 record set for an entry; a missing TTL means DEFAULT_TTL.
+    """
+    record_set = {
+        'Name': normalize_name(entry['name'], zone_name),
+        'Type': str(entry['type']).upper()
+    }
+    if entry.get('set_identifier'):
+        record_set['SetIdentifier'] = str(entry['set_identifier'])
+        if entry.get('weight') is not None:
+            record_set['Weight'] = int(entry['weight'])
+    if entry.get('alias'):
+        alias = entry['alias']
+        record_set['AliasTarget'] = {
+            'HostedZoneId': alias['hosted_zone_id'],
+            'DNSName': alias['dns_name'],
+            'EvaluateTargetHealth': bool(alias.get('evaluate_target_health', False))
+        }
+    else:
+        record_set['TTL'] = parse_ttl(entry['ttl'] if entry.get('ttl') is not None else DEFAULT_TTL)
+        record_set['ResourceRecords'] = [{'Value': str(value)} for value in entry['values']]
+    return record_set
+
+def build_changes(entries, zone_name):
+    """
+    Turns parsed entries into Route53 changes, merging the values of entries that
+    share an action and record set (e.g. one CSV row or zone file line per value).
+    """
+    changes = {}
+    for entry in entries:
+        action = str(entry['action']).upper()
+        if action not in VALID_ACTIONS:
+            raise ClickException(f"❌ Invalid action '{entry['action']}' for {entry['name']}. Use one of {list(VALID_ACTIONS)}")
+        if not entry.get('name') or not entry.get('type') or not (entry['values'] or entry.get('alias')):
+            raise ClickException(f"❌ Every record needs a name, a type and a value: {entry}")
+        # Route53 only deletes an exact match, and a wrong TTL fails the whole batch
+        if action == 'DELETE' and not entry.get('alias') and entry.get('ttl') is None:
+            raise ClickException(f"❌ DELETE {entry['name']} {entry['type']} needs the record's current TTL.")
+
+        record_set = build_record_set(entry, zone_name)
+        key = (action,) + record_key(record_set)
+        if key in changes and 'ResourceRecords' in record_set:
+            existing = changes[key]['ResourceRecordSet']['ResourceRecords']
+            existing.extend(r for r in record_set['ResourceRecords'] if r not in existing)
+        else:
+            changes[key] = {'Action': action, 'ResourceRecordSet': record_set}
+    return list(changes.values())
+
+def detect_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.yaml', '.yml'):
+        return 'yaml'
+    if extension == '.csv':
+        return 'csv'
+    return 'bind'
+
+def load_changes(path, zone_name, file_format=None):
+    """
+    Reads a YAML, CSV or BIND zone file and returns the Route53 changes it describes.
+    """
+    file_format = file_format or detect_format(path)
+    if file_format == 'yaml':
+        entries = load_yaml_entries(path)
+    elif file_format == 'csv':
+        entries = load_csv_entries(path)
+    else:
+        entries = load_bind_entries(path, zone_name)
+    return build_changes(entries, zone_name)
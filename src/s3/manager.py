@@ -1,10 +1,95 @@
 import boto3
 import os
-from src.utils.helpers import console, progress_spinner, get_aws_user, is_platform_resource
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from rich.progress import Progress, ProgressColumn, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.text import Text
+from datetime import datetime, timezone
+from src.utils.helpers import console, progress_spinner, get_aws_user, is_platform_resource, backoff_delay, load_state_file, save_state_file
+from src.utils.waiter import wait_until
 
 current_user = get_aws_user()
 my_tags = {"CreatedBy": "Nadav-Platform-CLI", "Owner": current_user}
 
+# Bound on concurrent get_bucket_tagging calls while classifying buckets
+BUCKET_SCAN_WORKERS = 16
+
+# Bucket emptying: delete_objects takes at most 1,000 keys per request
+DELETE_BATCH_SIZE = 1000
+DELETE_WORKERS = 8
+BUCKET_CLEANUP_WORKERS = 4
+DELETE_MAX_ATTEMPTS = 8
+RETRYABLE_DELETE_ERRORS = {'SlowDown', 'InternalError', 'ServiceUnavailable', 'RequestTimeout'}
+
+# A new bucket normally shows up within seconds; head_bucket answers 404 until then
+BUCKET_VISIBLE_TIMEOUT = 30
+NOT_FOUND_ERRORS = {'404', 'NoSuchBucket', 'NotFound'}
+
+# Buckets handed to S3 lifecycle expiration, waiting for `s3 cleanup --finalize`
+TEARDOWN_LEDGER_FILE = "s3_pending_teardown.json"
+
+# Expire every current object, noncurrent version, delete marker and unfinished upload
+EXPIRE_EVERYTHING_RULES = [
+    {
+        'ID': 'nadav-cli-teardown-expire-all',
+        'Filter': {'Prefix': ''},
+        'Status': 'Enabled',
+        'Expiration': {'Days': 1},
+        'NoncurrentVersionExpiration': {'NoncurrentDays': 1},
+        'AbortIncompleteMultipartUpload': {'DaysAfterInitiation': 1}
+    },
+    {
+        # ExpiredObjectDeleteMarker can't share a rule with Expiration.Days
+        'ID': 'nadav-cli-teardown-delete-markers',
+        'Filter': {'Prefix': ''},
+        'Status': 'Enabled',
+        'Expiration': {'ExpiredObjectDeleteMarker': True}
+    }
+]
+
+_s3_clients = {}
+_s3_clients_lock = threading.Lock()
+
+def get_s3_client(region=None):
+    """
+    Returns a shared S3 client for the region, creating it on first use.
+    Clients are thread-safe once built, but building them is not.
+    """
+    with _s3_clients_lock:
+        if region not in _s3_clients:
+            _s3_clients[region] = boto3.client('s3', region_name=region) if region else boto3.client('s3')
+        return _s3_clients[region]
+
+def iter_account_buckets():
+    """
+    Yields every bucket in the account, following pagination when the SDK supports it.
+    """
+    s3 = get_s3_client()
+    if s3.can_paginate('list_buckets'):
+        for page in s3.get_paginator('list_buckets').paginate():
+            yield from page.get('Buckets', [])
+    else:
+        yield from s3.list_buckets().get('Buckets', [])
+
+def iter_platform_buckets():
+    """
+    Yields the names of platform buckets as soon as their tag checks resolve.
+    Each bucket is checked with the client of its own region through a bounded thread pool.
+    """
+    with ThreadPoolExecutor(max_workers=BUCKET_SCAN_WORKERS) as pool:
+        futures = {}
+        for bucket in iter_account_buckets():
+            s3 = get_s3_client(bucket.get('BucketRegion'))
+            futures[pool.submit(is_platform_resource, bucket['Name'], s3)] = bucket['Name']
+
+        for future in as_completed(futures):
+            if future.result():
+                yield futures[future]
+
 def create_bucket(bucket_name, region = 'us-east-1', is_public = False):
     try:
         # Confirmation for public bucket BEFORE creation
@@ -27,6 +112,14 @@ def create_bucket(bucket_name, region = 'us-east-1', is_public = False):
             s3_client.create_bucket(Bucket=bucket_name, CreateBucketConfiguration=bucket_config)
 
         console.print(f"[green]✅ Bucket '{bucket_name}' created successfully in {region}.[/green]")
+
+        # New buckets can take a moment to become visible to the tagging API
+        result = wait_for_bucket(s3_client, bucket_name)
+        if not result.succeeded:
+            reason = f"head_bucket returned {result.failed[bucket_name]}" if result.failed else \
+                f"it was not visible after {BUCKET_VISIBLE_TIMEOUT}s"
+            console.print(f"[bold red]❌ Bucket '{bucket_name}' was created but could not be tagged: {reason}.[/bold red]")
+            return False
         
         # Add the tags to the bucket
         tag_set = [{'Key': k, 'Value': v} for k, v in my_tags.items()]
@@ -66,66 +159,257 @@ def create_bucket(bucket_name, region = 'us-east-1', is_public = False):
         console.print(f"[bold red]❌ Error in creating a bucket:[/bold red] {e}")
         return False
 
-def cleanup_s3_resources():
-    s3_client = boto3.client('s3')
-    s3_resource = boto3.resource('s3')
+class ObjectRateColumn(ProgressColumn):
+    """Renders a task's progress as deleted objects and objects per second."""
+    def render(self, task):
+        speed = task.finished_speed or task.speed
+        rate = f"{speed:,.0f} obj/s" if speed else "- obj/s"
+        return Text(f"{int(task.completed):,} objects  {rate}", style="cyan")
+
+def get_cleanup_client():
+    # Enough pooled connections for every delete worker, and adaptive retries for SlowDown
+    return boto3.client('s3', config=Config(
+        max_pool_connections=DELETE_WORKERS + BUCKET_CLEANUP_WORKERS * 2,
+        retries={'max_attempts': 10, 'mode': 'adaptive'}
+    ))
+
+def iter_delete_batches(s3_client, bucket_name):
+    """
+    Streams every object version and delete marker of the bucket as lists of up to 1,000 keys.
+    Unversioned buckets report their objects with VersionId 'null', so one path covers both.
+    """
+    batch = []
+    for page in s3_client.get_paginator('list_object_versions').paginate(Bucket=bucket_name):
+        for entry in page.get('Versions', []) + page.get('DeleteMarkers', []):
+            batch.append({'Key': entry['Key'], 'VersionId': entry['VersionId']})
+            if len(batch) == DELETE_BATCH_SIZE:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+def delete_object_batch(s3_client, bucket_name, objects, on_deleted):
+    """
+    Deletes a batch of object versions, retrying throttled keys with jittered backoff.
+    Calls on_deleted(count) as keys are confirmed gone.
+    """
+    for attempt in range(DELETE_MAX_ATTEMPTS):
+        try:
+            response = s3_client.delete_objects(Bucket=bucket_name, Delete={'Objects': objects, 'Quiet': True})
+        except ClientError as e:
+            if e.response['Error']['Code'] not in RETRYABLE_DELETE_ERRORS:
+                raise
+            time.sleep(backoff_delay(attempt))
+            continue
+
+        errors = response.get('Errors', [])
+        on_deleted(len(objects) - len(errors))
+
+        failed = [e for e in errors if e['Code'] not in RETRYABLE_DELETE_ERRORS]
+        if failed:
+            raise Exception(f"Could not delete {failed[0]['Key']}: {failed[0]['Message']}")
+        if not errors:
+            return
+
+        # Retry only the keys that were throttled
+        objects = [{'Key': e['Key'], 'VersionId': e['VersionId']} for e in errors]
+        time.sleep(backoff_delay(attempt))
+
+    raise Exception(f"Gave up deleting {len(objects)} objects from {bucket_name} after {DELETE_MAX_ATTEMPTS} attempts")
+
+def empty_and_delete_bucket(s3_client, bucket_name, delete_pool, on_deleted):
+    """
+    Empties the bucket through the shared delete pool, then deletes it.
+    In-flight batches are bounded so listing never runs far ahead of deletion.
+    """
+    in_flight = deque()
+    for batch in iter_delete_batches(s3_client, bucket_name):
+        if len(in_flight) >= DELETE_WORKERS * 2:
+            in_flight.popleft().result()
+        in_flight.append(delete_pool.submit(delete_object_batch, s3_client, bucket_name, batch, on_deleted))
+    for future in in_flight:
+        future.result()
+
+    s3_client.delete_bucket(Bucket=bucket_name)
+
+def wait_for_bucket(s3_client, bucket_name, timeout=BUCKET_VISIBLE_TIMEOUT):
+    """
+    Waits until head_bucket can see the bucket. Only "not found" means "not yet"; any other
+    error (e.g. 403) fails the wait at once. Returns the wait engine's WaitResult.
+    """
+    def poll(bucket_names):
+        states: dict[str, str | None] = {}
+        for name in bucket_names:
+            try:
+                s3_client.head_bucket(Bucket=name)
+                states[name] = 'exists'
+            except ClientError as e:
+                code = e.response['Error']['Code']
+                states[name] = None if code in NOT_FOUND_ERRORS else code
+        return states
+
+    return wait_until(
+        [bucket_name], poll,
+        is_ready=lambda state: state == 'exists',
+        is_failed=lambda state: state is not None and state != 'exists',
+        min_delay=0.5, timeout=timeout
+    )
+
+def cleanup_s3_resources(s3_client=None):
+    s3_client = s3_client or get_cleanup_client()
+    all_deleted = True
     
     try:
-        response = s3_client.list_buckets()
         found_any = False
+        progress = Progress(
+            SpinnerColumn(), TextColumn("[bold blue]{task.description}"), ObjectRateColumn(), TimeElapsedColumn(),
+            console=console
+        )
         
-        with progress_spinner("Checking S3 buckets for cleanup..."):
-            for bucket_data in response.get('Buckets', []):
-                bucket_name = bucket_data['Name']
-                
-                if is_platform_resource(bucket_name):
-                    found_any = True
-                    console.print(f"  🗑️  Found platform bucket: [cyan]{bucket_name}[/cyan]")
-                    
-                    bucket = s3_resource.Bucket(bucket_name)
-                    
-                    # Delete all objects first
-                    bucket.objects.all().delete()
-                    # Delete versions if enabled (optional but good practice)
-                    bucket.object_versions.all().delete()
-                    
-                    # Delete the bucket
-                    bucket.delete()
-                    console.print(f"     ✅ Deleted bucket: [strike red]{bucket_name}[/strike red]")
+        with progress, ThreadPoolExecutor(max_workers=DELETE_WORKERS) as delete_pool, \
+                ThreadPoolExecutor(max_workers=BUCKET_CLEANUP_WORKERS) as bucket_pool:
+            total_task = progress.add_task("All platform buckets", total=None)
+            lock = threading.Lock()
+
+            def make_counter(task_id):
+                def on_deleted(count):
+                    with lock:
+                        progress.advance(task_id, count)
+                        progress.advance(total_task, count)
+                return on_deleted
+
+            # Several buckets are emptied at once while the rest are still being classified
+            futures = {}
+            for bucket_name in iter_platform_buckets():
+                found_any = True
+                progress.console.print(f"  🗑️  Found platform bucket: [cyan]{bucket_name}[/cyan]")
+                task_id = progress.add_task(bucket_name, total=None)
+                future = bucket_pool.submit(empty_and_delete_bucket, s3_client, bucket_name, delete_pool, make_counter(task_id))
+                futures[future] = (bucket_name, task_id)
+
+            for future in as_completed(futures):
+                bucket_name, task_id = futures[future]
+                progress.stop_task(task_id)
+                try:
+                    future.result()
+                    progress.console.print(f"     ✅ Deleted bucket: [strike red]{bucket_name}[/strike red]")
+                except Exception as e:
+                    all_deleted = False
+                    progress.console.print(f"     ❌ Failed to delete bucket {bucket_name}: {e}")
+            progress.stop_task(total_task)
         
         if not found_any:
             console.print("[green]✨ No platform S3 buckets found to clean.[/green]")
+        return all_deleted
             
     except Exception as e:
         console.print(f"[bold red]❌ Error during S3 cleanup:[/bold red] {e}")
+        return False
+
+def schedule_bucket_teardown():
+    """
+    Installs an expire-everything lifecycle rule on every platform bucket and records it
+    in the pending-teardown ledger. S3 empties the buckets in the background; run
+    finalize_bucket_teardown() later to delete the ones that are empty.
+    """
+    s3_client = get_s3_client()
+    ledger = load_state_file(TEARDOWN_LEDGER_FILE)
+    scheduled = 0
+
+    try:
+        with progress_spinner("Scheduling lifecycle teardown for platform buckets..."):
+            for bucket_name in iter_platform_buckets():
+                try:
+                    s3_client.put_bucket_lifecycle_configuration(
+                        Bucket=bucket_name,
+                        LifecycleConfiguration={'Rules': EXPIRE_EVERYTHING_RULES}
+                    )
+                except ClientError as e:
+                    console.print(f"  ❌ Could not schedule {bucket_name}: {e}")
+                    continue
+
+                ledger.setdefault(bucket_name, {'scheduled_at': datetime.now(timezone.utc).isoformat()})
+                save_state_file(TEARDOWN_LEDGER_FILE, ledger)
+                scheduled += 1
+                console.print(f"  ⏳ Expiration scheduled for bucket: [cyan]{bucket_name}[/cyan]")
+    except Exception as e:
+        console.print(f"[bold red]❌ Error during S3 teardown scheduling:[/bold red] {e}")
+        return False
+
+    if not scheduled:
+        console.print("[green]✨ No platform S3 buckets found to clean.[/green]")
+        return True
+
+    console.print(f"[green]✅ {scheduled} buckets will be emptied by S3 lifecycle expiration (usually within 1-2 days).[/green]")
+    console.print("[dim]Run 'awsctl s3 cleanup --finalize' later to delete the buckets that are already empty.[/dim]")
+    return True
+
+def is_bucket_empty(s3_client, bucket_name):
+    """
+    True when the bucket holds no object versions, delete markers or multipart uploads.
+    """
+    versions = s3_client.list_object_versions(Bucket=bucket_name, MaxKeys=1)
+    if versions.get('Versions') or versions.get('DeleteMarkers'):
+        return False
+    uploads = s3_client.list_multipart_uploads(Bucket=bucket_name, MaxUploads=1)
+    return not uploads.get('Uploads')
+
+def finalize_bucket_teardown():
+    """
+    Deletes the buckets from the pending-teardown ledger that S3 has already emptied.
+    Buckets that still hold data stay in the ledger for the next pass.
+    """
+    s3_client = get_s3_client()
+    ledger = load_state_file(TEARDOWN_LEDGER_FILE)
+
+    if not ledger:
+        console.print("[green]✨ No buckets are pending teardown.[/green]")
+        return True
+
+    for bucket_name in sorted(ledger):
+        try:
+            if not is_bucket_empty(s3_client, bucket_name):
+                console.print(f"  ⏳ [cyan]{bucket_name}[/cyan] is still being emptied by S3 (scheduled {ledger[bucket_name]['scheduled_at']}).")
+                continue
+            s3_client.delete_bucket(Bucket=bucket_name)
+            console.print(f"  ✅ Deleted bucket: [strike red]{bucket_name}[/strike red]")
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'NoSuchBucket':
+                console.print(f"  ❌ Error finalizing {bucket_name}: {e}")
+                continue
+            console.print(f"  ✅ Bucket {bucket_name} is already gone.")
+
+        del ledger[bucket_name]
+        save_state_file(TEARDOWN_LEDGER_FILE, ledger)
+
+    if ledger:
+        console.print(f"[yellow]⏳ {len(ledger)} buckets are still pending teardown.[/yellow]")
+        return False
+    console.print("[green]✅ All pending buckets have been deleted.[/green]")
+    return True
 
 def get_buckets():
     """
     Returns a list of S3 bucket names created by the platform.
     """
-    s3 = boto3.client('s3')
-    response = s3.list_buckets()
-    
-    platform_buckets = []
-    for bucket in response.get('Buckets', []):
-        if is_platform_resource(bucket["Name"]):
-            platform_buckets.append(bucket["Name"])
-            
-    return platform_buckets
+    return sorted(iter_platform_buckets())
 
 def list_buckets():
+    found_any = False
     with progress_spinner("Listing Buckets made with the CLI Platform, \n     this might take a few seconds..."):
-        buckets = get_buckets()
-        
-        if buckets:
-            for bucket_name in buckets:
-                print(f'  {bucket_name}')
-        else:
-            print("No buckets were found.")
+        # Print each bucket as soon as it is classified
+        for bucket_name in iter_platform_buckets():
+            found_any = True
+            console.print(f'  {bucket_name}', highlight=False)
+
+    if not found_any:
+        print("No buckets were found.")
 
 def upload_files(file_name, bucket_name, object_name=None):
+    s3_client = get_s3_client()
+
     # Check if the bucket is made by the CLI platform
-    if not is_platform_resource(bucket_name):
+    if not is_platform_resource(bucket_name, s3_client):
         console.print(f"[bold red]❌ Access Denied:[/bold red] Bucket '{bucket_name}' does not have the required platform tags.")
         return False
 
@@ -133,7 +417,6 @@ def upload_files(file_name, bucket_name, object_name=None):
     if object_name is None:
         object_name = os.path.basename(file_name)
 
-    s3_client = boto3.client('s3')
     try:
         with console.status(f"[bold green]Uploading {file_name} to {bucket_name}...[/bold green]"):
             s3_client.upload_file(file_name, bucket_name, object_name)
@@ -0,0 +1,411 @@
+import boto3
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from collections import deque
+from typing import Any
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, CancelledError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn, FileSizeColumn, TransferSpeedColumn, TimeElapsedColumn
+from src.utils.helpers import console, is_platform_resource, progress_spinner, load_state_file, save_state_file
+
+MB = 1024 * 1024
+
+# Files uploaded at the same time
+SYNC_WORKERS = 16
+# Files above the threshold are split into parts that upload in parallel
+SYNC_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * MB,
+    multipart_chunksize=16 * MB,
+    max_concurrency=4,
+    use_threads=True
+)
+
+# Below this many files, hashing in-process beats starting a process pool
+PROCESS_HASH_THRESHOLD = 32
+HASH_CHUNK_SIZE = MB
+DELETE_BATCH_SIZE = 1000
+
+# Objects above the threshold are fetched as parallel byte-range GETs
+RANGE_THRESHOLD = 32 * MB
+RANGE_CHUNK_SIZE = 16 * MB
+DOWNLOAD_WORKERS = 16
+# Sidecar file that tracks finished ranges so an interrupted download can resume
+PARTIAL_SUFFIX = ".awsctl-part"
+
+def get_transfer_client():
+    # One shared client with a connection for every concurrent part upload
+    return boto3.client('s3', config=Config(
+        max_pool_connections=SYNC_WORKERS * SYNC_TRANSFER_CONFIG.max_request_concurrency,
+        retries={'max_attempts': 10, 'mode': 'adaptive'}
+    ))
+
+def iter_local_files(root):
+    """
+    Lazily walks the tree under root and yields (path, relative key) for every file.
+    Keys always use '/' separators, whatever the local OS.
+    """
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path, os.path.relpath(entry.path, root).replace(os.sep, '/')
+
+def build_object_key(prefix, relative_key):
+    prefix = prefix.strip('/')
+    return f"{prefix}/{relative_key}" if prefix else relative_key
+
+def get_manifest_file(bucket_name, prefix):
+    """
+    Returns the state file holding the upload manifest of one bucket/prefix pair.
+    """
+    prefix_id = hashlib.sha1(prefix.strip('/').encode()).hexdigest()[:12]
+    return os.path.join("s3_manifests", f"{bucket_name}-{prefix_id}.json")
+
+def hash_file(path):
+    """
+    Returns the MD5 hex digest of a file, which matches the ETag of a single-part upload.
+    """
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def hash_files(paths):
+    """
+    Hashes the files, in a process pool when there are enough of them to be worth it.
+    """
+    if len(paths) < PROCESS_HASH_THRESHOLD:
+        return [hash_file(path) for path in paths]
+    with ProcessPoolExecutor() as pool:
+        return list(pool.map(hash_file, paths, chunksize=16))
+
+def plan_sync(local_dir, files, full=False):
+    """
+    Compares the local tree with the manifest entries in `files` and returns
+    (local keys, [(path, relative key, stat, md5), ...] to upload).
+    Only files whose size or mtime changed are re-read; a touched file with
+    unchanged content just gets its manifest entry refreshed.
+    """
+    local_keys = set()
+    candidates = []
+    for path, relative_key in iter_local_files(local_dir):
+        local_keys.add(relative_key)
+        stat = os.stat(path)
+        entry = files.get(relative_key)
+        if not full and entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            continue
+        candidates.append((path, relative_key, stat))
+
+    to_upload = []
+    digests = hash_files([path for path, _, _ in candidates])
+    for (path, relative_key, stat), md5 in zip(candidates, digests):
+        entry = files.get(relative_key)
+        if not full and entry and entry['md5'] == md5 and entry['size'] == stat.st_size:
+            entry['mtime'] = stat.st_mtime_ns
+            continue
+        to_upload.append((path, relative_key, stat, md5))
+    return local_keys, to_upload
+
+def delete_remote_orphans(s3_client, bucket_name, prefix, local_keys):
+    """
+    Deletes objects under the prefix that no longer exist locally. Returns the deleted keys.
+    """
+    prefix = prefix.strip('/')
+    list_prefix = f"{prefix}/" if prefix else ""
+    orphans = []
+    for page in s3_client.get_paginator('list_objects_v2').paginate(Bucket=bucket_name, Prefix=list_prefix):
+        for obj in page.get('Contents', []):
+            if obj['Key'][len(list_prefix):] not in local_keys:
+                orphans.append(obj['Key'])
+
+    for i in range(0, len(orphans), DELETE_BATCH_SIZE):
+        batch = orphans[i:i + DELETE_BATCH_SIZE]
+        s3_client.delete_objects(Bucket=bucket_name, Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True})
+    return orphans
+
+def sync_directory(local_dir, bucket_name, prefix="", delete_orphans=False, full=False):
+    """
+    Uploads the new and changed files under local_dir to the bucket concurrently, using
+    multipart uploads for large files, and reports the aggregate throughput.
+    A local manifest (size, mtime, MD5, remote ETag) per bucket/prefix decides what changed;
+    full=True ignores it and re-uploads everything.
+    """
+    if not os.path.isdir(local_dir):
+        console.print(f"[bold red]❌ Error:[/bold red] '{local_dir}' is not a directory.")
+        return False
+
+    s3_client = get_transfer_client()
+
+    # Check once that the bucket is made by the CLI platform
+    if not is_platform_resource(bucket_name, s3_client):
+        console.print(f"[bold red]❌ Access Denied:[/bold red] Bucket '{bucket_name}' does not have the required platform tags.")
+        return False
+
+    manifest_file = get_manifest_file(bucket_name, prefix)
+    manifest = load_state_file(manifest_file)
+    files = manifest.get('files', {})
+
+    with progress_spinner("Comparing local files with the upload manifest..."):
+        local_keys, to_upload = plan_sync(local_dir, files, full)
+    console.print(f"[dim]{len(local_keys) - len(to_upload)} unchanged, {len(to_upload)} to upload.[/dim]")
+
+    uploaded = 0
+    failed = []
+    started = time.monotonic()
+    progress = Progress(
+        SpinnerColumn(), TextColumn("[bold green]{task.description}"), TextColumn("{task.fields[files]} files"),
+        FileSizeColumn(), TransferSpeedColumn(), TimeElapsedColumn(),
+        console=console
+    )
+
+    def upload(path, key):
+        s3_client.upload_file(
+            path, bucket_name, key,
+            Config=SYNC_TRANSFER_CONFIG,
+            Callback=lambda sent: progress.advance(task_id, sent)
+        )
+        return s3_client.head_object(Bucket=bucket_name, Key=key)['ETag'].strip('"')
+
+    def collect(future, relative_key, stat, md5):
+        nonlocal uploaded
+        try:
+            etag = future.result()
+            files[relative_key] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'md5': md5, 'etag': etag}
+            uploaded += 1
+            progress.update(task_id, files=uploaded)
+        except Exception as e:
+            failed.append(relative_key)
+            progress.console.print(f"  ❌ Failed to upload {relative_key}: {e}")
+
+    try:
+        with progress, ThreadPoolExecutor(max_workers=SYNC_WORKERS) as pool:
+            task_id = progress.add_task(f"Syncing to {bucket_name}", total=None, files=0)
+            in_flight = deque()
+            for path, relative_key, stat, md5 in to_upload:
+                if len(in_flight) >= SYNC_WORKERS * 2:
+                    collect(*in_flight.popleft())
+                key = build_object_key(prefix, relative_key)
+                in_flight.append((pool.submit(upload, path, key), relative_key, stat, md5))
+            while in_flight:
+                collect(*in_flight.popleft())
+            total_bytes = progress.tasks[0].completed
+
+        if delete_orphans:
+            with progress_spinner("Deleting remote files that no longer exist locally..."):
+                orphans = delete_remote_orphans(s3_client, bucket_name, prefix, local_keys)
+            console.print(f"🗑️  Deleted {len(orphans)} remote orphans.")
+
+        # Forget files that were removed locally
+        for relative_key in set(files) - local_keys:
+            del files[relative_key]
+    finally:
+        # Save whatever was uploaded, even if the run was interrupted
+        save_state_file(manifest_file, {'bucket': bucket_name, 'prefix': prefix, 'files': files})
+
+    elapsed = time.monotonic() - started
+    throughput = total_bytes / MB / elapsed if elapsed else 0
+    console.print(f"✅ Uploaded {uploaded} files ({total_bytes / MB:,.1f} MB) to [blue]{bucket_name}[/blue] in {elapsed:.1f}s ({throughput:,.1f} MB/s)")
+    if failed:
+        console.print(f"[bold red]❌ {len(failed)} files failed to upload.[/bold red]")
+        return False
+    return True
+
+
+def compute_etag(path, part_size=None, parts_count=None):
+    """
+    Computes the S3 ETag of a local file: the plain MD5 for single-part uploads, or
+    the MD5 of the part MD5s plus "-<parts>" for multipart uploads.
+    """
+    if not parts_count:
+        return hash_file(path)
+
+    part_digests = []
+    with open(path, "rb") as f:
+        for part in iter(lambda: f.read(part_size), b""):
+            part_digests.append(hashlib.md5(part).digest())
+    return f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}"
+
+def verify_download(s3_client, bucket_name, key, path, head):
+    """
+    Compares the downloaded file against the object's ETag. Returns True, False,
+    or None when the ETag isn't an MD5 (SSE-KMS / SSE-C encrypted objects).
+    """
+    if head.get('ServerSideEncryption') == 'aws:kms' or head.get('SSECustomerAlgorithm'):
+        return None
+
+    etag = head['ETag'].strip('"')
+    if '-' not in etag:
+        return compute_etag(path) == etag
+
+    # The size of the first part tells us how the object was split when it was uploaded
+    first_part = s3_client.head_object(Bucket=bucket_name, Key=key, PartNumber=1)
+    return compute_etag(path, first_part['ContentLength'], int(etag.split('-')[1])) == etag
+
+def download_ranged(s3_client, bucket_name, key, path, head, range_pool, on_bytes):
+    """
+    Downloads a large object as parallel byte-range GETs written straight into a
+    preallocated, memory-mapped output file. Finished ranges are tracked in a sidecar
+    file, so re-running the same download only fetches what is missing.
+    """
+    size = head['ContentLength']
+    etag = head['ETag']
+    state_path = path + PARTIAL_SUFFIX
+    state: dict[str, Any] = {}
+    # A sidecar is only trusted while the preallocated file still has the object's size
+    if os.path.exists(state_path) and os.path.exists(path) and os.path.getsize(path) == size:
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+    # Only resume if the remote object is the same one we started downloading
+    if state.get('etag') != etag or state.get('size') != size or state.get('chunk_size') != RANGE_CHUNK_SIZE:
+        state = {'etag': etag, 'size': size, 'chunk_size': RANGE_CHUNK_SIZE, 'done': []}
+        with open(path, "wb") as f:
+            f.truncate(size)
+
+    done = set(state['done'])
+    chunk_count = (size + RANGE_CHUNK_SIZE - 1) // RANGE_CHUNK_SIZE
+    on_bytes(sum(min(RANGE_CHUNK_SIZE, size - i * RANGE_CHUNK_SIZE) for i in done))
+    lock = threading.Lock()
+    failed = threading.Event()
+
+    with open(path, "r+b") as f, mmap.mmap(f.fileno(), size) as mapped:
+        def fetch(index):
+            if failed.is_set():
+                return
+            start = index * RANGE_CHUNK_SIZE
+            end = min(start + RANGE_CHUNK_SIZE, size) - 1
+            response = s3_client.get_object(Bucket=bucket_name, Key=key, Range=f"bytes={start}-{end}", IfMatch=etag)
+            offset = start
+            for chunk in response['Body'].iter_chunks(MB):
+                if failed.is_set():
+                    # Another range failed; stop writing so the mapping can be closed
+                    return
+                mapped[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+                on_bytes(len(chunk))
+            with lock:
+                done.add(index)
+                with open(state_path, "w") as state_file:
+                    json.dump({**state, 'done': sorted(done)}, state_file)
+
+        futures = [range_pool.submit(fetch, i) for i in range(chunk_count) if i not in done]
+        error = None
+        for future in futures:
+            try:
+                future.result()
+            except CancelledError:
+                pass
+            except Exception as e:
+                if error is None:
+                    # Stop the other ranges, but wait for every one of them before the
+                    # mapping is closed: a range still writing into it would crash
+                    error = e
+                    failed.set()
+                    for pending in futures:
+                        pending.cancel()
+        if error is not None:
+            raise error
+        mapped.flush()
+
+    os.remove(state_path)
+
+def resolve_download_path(dest, key, prefix):
+    """
+    Maps an object key to a local path under dest, refusing keys that would escape it.
+    """
+    relative = key[len(prefix):].lstrip('/') if prefix is not None else os.path.basename(key)
+    root = os.path.abspath(dest)
+    path = os.path.abspath(os.path.join(root, *relative.split('/')))
+    if os.path.commonpath([root, path]) != root:
+        raise Exception(f"Refusing to write '{key}' outside of {dest}")
+    return path
+
+def download_objects(bucket_name, dest, key=None, prefix=None):
+    """
+    Downloads one object (key) or every object under a prefix from a platform bucket.
+    Large objects are fetched as parallel ranges, small ones concurrently, all through
+    one shared client, and every file is checked against its ETag.
+    """
+    s3_client = get_transfer_client()
+
+    if not is_platform_resource(bucket_name, s3_client):
+        console.print(f"[bold red]❌ Access Denied:[/bold red] Bucket '{bucket_name}' does not have the required platform tags.")
+        return False
+
+    try:
+        with progress_spinner("Listing objects to download..."):
+            if key is not None:
+                head = s3_client.head_object(Bucket=bucket_name, Key=key)
+                # A single key may be saved under an explicit file name
+                path = os.path.join(dest, os.path.basename(key)) if os.path.isdir(dest) else dest
+                objects = [(key, path, head['ContentLength'], head)]
+            else:
+                objects = []
+                for page in s3_client.get_paginator('list_objects_v2').paginate(Bucket=bucket_name, Prefix=prefix):
+                    for obj in page.get('Contents', []):
+                        if not obj['Key'].endswith('/'):
+                            objects.append((obj['Key'], resolve_download_path(dest, obj['Key'], prefix), obj['Size'], None))
+    except Exception as e:
+        console.print(f"[bold red]❌ Error listing objects:[/bold red] {e}")
+        return False
+
+    if not objects:
+        console.print("[yellow]⚠️  No objects found to download.[/yellow]")
+        return True
+
+    failed = []
+    progress = Progress(
+        SpinnerColumn(), TextColumn("[bold green]{task.description}"), BarColumn(), DownloadColumn(),
+        TransferSpeedColumn(), TimeElapsedColumn(),
+        console=console
+    )
+
+    def download(object_key, path, size, head):
+        # HEAD gives the ETag and encryption details needed to verify the download
+        head = head or s3_client.head_object(Bucket=bucket_name, Key=object_key)
+        on_bytes = lambda count: progress.advance(task_id, count)
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if head['ContentLength'] > RANGE_THRESHOLD:
+            download_ranged(s3_client, bucket_name, object_key, path, head, range_pool, on_bytes)
+        else:
+            s3_client.download_file(bucket_name, object_key, path, Callback=on_bytes,
+                                    Config=TransferConfig(use_threads=False))
+
+        verified = verify_download(s3_client, bucket_name, object_key, path, head)
+        if verified is False:
+            raise Exception("checksum mismatch")
+        if verified is None:
+            progress.console.print(f"  [dim]{object_key}: encrypted with KMS/SSE-C, checksum not verified.[/dim]")
+
+    with progress, ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as object_pool, \
+            ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as range_pool:
+        task_id = progress.add_task(f"Downloading from {bucket_name}", total=sum(obj[2] for obj in objects))
+        futures = {object_pool.submit(download, *obj): obj[0] for obj in objects}
+        for future, object_key in futures.items():
+            try:
+                future.result()
+            except CancelledError:
+                pass
+            except Exception as e:
+                failed.append(object_key)
+                progress.console.print(f"  ❌ Failed to download {object_key}: {e}")
+
+    downloaded = len(objects) - len(failed)
+    console.print(f"✅ Downloaded and verified {downloaded} objects from [blue]{bucket_name}[/blue] into {dest}")
+    if failed:
+        console.print(f"[bold red]❌ {len(failed)} objects failed to download. Re-run the command to resume.[/bold red]")
+        return False
+    return True
@@ -1,12 +1,48 @@
 from rich.panel import Panel
 import boto3
 from rich.console import Console
+from rich.errors import LiveError
 import pyfiglet
 from contextlib import contextmanager
+import json
+import os
+import random
+import threading
 import time
 
 console = Console()
 
+def get_state_dir():
+    """
+    Returns the directory for the CLI's local state files (ledgers, caches), creating it if needed.
+    Defaults to ~/.awsctl and can be moved with the AWSCTL_HOME environment variable.
+    """
+    state_dir = os.environ.get('AWSCTL_HOME', os.path.join(os.path.expanduser('~'), '.awsctl'))
+    os.makedirs(state_dir, exist_ok=True)
+    return state_dir
+
+def load_state_file(file_name):
+    """
+    Reads a JSON state file from the state directory. Missing or corrupt files read as {}.
+    """
+    path = os.path.join(get_state_dir(), file_name)
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_state_file(file_name, data):
+    """
+    Writes a JSON state file atomically, so an interrupted run never leaves it half written.
+    """
+    path = os.path.join(get_state_dir(), file_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
 def get_aws_user():
     # Get the name of the current AWS user
     sts = boto3.client('sts')
@@ -16,8 +52,9 @@ def get_aws_user():
     except Exception:
         return "Unknown-User"
 
-def is_platform_resource(bucket_name):
-    s3_client = boto3.client('s3')
+def is_platform_resource(bucket_name, s3_client=None):
+    # Callers checking many buckets pass in a shared client to avoid rebuilding one per call
+    s3_client = s3_client or boto3.client('s3')
     try:
         # Get the tags of the bucket
         response = s3_client.get_bucket_tagging(Bucket=bucket_name)
@@ -31,6 +68,41 @@ def is_platform_resource(bucket_name):
 
 @contextmanager
 def progress_spinner(message="Working..."):
-    with console.status(f"[bold blue]⏳ {message}", spinner="dots"):
+    status = console.status(f"[bold blue]⏳ {message}", spinner="dots")
+    try:
+        status.start()
+    except LiveError:
+        # Another live display (e.g. a task running in parallel) owns the terminal
+        console.print(f"[bold blue]⏳ {message}")
+        status = None
+    try:
         yield
+    finally:
+        if status:
+            status.stop()
+
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces calls to at most `rate` per second.
+    Shared by worker pools that hit throttled APIs (e.g. Route53's 5 req/s).
+    """
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
 
+def backoff_delay(attempt, base=0.5, cap=20.0):
+    """
+    Returns a "full jitter" exponential backoff delay in seconds for the given retry attempt.
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
@@ -0,0 +1,148 @@
+import os
+import time
+from typing import Any
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from rich.table import Table
+from src.utils.helpers import console, get_state_dir, load_state_file, save_state_file
+
+# A failed run is only resumed for this long; after that every task runs again
+RESUME_STATE_TTL = 60 * 60
+
+STATUS_STYLES = {
+    'done': "[green]✅ Done[/green]",
+    'resumed': "[green]⏭️  Done (previous run)[/green]",
+    'failed': "[bold red]❌ Failed[/bold red]",
+    'skipped': "[yellow]⏸️  Skipped (dependency failed)[/yellow]",
+}
+
+class DagScheduler:
+    """
+    Runs a small graph of tasks, starting every task as soon as all of its
+    dependencies are done, so independent branches run in parallel.
+
+    When a state file (in the state directory) is given, finished tasks are recorded there
+    and skipped on the next run, which lets a partially failed run resume where it stopped.
+    State older than max_age is thrown away, and a resumed task's verify() (a cheap
+    "is anything left?" check) must still pass, otherwise the task runs again.
+    The file is removed once every task has succeeded; fresh ignores it.
+    """
+    def __init__(self, state_file=None, max_age=RESUME_STATE_TTL, fresh=False):
+        self.state_file = state_file
+        self.max_age = max_age
+        self.fresh = fresh
+        self.started_at = time.time()
+        self.tasks = {}
+
+    def add(self, name, func, depends_on=(), verify=None):
+        self.tasks[name] = {'func': func, 'depends_on': list(depends_on), 'verify': verify}
+
+    def _load_completed(self):
+        if not self.state_file or self.fresh:
+            return set()
+        state = load_state_file(self.state_file)
+        started_at = state.get('started_at', 0)
+        age = time.time() - started_at
+        if not state.get('completed') or age > self.max_age:
+            return set()
+        # A resumed run keeps the original start, so the TTL bounds the whole attempt
+        self.started_at = started_at
+        completed = set(state['completed']) & set(self.tasks)
+        if completed:
+            console.print(f"[yellow]⏭️  Resuming a run from {age / 60:.0f} min ago "
+                          f"(use --fresh to start over). Previously done: {', '.join(sorted(completed))}[/yellow]")
+        return completed
+
+    def _verify_resumed(self, completed):
+        """
+        Re-checks every resumed task; the ones with something left are run again.
+        """
+        def is_clean(name):
+            verify = self.tasks[name]['verify']
+            if verify is None:
+                return True
+            try:
+                return bool(verify())
+            except Exception as e:
+                console.print(f"[dim]Could not verify {name} ({e}), running it again.[/dim]")
+                return False
+
+        names = sorted(completed)
+        if not names:
+            return set()
+        with ThreadPoolExecutor(max_workers=len(names)) as pool:
+            clean = dict(zip(names, pool.map(is_clean, names)))
+        for name in names:
+            if clean[name]:
+                checked = " and nothing is left" if self.tasks[name]['verify'] else ""
+                console.print(f"[dim]Skipping {name}: done in the previous run{checked}.[/dim]")
+            else:
+                console.print(f"[yellow]{name} was done in the previous run but has resources again, running it again.[/yellow]")
+        return {name for name in names if clean[name]}
+
+    def _save_completed(self, completed):
+        if not self.state_file:
+            return
+        if len(completed) == len(self.tasks):
+            path = os.path.join(get_state_dir(), self.state_file)
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        save_state_file(self.state_file, {'started_at': self.started_at, 'completed': sorted(completed)})
+
+    def _run_task(self, name):
+        started = time.monotonic()
+        try:
+            succeeded = self.tasks[name]['func']() is not False
+        except Exception as e:
+            console.print(f"[bold red]❌ {name} failed:[/bold red] {e}")
+            succeeded = False
+        return succeeded, time.monotonic() - started
+
+    def run(self, max_workers=4):
+        """
+        Runs the graph and returns {task name: {'status', 'elapsed'}}.
+        """
+        completed = self._verify_resumed(self._load_completed())
+        results: dict[str, dict[str, Any]] = {name: {'status': 'resumed', 'elapsed': None} for name in completed}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            running = {}
+            while True:
+                for name, task in self.tasks.items():
+                    if name in results or name in running.values():
+                        continue
+                    deps = [results.get(dep, {}).get('status') for dep in task['depends_on']]
+                    if any(status in ('failed', 'skipped') for status in deps):
+                        results[name] = {'status': 'skipped', 'elapsed': None}
+                    elif all(status in ('done', 'resumed') for status in deps):
+                        console.print(f"[bold cyan]▶️  Starting {name}[/bold cyan]")
+                        running[pool.submit(self._run_task, name)] = name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    succeeded, elapsed = future.result()
+                    results[name] = {'status': 'done' if succeeded else 'failed', 'elapsed': elapsed}
+                    if succeeded:
+                        completed.add(name)
+                        console.print(f"[green]✅ {name} finished in {elapsed:.1f}s[/green]")
+                    else:
+                        console.print(f"[bold red]❌ {name} failed after {elapsed:.1f}s[/bold red]")
+                    self._save_completed(completed)
+
+        self._save_completed(completed)
+        return results
+
+    def print_summary(self, results, title="Task Summary"):
+        table = Table(title=title, show_header=True, header_style="bold magenta")
+        table.add_column("Task", style="cyan")
+        table.add_column("Status")
+        table.add_column("Time", justify="right", style="dim")
+        for name in self.tasks:
+            result = results.get(name, {'status': 'skipped', 'elapsed': None})
+            elapsed = f"{result['elapsed']:.1f}s" if result['elapsed'] is not None else "-"
+            table.add_row(name, STATUS_STYLES[result['status']], elapsed)
+        console.print(table)
@@ -0,0 +1,89 @@
+import os
+import random
+import threading
+import time
+from src.utils.helpers import console
+
+# Default deadline for every wait, overridable per call or with AWSCTL_WAIT_TIMEOUT (seconds)
+DEFAULT_TIMEOUT = float(os.environ.get('AWSCTL_WAIT_TIMEOUT', 600))
+MIN_POLL_DELAY = 1.0
+MAX_POLL_DELAY = 15.0
+
+class WaitResult:
+    """
+    Outcome of a wait: seconds-to-ready per resource, failed resources with their
+    last state, resources still pending at the deadline, and whether it was cancelled.
+    """
+    def __init__(self, ready, failed, pending, cancelled, polls):
+        self.ready = ready
+        self.failed = failed
+        self.pending = pending
+        self.cancelled = cancelled
+        self.polls = polls
+
+    @property
+    def succeeded(self):
+        return not self.failed and not self.pending
+
+    def print_metrics(self, label="resources"):
+        if not self.ready:
+            return
+        times = sorted(self.ready.values())
+        average = sum(times) / len(times)
+        console.print(
+            f"[dim]⏱️  {len(times)} {label} ready: avg {average:.1f}s, "
+            f"fastest {times[0]:.1f}s, slowest {times[-1]:.1f}s ({self.polls} polls)[/dim]"
+        )
+
+def wait_until(resource_ids, poll, is_ready, is_failed=None, on_change=None,
+               timeout=None, min_delay=MIN_POLL_DELAY, max_delay=MAX_POLL_DELAY, cancel_event=None):
+    """
+    Waits for many resources with one shared poll per round.
+
+    poll(pending_ids) returns {resource_id: state} for the still-pending resources
+    (a missing ID maps to None). Polling starts fast and backs off with jitter while
+    nothing changes, dropping back to the fast interval whenever something does.
+    The wait stops at the deadline, when cancel_event is set, or on Ctrl+C.
+    """
+    timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+    cancel_event = cancel_event or threading.Event()
+    started = time.monotonic()
+    deadline = started + timeout
+
+    pending = set(resource_ids)
+    ready, failed, last_state = {}, {}, {}
+    delay = min_delay
+    polls = 0
+
+    try:
+        while pending and not cancel_event.is_set():
+            states = poll(sorted(pending))
+            polls += 1
+            changed = False
+
+            for resource_id in sorted(pending):
+                state = states.get(resource_id)
+                if state != last_state.get(resource_id):
+                    changed = True
+                    if on_change:
+                        on_change(resource_id, last_state.get(resource_id), state)
+                    last_state[resource_id] = state
+
+                if is_ready(state):
+                    ready[resource_id] = time.monotonic() - started
+                    pending.discard(resource_id)
+                elif is_failed and is_failed(state):
+                    failed[resource_id] = state
+                    pending.discard(resource_id)
+
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+
+            delay = min_delay if changed else min(max_delay, delay * 2)
+            # Jitter keeps many parallel waits from polling in lockstep
+            cancel_event.wait(min(remaining, random.uniform(delay / 2, delay)))
+    except KeyboardInterrupt:
+        cancel_event.set()
+
+    return WaitResult(ready, failed, pending, cancel_event.is_set(), polls)
@@ -0,0 +1,42 @@
+import sys
+import os
+import pytest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ec2 import manager
+from src.ec2.manager import resolve_regions, scan_regions, DEFAULT_REGION
+
+def test_resolve_regions_defaults_to_the_home_region():
+    assert resolve_regions() == [DEFAULT_REGION]
+    assert resolve_regions('') == [DEFAULT_REGION]
+
+def test_resolve_regions_parses_lists():
+    assert resolve_regions('eu-west-1, us-west-2,,eu-west-1') == ['eu-west-1', 'us-west-2']
+    assert resolve_regions(['us-east-2', ' us-east-2 ']) == ['us-east-2']
+
+def test_resolve_regions_all():
+    client = mock.Mock()
+    client.describe_regions.return_value = {'Regions': [{'RegionName': 'us-west-2'}, {'RegionName': 'eu-west-1'}]}
+    with mock.patch.object(manager, 'get_ec2_client', return_value=client):
+        assert resolve_regions(' ALL ') == ['eu-west-1', 'us-west-2']
+
+def scan_or_fail(region):
+    if region == 'eu-west-1':
+        raise Exception("RequestLimitExceeded")
+    return [{'InstanceId': f"i-{region}"}]
+
+def test_scan_regions_merges_and_tags_items():
+    items = scan_regions(scan_or_fail, 'us-east-1,us-west-2')
+    assert sorted((i['InstanceId'], i['Region']) for i in items) == [
+        ('i-us-east-1', 'us-east-1'), ('i-us-west-2', 'us-west-2')
+    ]
+
+def test_scan_regions_raises_when_a_region_fails():
+    with pytest.raises(Exception, match="eu-west-1"):
+        scan_regions(scan_or_fail, 'us-east-1,eu-west-1')
+
+def test_scan_regions_can_skip_failed_regions_for_listings():
+    items = scan_regions(scan_or_fail, 'us-east-1,eu-west-1', skip_failed=True)
+    assert [i['Region'] for i in items] == ['us-east-1']
@@ -0,0 +1,35 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.route53.manager import pack_changes, change_weight
+
+def txt_change(name, value, action='CREATE'):
+    return {'Action': action, 'ResourceRecordSet': {
+        'Name': name, 'Type': 'TXT', 'TTL': 300, 'ResourceRecords': [{'Value': value}]
+    }}
+
+def alias_change(name):
+    return {'Action': 'CREATE', 'ResourceRecordSet': {
+        'Name': name, 'Type': 'A', 'AliasTarget': {'HostedZoneId': 'Z1', 'DNSName': 'x.', 'EvaluateTargetHealth': False}
+    }}
+
+def test_change_weight_counts_upserts_twice():
+    assert change_weight(txt_change('a.', 'abcd')) == (1, 4)
+    assert change_weight(txt_change('a.', 'abcd', 'UPSERT')) == (2, 8)
+    assert change_weight(alias_change('a.')) == (0, 0)
+
+def test_pack_changes_respects_every_limit():
+    changes = [txt_change(f"r{i}.", 'x' * 10) for i in range(25)]
+    assert [len(b) for b in pack_changes(changes, max_records=10)] == [10, 10, 5]
+    assert [len(b) for b in pack_changes(changes, max_chars=35)] == [3] * 8 + [1]
+    assert [len(b) for b in pack_changes(changes, max_changes=20)] == [20, 5]
+    # Alias changes weigh nothing, so only the change count splits them
+    aliases = [alias_change(f"a{i}.") for i in range(2500)]
+    assert [len(b) for b in pack_changes(aliases)] == [1000, 1000, 500]
+
+def test_pack_changes_keeps_order_and_oversized_changes():
+    changes = [txt_change('big.', 'x' * 50), txt_change('small.', 'y')]
+    batches = list(pack_changes(changes, max_chars=20))
+    assert batches == [[changes[0]], [changes[1]]]
@@ -0,0 +1,80 @@
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.route53 import manager
+from src.route53.manager import lookup_record_sets, iter_subtree_records
+from src.utils.helpers import RateLimiter
+
+def route53_key(name):
+    # Route53 orders record names by their labels read right to left
+    return list(reversed(name.rstrip('.').split('.')))
+
+class FakeZone:
+    """
+    Serves list_resource_record_sets from a sorted record list, like Route53:
+    from the start name/type, MaxItems at a time, with Next* markers.
+    """
+    def __init__(self, records):
+        self.records = sorted(records, key=lambda r: (route53_key(r['Name']), r['Type'], r.get('SetIdentifier', '')))
+        self.calls = []
+
+    def list_resource_record_sets(self, HostedZoneId, MaxItems, StartRecordName=None, StartRecordType=None,
+                                  StartRecordIdentifier=None):
+        self.calls.append(StartRecordName)
+        start = 0
+        if StartRecordName:
+            marker = (route53_key(StartRecordName), StartRecordType or '', StartRecordIdentifier or '')
+            start = next((i for i, r in enumerate(self.records)
+                          if (route53_key(r['Name']), r['Type'], r.get('SetIdentifier', '')) >= marker), len(self.records))
+        page = self.records[start:start + int(MaxItems)]
+        response = {'ResourceRecordSets': page, 'IsTruncated': start + int(MaxItems) < len(self.records)}
+        if response['IsTruncated']:
+            following = self.records[start + int(MaxItems)]
+            response.update(NextRecordName=following['Name'], NextRecordType=following['Type'])
+            if 'SetIdentifier' in following:
+                response['NextRecordIdentifier'] = following['SetIdentifier']
+        return response
+
+def record(name, record_type='A', set_identifier=None):
+    record_set = {'Name': name, 'Type': record_type, 'TTL': 300, 'ResourceRecords': [{'Value': '192.0.2.1'}]}
+    if set_identifier:
+        record_set['SetIdentifier'] = set_identifier
+    return record_set
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    monkeypatch.setattr(manager, 'route53_limiter', RateLimiter(10000))
+
+@pytest.fixture
+def zone():
+    return FakeZone(
+        [record('example.com.', 'NS'), record('api.example.com.'), record('api.example.com.', 'TXT'),
+         record('v1.api.example.com.'), record('deep.v1.api.example.com.'), record('apple.example.com.'),
+         record('www.example.com.')]
+        + [record('weighted.example.com.', 'A', f"w{i:02d}") for i in range(25)]
+    )
+
+def test_lookup_by_name_and_type(zone):
+    found = lookup_record_sets(zone, 'Z1', 'api.example.com.', 'TXT')
+    assert [(r['Name'], r['Type']) for r in found] == [('api.example.com.', 'TXT')]
+    assert len(zone.calls) == 1
+
+def test_lookup_by_name_returns_every_type(zone):
+    found = lookup_record_sets(zone, 'Z1', 'API.example.com.')
+    assert sorted(r['Type'] for r in found) == ['A', 'TXT']
+
+def test_lookup_follows_pages_only_while_they_match(zone):
+    found = lookup_record_sets(zone, 'Z1', 'weighted.example.com.', 'A')
+    assert len(found) == 25
+    assert len(zone.calls) == 3
+
+def test_lookup_of_a_missing_name(zone):
+    assert lookup_record_sets(zone, 'Z1', 'missing.example.com.') == []
+
+def test_subtree_stops_at_the_first_name_outside_it(zone):
+    names = [r['Name'] for r in iter_subtree_records(zone, 'Z1', 'api.example.com.')]
+    assert names == ['api.example.com.', 'api.example.com.', 'v1.api.example.com.', 'deep.v1.api.example.com.']
+    assert len(zone.calls) == 1
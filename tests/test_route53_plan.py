@@ -0,0 +1,45 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.route53.record_files import record_key
+from src.route53.plan import diff_records
+
+ZONE = "example.com."
+
+def record_set(name, record_type, values, ttl=300):
+    return {'Name': name, 'Type': record_type, 'TTL': ttl, 'ResourceRecords': [{'Value': v} for v in values]}
+
+def keyed(*record_sets):
+    return {record_key(r): r for r in record_sets}
+
+def test_diff_records():
+    apex_ns = record_set(ZONE, 'NS', ['ns-1.awsdns-01.org.'])
+    current = keyed(
+        apex_ns,
+        record_set('same.example.com.', 'A', ['192.0.2.1', '192.0.2.2']),
+        record_set('ttl.example.com.', 'A', ['192.0.2.3']),
+        record_set('extra.example.com.', 'A', ['192.0.2.4'])
+    )
+    desired = keyed(
+        record_set(ZONE, 'NS', ['ns.other.org.']),
+        record_set('same.example.com.', 'A', ['192.0.2.2', '192.0.2.1']),
+        record_set('ttl.example.com.', 'A', ['192.0.2.3'], ttl=60),
+        record_set('new.example.com.', 'A', ['192.0.2.5'])
+    )
+
+    changes, unchanged = diff_records(current, desired, ZONE)
+    assert unchanged == 1
+    assert [(c['Action'], c['ResourceRecordSet']['Name']) for c in changes] == [
+        ('UPSERT', 'ttl.example.com.'), ('CREATE', 'new.example.com.')
+    ]
+    assert changes[0]['Previous']['TTL'] == 300
+
+    changes, _ = diff_records(current, desired, ZONE, prune=True)
+    assert [(c['Action'], c['ResourceRecordSet']['Name']) for c in changes][0] == ('DELETE', 'extra.example.com.')
+    assert not any(c['ResourceRecordSet']['Type'] == 'NS' for c in changes)
+
+def test_diff_records_in_sync_zone_is_empty():
+    records = keyed(record_set('www.example.com.', 'A', ['192.0.2.1']))
+    assert diff_records(records, dict(records), ZONE, prune=True) == ([], 1)
@@ -0,0 +1,143 @@
+import sys
+import os
+import pytest
+from click import ClickException
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.route53.record_files import normalize_name, parse_ttl, load_changes
+
+ZONE = "example.com."
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+def by_name(changes):
+    return {(c['ResourceRecordSet']['Name'], c['ResourceRecordSet']['Type']): c for c in changes}
+
+def test_normalize_name():
+    assert normalize_name('@', ZONE) == 'example.com.'
+    assert normalize_name(None, ZONE) == 'example.com.'
+    assert normalize_name('www', ZONE) == 'www.example.com.'
+    assert normalize_name('WWW.Example.com', ZONE) == 'www.example.com.'
+    assert normalize_name('other.org.', ZONE) == 'other.org.'
+    assert normalize_name('*.dev', ZONE) == '\\052.dev.example.com.'
+
+def test_parse_ttl():
+    assert parse_ttl(60) == 60
+    assert parse_ttl('300') == 300
+    assert parse_ttl('1h30m') == 5400
+    with pytest.raises(ClickException):
+        parse_ttl('5 minutes')
+
+def test_bind_file(tmp_path):
+    path = write(tmp_path, "zone.txt", (
+        "$ORIGIN example.com.\n"
+        "$TTL 1h\n"
+        "@ IN SOA ns1.example.com. admin.example.com. (\n"
+        "    2024010101 ; serial\n"
+        "    3600 900 604800 300 )\n"
+        "@ IN NS ns-1.awsdns-01.org.\n"
+        "www 300 IN A 192.0.2.1\n"
+        "    IN A 192.0.2.2\n"
+        "api IN CNAME www\n"
+        "@ IN MX 10 mail\n"
+        "txt IN TXT \"v=spf1 ~all; not a comment\" ; a comment\n"
+    ))
+    changes = by_name(load_changes(path, ZONE))
+
+    assert ('example.com.', 'SOA') not in changes
+    assert ('example.com.', 'NS') not in changes
+    www = changes[('www.example.com.', 'A')]['ResourceRecordSet']
+    assert www['TTL'] == 300
+    assert www['ResourceRecords'] == [{'Value': '192.0.2.1'}, {'Value': '192.0.2.2'}]
+    api = changes[('api.example.com.', 'CNAME')]['ResourceRecordSet']
+    assert api['TTL'] == 3600
+    assert api['ResourceRecords'] == [{'Value': 'www.example.com.'}]
+    assert changes[('example.com.', 'MX')]['ResourceRecordSet']['ResourceRecords'] == [{'Value': '10 mail.example.com.'}]
+    assert changes[('txt.example.com.', 'TXT')]['ResourceRecordSet']['ResourceRecords'] == [{'Value': '"v=spf1 ~all; not a comment"'}]
+    assert all(c['Action'] == 'UPSERT' for c in changes.values())
+
+def test_bind_parens_inside_quotes_are_kept(tmp_path):
+    path = write(tmp_path, "zone.txt", (
+        "txt IN TXT \"hello (world)\"\n"
+        "open IN TXT \"smile :(\"\n"
+        "www IN A 192.0.2.1\n"
+        "multi IN TXT ( \"part one\"\n"
+        "    \"part (two)\" )\n"
+    ))
+    changes = by_name(load_changes(path, ZONE))
+
+    assert changes[('txt.example.com.', 'TXT')]['ResourceRecordSet']['ResourceRecords'] == [{'Value': '"hello (world)"'}]
+    assert changes[('open.example.com.', 'TXT')]['ResourceRecordSet']['ResourceRecords'] == [{'Value': '"smile :("'}]
+    assert ('www.example.com.', 'A') in changes
+    assert changes[('multi.example.com.', 'TXT')]['ResourceRecordSet']['ResourceRecords'] == [
+        {'Value': '"part one" "part (two)"'}
+    ]
+
+def test_csv_rows_are_merged(tmp_path):
+    path = write(tmp_path, "records.csv", (
+        "action,name,type,ttl,value\n"
+        "CREATE,www,A,60,192.0.2.1\n"
+        "CREATE,www,A,60,192.0.2.2\n"
+        "CREATE,www,A,60,192.0.2.1\n"
+        "DELETE,old,TXT,60,\"gone\"\n"
+    ))
+    changes = load_changes(path, ZONE)
+
+    assert len(changes) == 2
+    www = by_name(changes)[('www.example.com.', 'A')]
+    assert www['Action'] == 'CREATE'
+    assert www['ResourceRecordSet']['ResourceRecords'] == [{'Value': '192.0.2.1'}, {'Value': '192.0.2.2'}]
+    old = by_name(changes)[('old.example.com.', 'TXT')]
+    assert old['Action'] == 'DELETE'
+    assert old['ResourceRecordSet']['TTL'] == 60
+
+def test_delete_needs_the_current_ttl(tmp_path):
+    path = write(tmp_path, "records.csv", "action,name,type,ttl,value\nDELETE,old,TXT,,\"gone\"\n")
+    with pytest.raises(ClickException, match="TTL"):
+        load_changes(path, ZONE)
+
+def test_blank_ttl_defaults_for_writes(tmp_path):
+    path = write(tmp_path, "records.csv", "action,name,type,ttl,value\nUPSERT,www,A,,192.0.2.1\n")
+    assert load_changes(path, ZONE)[0]['ResourceRecordSet']['TTL'] == 300
+
+def test_yaml_file(tmp_path):
+    pytest.importorskip("yaml")
+    path = write(tmp_path, "records.yaml", (
+        "ttl: 120\n"
+        "records:\n"
+        "  - name: www\n"
+        "    type: A\n"
+        "    values: [192.0.2.1, 192.0.2.2]\n"
+        "  - name: blue\n"
+        "    type: A\n"
+        "    value: 192.0.2.3\n"
+        "    set_identifier: blue\n"
+        "    weight: 70\n"
+        "  - name: cdn\n"
+        "    type: A\n"
+        "    alias: {hosted_zone_id: Z2FDTNDATAQYW2, dns_name: d1.cloudfront.net}\n"
+    ))
+    changes = by_name(load_changes(path, ZONE))
+
+    www = changes[('www.example.com.', 'A')]['ResourceRecordSet']
+    assert www['TTL'] == 120 and len(www['ResourceRecords']) == 2
+    blue = changes[('blue.example.com.', 'A')]['ResourceRecordSet']
+    assert blue['SetIdentifier'] == 'blue' and blue['Weight'] == 70
+    cdn = changes[('cdn.example.com.', 'A')]['ResourceRecordSet']
+    assert cdn['AliasTarget']['DNSName'] == 'd1.cloudfront.net' and 'TTL' not in cdn
+
+@pytest.mark.parametrize("text", ["- just a string\n", "records: 5\n", "- name: [unclosed\n"])
+def test_invalid_yaml_files(tmp_path, text):
+    pytest.importorskip("yaml")
+    path = write(tmp_path, "bad.yaml", text)
+    with pytest.raises(ClickException):
+        load_changes(path, ZONE)
+
+def test_invalid_action(tmp_path):
+    path = write(tmp_path, "records.csv", "action,name,type,ttl,value\nREPLACE,www,A,60,192.0.2.1\n")
+    with pytest.raises(ClickException):
+        load_changes(path, ZONE)
@@ -0,0 +1,52 @@
+import sys
+import os
+import pytest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.route53 import manager
+from src.route53.manager import discover_platform_zones
+from src.utils.helpers import RateLimiter
+
+class NoSuchHostedZone(Exception):
+    pass
+
+class FakeRoute53:
+    """
+    Ten platform zones; tagging fails for a deleted zone and for zones in `denied`.
+    """
+    def __init__(self, deleted=(), denied=()):
+        self.zones = [{'Id': f"/hostedzone/Z{i}", 'Name': f"zone{i}.com."} for i in range(10)]
+        self.deleted = set(deleted)
+        self.denied = set(denied)
+        self.exceptions = mock.Mock(NoSuchHostedZone=NoSuchHostedZone)
+
+    def list_tags_for_resources(self, ResourceType, ResourceIds):
+        if self.deleted & set(ResourceIds):
+            raise NoSuchHostedZone("No hosted zone found")
+        if self.denied & set(ResourceIds):
+            raise Exception("AccessDenied")
+        return {'ResourceTagSets': [
+            {'ResourceId': zone_id, 'Tags': [{'Key': 'CreatedBy', 'Value': 'Nadav-Platform-CLI'}]} for zone_id in ResourceIds
+        ]}
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    monkeypatch.setattr(manager, 'route53_limiter', RateLimiter(10000))
+
+def discover(r53, **kwargs):
+    with mock.patch.object(manager, 'iter_hosted_zones', return_value=iter(r53.zones)):
+        return discover_platform_zones(r53, **kwargs)
+
+def test_a_deleted_zone_does_not_hide_its_batch():
+    zones = discover(FakeRoute53(deleted={'Z3'}))
+    assert sorted(zone['Id'] for zone in zones) == [f"Z{i}" for i in range(10) if i != 3]
+
+def test_unreadable_zones_fail_discovery():
+    with pytest.raises(Exception, match="Z5"):
+        discover(FakeRoute53(denied={'Z5'}))
+
+def test_listings_can_skip_unreadable_zones():
+    zones = discover(FakeRoute53(denied={'Z5'}), skip_unreadable=True)
+    assert len(zones) == 9
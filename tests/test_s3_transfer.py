@@ -0,0 +1,133 @@
+import sys
+import os
+import hashlib
+import json
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.s3 import transfer
+from src.s3.transfer import plan_sync, compute_etag, resolve_download_path, download_ranged, PARTIAL_SUFFIX
+
+def make_tree(root, files):
+    for relative_path, content in files.items():
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+def manifest_entry(path):
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'md5': hashlib.md5(path.read_bytes()).hexdigest()}
+
+def uploaded_keys(to_upload):
+    return sorted(key for _, key, _, _ in to_upload)
+
+def test_first_sync_uploads_everything(tmp_path):
+    make_tree(tmp_path, {'a.txt': b'a', 'sub/b.txt': b'b'})
+    local_keys, to_upload = plan_sync(str(tmp_path), {})
+    assert local_keys == {'a.txt', 'sub/b.txt'}
+    assert uploaded_keys(to_upload) == ['a.txt', 'sub/b.txt']
+    md5 = {key: digest for _, key, _, digest in to_upload}
+    assert md5['a.txt'] == hashlib.md5(b'a').hexdigest()
+
+def test_unchanged_and_changed_files(tmp_path):
+    make_tree(tmp_path, {'same.txt': b'same', 'edited.txt': b'old'})
+    files = {name: manifest_entry(tmp_path / name) for name in ('same.txt', 'edited.txt')}
+
+    (tmp_path / 'edited.txt').write_bytes(b'new content')
+    make_tree(tmp_path, {'added.txt': b'added'})
+
+    local_keys, to_upload = plan_sync(str(tmp_path), files)
+    assert local_keys == {'same.txt', 'edited.txt', 'added.txt'}
+    assert uploaded_keys(to_upload) == ['added.txt', 'edited.txt']
+
+def test_touched_file_only_refreshes_the_manifest(tmp_path):
+    make_tree(tmp_path, {'touched.txt': b'content'})
+    path = tmp_path / 'touched.txt'
+    files = {'touched.txt': manifest_entry(path)}
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    _, to_upload = plan_sync(str(tmp_path), files)
+    assert to_upload == []
+    assert files['touched.txt']['mtime'] == os.stat(path).st_mtime_ns
+
+def test_full_uploads_unchanged_files(tmp_path):
+    make_tree(tmp_path, {'same.txt': b'same'})
+    files = {'same.txt': manifest_entry(tmp_path / 'same.txt')}
+    _, to_upload = plan_sync(str(tmp_path), files, full=True)
+    assert uploaded_keys(to_upload) == ['same.txt']
+
+def test_compute_etag(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'a' * 10 + b'b' * 10 + b'c' * 5)
+
+    assert compute_etag(str(path)) == hashlib.md5(path.read_bytes()).hexdigest()
+    parts = [b'a' * 10, b'b' * 10, b'c' * 5]
+    expected = hashlib.md5(b''.join(hashlib.md5(part).digest() for part in parts)).hexdigest()
+    assert compute_etag(str(path), part_size=10, parts_count=3) == f"{expected}-3"
+
+def test_resolve_download_path(tmp_path):
+    dest = str(tmp_path)
+    assert resolve_download_path(dest, 'logs/2024/app.log', None) == os.path.join(dest, 'app.log')
+    assert resolve_download_path(dest, 'logs/2024/app.log', 'logs') == os.path.join(dest, '2024', 'app.log')
+    assert resolve_download_path(dest, 'logs/2024/app.log', 'logs/') == os.path.join(dest, '2024', 'app.log')
+
+@pytest.mark.parametrize("key, prefix", [
+    ('logs/../../etc/passwd', 'logs/'),
+    ('../escape.txt', ''),
+    ('a/../../escape.txt', ''),
+])
+def test_resolve_download_path_refuses_traversal(tmp_path, key, prefix):
+    with pytest.raises(Exception, match="Refusing"):
+        resolve_download_path(str(tmp_path), key, prefix)
+
+class RangeClient:
+    """
+    Serves get_object byte ranges of `data` and counts the requests.
+    """
+    def __init__(self, data):
+        self.data = data
+        self.requests = 0
+
+    def get_object(self, Bucket, Key, Range, IfMatch):
+        self.requests += 1
+        start, end = (int(n) for n in Range[len("bytes="):].split('-'))
+        return {'Body': mock.Mock(iter_chunks=lambda size: [self.data[start:end + 1]])}
+
+def download(client, path, data):
+    head = {'ContentLength': len(data), 'ETag': '"etag"'}
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        download_ranged(client, 'bucket', 'key', str(path), head, pool, lambda count: None)
+
+def write_sidecar(path, done):
+    state = {'etag': '"etag"', 'size': 10, 'chunk_size': 4, 'done': done}
+    (path.parent / (path.name + PARTIAL_SUFFIX)).write_text(json.dumps(state))
+
+def test_download_ranged_resumes_missing_ranges(tmp_path, monkeypatch):
+    monkeypatch.setattr(transfer, 'RANGE_CHUNK_SIZE', 4)
+    data = b'abcdefghij'
+    path = tmp_path / 'object'
+    path.write_bytes(b'abcdefgh\0\0')
+    write_sidecar(path, [0, 1])
+
+    client = RangeClient(data)
+    download(client, path, data)
+    assert path.read_bytes() == data
+    assert client.requests == 1
+    assert not (tmp_path / ('object' + PARTIAL_SUFFIX)).exists()
+
+def test_download_ranged_restarts_a_truncated_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(transfer, 'RANGE_CHUNK_SIZE', 4)
+    data = b'abcdefghij'
+    path = tmp_path / 'object'
+    path.write_bytes(b'abc')
+    write_sidecar(path, [0, 1])
+
+    client = RangeClient(data)
+    download(client, path, data)
+    assert path.read_bytes() == data
+    assert client.requests == 3
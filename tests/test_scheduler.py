@@ -0,0 +1,93 @@
+import sys
+import os
+import json
+import time
+import threading
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.scheduler import DagScheduler
+
+STATE_FILE = "test_dag_state.json"
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('AWSCTL_HOME', str(tmp_path))
+    return tmp_path
+
+def recorder(calls, name, result=True):
+    def run():
+        calls.append(name)
+        return result
+    return run
+
+def build(calls, failing=(), **kwargs):
+    scheduler = DagScheduler(state_file=STATE_FILE, **kwargs)
+    scheduler.add('a', recorder(calls, 'a', 'a' not in failing))
+    scheduler.add('b', recorder(calls, 'b', 'b' not in failing), depends_on=['a'])
+    scheduler.add('c', recorder(calls, 'c', 'c' not in failing))
+    return scheduler
+
+def statuses(results):
+    return {name: result['status'] for name, result in results.items()}
+
+def test_dependencies_run_first_and_failures_skip_dependents(state_dir):
+    calls = []
+    results = build(calls, failing=('a',)).run()
+    assert statuses(results) == {'a': 'failed', 'b': 'skipped', 'c': 'done'}
+    assert 'b' not in calls
+
+    state = json.loads((state_dir / STATE_FILE).read_text())
+    assert state['completed'] == ['c']
+
+def test_independent_tasks_run_in_parallel():
+    both_started = threading.Barrier(2, timeout=5)
+    scheduler = DagScheduler()
+    scheduler.add('x', both_started.wait)
+    scheduler.add('y', both_started.wait)
+    assert statuses(scheduler.run()) == {'x': 'done', 'y': 'done'}
+
+def test_exceptions_mark_the_task_failed():
+    def boom():
+        raise RuntimeError("boom")
+    scheduler = DagScheduler()
+    scheduler.add('boom', boom)
+    assert statuses(scheduler.run()) == {'boom': 'failed'}
+
+def test_resume_skips_completed_tasks_and_clears_state(state_dir):
+    build([], failing=('a',)).run()
+
+    calls = []
+    results = build(calls).run()
+    assert statuses(results) == {'a': 'done', 'b': 'done', 'c': 'resumed'}
+    assert sorted(calls) == ['a', 'b']
+    assert not (state_dir / STATE_FILE).exists()
+
+def test_stale_state_is_ignored(state_dir):
+    (state_dir / STATE_FILE).write_text(json.dumps({'started_at': time.time() - 7200, 'completed': ['c']}))
+    calls = []
+    build(calls, max_age=3600).run()
+    assert sorted(calls) == ['a', 'b', 'c']
+
+def test_fresh_ignores_state(state_dir):
+    (state_dir / STATE_FILE).write_text(json.dumps({'started_at': time.time(), 'completed': ['c']}))
+    calls = []
+    build(calls, fresh=True).run()
+    assert sorted(calls) == ['a', 'b', 'c']
+
+@pytest.mark.parametrize("verify, reruns", [
+    (lambda: True, False),
+    (lambda: False, True),
+    (lambda: 1 / 0, True),
+])
+def test_resumed_tasks_are_verified(state_dir, verify, reruns):
+    (state_dir / STATE_FILE).write_text(json.dumps({'started_at': time.time(), 'completed': ['c']}))
+    calls = []
+    scheduler = DagScheduler(state_file=STATE_FILE)
+    scheduler.add('a', recorder(calls, 'a', False))
+    scheduler.add('c', recorder(calls, 'c'), verify=verify)
+
+    results = scheduler.run()
+    assert ('c' in calls) == reruns
+    assert results['c']['status'] == ('done' if reruns else 'resumed')
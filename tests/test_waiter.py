@@ -0,0 +1,66 @@
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.waiter import wait_until
+
+class FakeService:
+    """
+    Returns a scripted state per poll round and records which IDs each poll asked for.
+    """
+    def __init__(self, script):
+        self.script = script
+        self.requests = []
+
+    def poll(self, pending_ids):
+        self.requests.append(list(pending_ids))
+        round_states = self.script[min(len(self.requests), len(self.script)) - 1]
+        return {resource_id: round_states.get(resource_id) for resource_id in pending_ids}
+
+def test_ready_failed_and_batched_polls():
+    service = FakeService([
+        {'i-1': 'pending', 'i-2': 'pending', 'i-3': 'pending'},
+        {'i-1': 'running', 'i-2': 'pending', 'i-3': 'terminated'},
+        {'i-2': 'running'},
+    ])
+    changes = []
+    result = wait_until(
+        ['i-1', 'i-2', 'i-3'], service.poll,
+        is_ready=lambda state: state == 'running',
+        is_failed=lambda state: state == 'terminated',
+        on_change=lambda resource_id, old, new: changes.append((resource_id, old, new)),
+        timeout=5, min_delay=0.001, max_delay=0.001
+    )
+
+    assert set(result.ready) == {'i-1', 'i-2'}
+    assert result.failed == {'i-3': 'terminated'}
+    assert not result.pending and not result.cancelled and not result.succeeded
+    assert result.polls == 3
+    # One shared poll per round, only for the resources still pending
+    assert service.requests == [['i-1', 'i-2', 'i-3'], ['i-1', 'i-2', 'i-3'], ['i-2']]
+    assert ('i-1', 'pending', 'running') in changes
+
+def test_missing_ids_map_to_none():
+    service = FakeService([{}])
+    result = wait_until(['gone'], service.poll, is_ready=lambda state: state is None, timeout=5)
+    assert result.succeeded and result.polls == 1
+
+def test_deadline_leaves_resources_pending():
+    service = FakeService([{'i-1': 'pending'}])
+    result = wait_until(['i-1'], service.poll, is_ready=lambda state: state == 'running',
+                        timeout=0.05, min_delay=0.01, max_delay=0.02)
+    assert result.pending == {'i-1'}
+    assert not result.succeeded and not result.cancelled
+    assert result.polls >= 2
+
+def test_cancel_event_stops_the_wait():
+    cancel = threading.Event()
+
+    def poll(pending_ids):
+        cancel.set()
+        return {}
+
+    result = wait_until(['i-1'], poll, is_ready=lambda state: False, timeout=30, cancel_event=cancel)
+    assert result.cancelled and result.pending == {'i-1'} and result.polls == 1